@@ -58,8 +58,8 @@ install_binary() {
     # Create wrapper script
     WRAPPER="$BIN_DIR/zmqanalyzer"
     echo "#!/bin/bash" > "$WRAPPER"
-    echo "cd \"$PROJECT_ROOT\"" >> "$WRAPPER"
-    echo "python3 zmq_analyzer.py \"\$@\"" >> "$WRAPPER"
+    # Run from the caller's directory so relative paths (e.g. --out capture.bin) resolve there
+    echo "python3 \"$PROJECT_ROOT/zmq_analyzer.py\" \"\$@\"" >> "$WRAPPER"
     
     # Set appropriate permissions
     chmod 755 "$WRAPPER"
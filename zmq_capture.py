@@ -0,0 +1,473 @@
+import bisect
+import collections
+import concurrent.futures
+import json
+import lzma
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+# Capture file layout:
+#   CAPTURE_MAGIC, HEADER_LENGTH, JSON header {"version", "created_ns", "sockets": [names], "compression", "block_size"}
+#   then one record per message: RECORD_HEADER followed by each frame as FRAME_LENGTH + bytes.
+# The sidecar index (capture path + INDEX_SUFFIX) is INDEX_MAGIC followed by one INDEX_ENTRY per record.
+# Compressed captures store the same record stream as a series of blocks (BLOCK_HEADER + compressed
+# bytes, never splitting a record); index offsets then refer to the uncompressed stream, as if the
+# records followed the header directly. The block index (path + BLOCK_INDEX_SUFFIX) is
+# BLOCK_INDEX_MAGIC followed by one BLOCK_ENTRY per block.
+CAPTURE_MAGIC = b"ZMQACAP2"
+CAPTURE_VERSION = 2  # 1: uncompressed only
+HEADER_LENGTH = struct.Struct("<I")  # Length of the JSON header that follows
+RECORD_HEADER = struct.Struct("<qHI")  # Receive time (ns since epoch), socket id, frame count
+FRAME_LENGTH = struct.Struct("<I")  # Frame length, followed by the frame bytes
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"ZMQAIDX1"
+INDEX_ENTRY = struct.Struct("<QqII")  # Record offset, receive time (ns), socket id, crc32 of the first frame (topic/group/peer)
+BLOCK_HEADER = struct.Struct("<II")  # Compressed length, uncompressed length
+BLOCK_INDEX_SUFFIX = ".blk"
+BLOCK_INDEX_MAGIC = b"ZMQABLK1"
+BLOCK_ENTRY = struct.Struct("<QQ")  # Block file offset, uncompressed offset of its first record
+DEFAULT_BLOCK_SIZE = 1 << 20  # Uncompressed bytes per block
+
+# Block codecs: name -> (compress(data, level), decompress(data), default level)
+CODECS = {
+    "zlib": (lambda data, level: zlib.compress(data, level), zlib.decompress, 6),
+    "lzma": (lambda data, level: lzma.compress(data, preset=level), lzma.decompress, 1),  # Presets above 1 are too slow to keep up
+}
+
+
+def stream_key(frame):
+    """Index key for a record's first frame (topic, group or peer identity)."""
+    return zlib.crc32(frame)
+
+
+class CaptureWriter:
+    """Engine sink that appends every received message to a capture file and its sidecar index.
+
+    write_batch() only queues the batch, so the reactor thread never touches the disk; a
+    dedicated writer thread serializes whatever has queued up and writes it with one call per
+    file. When the queue is full (disk slower than the traffic) batches are dropped and counted.
+
+    With compression ("zlib" or "lzma") records are collected into blocks of block_size bytes
+    that are compressed on a thread pool (both codecs release the GIL) and written in order as
+    they complete, so compression runs in parallel and does not hold up the writer thread.
+    """
+
+    MAX_PENDING_BATCHES = 10000  # Queued batches before new ones are dropped
+    WRITE_BATCHES = 256  # Batches serialized per write() call at most
+    FLUSH_SEC = 1.0  # A partly filled block is compressed and written after this long without traffic
+
+    def __init__(self, path, sockets, compression=None, block_size=DEFAULT_BLOCK_SIZE, level=None):
+        if compression and compression not in CODECS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.path = path
+        self.sockets = list(sockets)
+        self.socket_ids = {name: socket_id for socket_id, name in enumerate(self.sockets)}
+        self.compression = compression or None
+        self.block_size = max(1024, int(block_size))
+        self.messages_written = 0
+        self.bytes_written = 0  # Uncompressed record bytes
+        self.dropped = 0  # Messages lost because the queue was full
+        self.queue = queue.Queue(self.MAX_PENDING_BATCHES)
+        self.closed = False
+
+        header_fields = {"version": CAPTURE_VERSION, "created_ns": time.time_ns(), "sockets": self.sockets}
+        if self.compression:
+            header_fields.update(compression=self.compression, block_size=self.block_size)
+        header = json.dumps(header_fields).encode("utf-8")
+        self.file = open(path, "wb", buffering=0)
+        self.index_file = open(path + INDEX_SUFFIX, "wb", buffering=0)
+        self.block_index_file = None
+        try:
+            self.file.write(CAPTURE_MAGIC + HEADER_LENGTH.pack(len(header)) + header)
+            self.index_file.write(INDEX_MAGIC)
+            if self.compression:
+                self.block_index_file = open(path + BLOCK_INDEX_SUFFIX, "wb", buffering=0)
+                self.block_index_file.write(BLOCK_INDEX_MAGIC)
+        except OSError:
+            self._close_files()
+            raise
+        self.offset = len(CAPTURE_MAGIC) + HEADER_LENGTH.size + len(header)
+        self.file_offset = self.offset  # Where the next block goes (compressed captures)
+
+        if self.compression:
+            compress, _, default_level = CODECS[self.compression]
+            level = default_level if level is None else level
+            self.compress = lambda data: compress(data, level)
+            self.workers = min(4, os.cpu_count() or 1)
+            self.pool = concurrent.futures.ThreadPoolExecutor(self.workers, thread_name_prefix="capture-compress")
+            self.block_chunks = []  # Serialized records of the block being filled
+            self.block_entries = []  # Their index entries, written once the block is on disk
+            self.block_start = self.offset
+            self.pending_blocks = collections.deque()  # (future, uncompressed length, block start, index entries) in file order
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write_batch(self, source, recv_time, messages):
+        socket_id = self.socket_ids.get(source)
+        if socket_id is None or self.closed:
+            return
+        try:
+            self.queue.put_nowait((socket_id, int(recv_time * 1e9), messages))
+        except queue.Full:
+            self.dropped += len(messages)
+
+    def _run(self):
+        running = True
+        while running:
+            try:
+                batches = [self.queue.get(timeout=self.FLUSH_SEC if self.compression else None)]
+            except queue.Empty:
+                self._flush_block()  # Traffic paused: don't keep a partial block in memory indefinitely
+                continue
+            # Take whatever else is waiting so it goes out in the same write
+            while len(batches) < self.WRITE_BATCHES:
+                try:
+                    batches.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batches:
+                # close() was called; a write_batch() racing with it may have queued more behind the sentinel
+                batches = batches[: batches.index(None)]
+                running = False
+            try:
+                self._write(batches)
+                if not running:
+                    self._flush_block()
+                    self._write_blocks(wait_all=True)
+            except (OSError, ValueError) as e:
+                print(f"Capture write error ({self.path}): {e}")
+                self.closed = True  # Stop queuing batches nobody will write
+                running = False
+        if self.compression:
+            self.pool.shutdown(wait=True)
+        self._close_files()
+
+    def _close_files(self):
+        for file in (self.file, self.index_file, self.block_index_file):
+            if file:
+                file.close()
+
+    def _write(self, batches):
+        chunks = []
+        index_entries = []
+        offset = self.offset
+        count = 0
+        for socket_id, ts_ns, messages in batches:
+            for frames in messages:
+                index_entries.append(INDEX_ENTRY.pack(offset, ts_ns, socket_id, stream_key(frames[0]) if frames else 0))
+                chunks.append(RECORD_HEADER.pack(ts_ns, socket_id, len(frames)))
+                offset += RECORD_HEADER.size
+                for frame in frames:
+                    chunks.append(FRAME_LENGTH.pack(len(frame)))
+                    chunks.append(frame)
+                    offset += FRAME_LENGTH.size + len(frame)
+                count += 1
+        if not count:
+            return
+        self.bytes_written += offset - self.offset
+        self.offset = offset
+        self.messages_written += count
+        if not self.compression:
+            self.file.write(b"".join(chunks))
+            self.index_file.write(b"".join(index_entries))
+            return
+        self.block_chunks += chunks
+        self.block_entries += index_entries
+        if self.offset - self.block_start >= self.block_size:
+            self._flush_block()
+        self._write_blocks()
+
+    def _flush_block(self):
+        """Hand the block being filled to the compression pool."""
+        if not self.compression or not self.block_chunks:
+            return
+        data = b"".join(self.block_chunks)
+        self.pending_blocks.append((self.pool.submit(self.compress, data), len(data), self.block_start, self.block_entries))
+        self.block_chunks = []
+        self.block_entries = []
+        self.block_start = self.offset
+
+    def _write_blocks(self, wait_all=False):
+        """Write compressed blocks that are done, in order. Waits for the oldest one when more than
+        two per worker are in flight (or for all with wait_all), which bounds memory use."""
+        if not self.compression:
+            return
+        while self.pending_blocks:
+            future, length, block_start, entries = self.pending_blocks[0]
+            if not future.done() and not wait_all and len(self.pending_blocks) <= 2 * self.workers:
+                break
+            data = future.result()
+            self.pending_blocks.popleft()
+            self.file.write(BLOCK_HEADER.pack(len(data), length) + data)
+            self.block_index_file.write(BLOCK_ENTRY.pack(self.file_offset, block_start))
+            self.index_file.write(b"".join(entries))
+            self.file_offset += BLOCK_HEADER.size + len(data)
+
+    def get_stats(self):
+        return {
+            "messages": self.messages_written,
+            "bytes": self.bytes_written,
+            "stored_bytes": self.file_offset if self.compression else self.offset,
+            "dropped": self.dropped,
+            "pending": self.queue.qsize(),
+        }
+
+    def close(self):
+        """Flush everything queued so far and close the files."""
+        if self.closed and not self.thread.is_alive():
+            return
+        self.closed = True
+        # The thread may have stopped on a write error with the queue full; don't wait on it then
+        while self.thread.is_alive():
+            try:
+                self.queue.put(None, timeout=0.5)
+                break
+            except queue.Full:
+                pass
+        self.thread.join()
+
+
+class _IndexTimes:
+    """Sequence view of the index's receive times, for bisect."""
+
+    def __init__(self, reader):
+        self.reader = reader
+
+    def __len__(self):
+        return len(self.reader)
+
+    def __getitem__(self, index):
+        return self.reader.entry(index)[1]
+
+
+class CaptureReader:
+    """Random access to a capture through memory maps of the capture file and its index.
+
+    Opening costs the same for any file size: records are located through the index and only
+    the pages actually touched are read by the OS. Without a usable index (e.g. a capture
+    copied without its .idx) the capture is scanned once to rebuild it in memory.
+
+    In compressed captures a record is read by decompressing the block that holds it; the most
+    recently used blocks are kept, so sequential reads decompress each block once.
+    """
+
+    SEARCH_CHUNK = 65536  # Index entries unpacked per step when searching for a stream
+    BLOCK_CACHE_SIZE = 16  # Decompressed blocks kept
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self.file.close()
+            raise ValueError(f"{path} is not a ZmqAnalyzer capture")
+        self.index_file = None
+        self.index = None
+        self.block_cache = collections.OrderedDict()  # Block number -> decompressed bytes, least recently used first
+        try:
+            if self.data[: len(CAPTURE_MAGIC)] != CAPTURE_MAGIC:
+                raise ValueError(f"{path} is not a ZmqAnalyzer capture")
+            header_start = len(CAPTURE_MAGIC) + HEADER_LENGTH.size
+            (header_length,) = HEADER_LENGTH.unpack_from(self.data, len(CAPTURE_MAGIC))
+            self.header = json.loads(self.data[header_start : header_start + header_length])
+            self.sockets = self.header.get("sockets", [])
+            self.data_start = header_start + header_length
+            self.compression = self.header.get("compression")
+            if self.compression:
+                if self.compression not in CODECS:
+                    raise ValueError(f"Unsupported capture compression: {self.compression}")
+                self.decompress = CODECS[self.compression][1]
+                self._open_block_index()
+            else:
+                self.data_end = len(self.data)  # End of the record stream
+            self._open_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _open_block_index(self):
+        """Load block file offsets and uncompressed starts from the block index (or the block headers)."""
+        entries = None
+        try:
+            with open(self.path + BLOCK_INDEX_SUFFIX, "rb") as block_index_file:
+                block_index = block_index_file.read()
+            if block_index[: len(BLOCK_INDEX_MAGIC)] == BLOCK_INDEX_MAGIC:
+                usable = (len(block_index) - len(BLOCK_INDEX_MAGIC)) // BLOCK_ENTRY.size * BLOCK_ENTRY.size
+                entries = list(BLOCK_ENTRY.iter_unpack(memoryview(block_index)[len(BLOCK_INDEX_MAGIC) : len(BLOCK_INDEX_MAGIC) + usable]))
+        except OSError:
+            pass
+        if entries is None:
+            print(f"Capture block index unusable; rebuilding from {self.path}")
+            entries = self._scan_blocks()
+        # Blocks are indexed after they are written, but drop any that are incomplete anyway
+        while entries:
+            offset = entries[-1][0]
+            if offset + BLOCK_HEADER.size <= len(self.data):
+                compressed_length, length = BLOCK_HEADER.unpack_from(self.data, offset)
+                if offset + BLOCK_HEADER.size + compressed_length <= len(self.data):
+                    break
+            entries.pop()
+        self.block_offsets = [offset for offset, _ in entries]
+        self.block_starts = [start for _, start in entries]
+        self.data_end = entries[-1][1] + length if entries else self.data_start  # End of the record stream
+
+    def _scan_blocks(self):
+        """(file offset, uncompressed start) of every block, by following the block headers."""
+        entries = []
+        offset = self.data_start
+        start = self.data_start
+        while offset + BLOCK_HEADER.size <= len(self.data):
+            compressed_length, length = BLOCK_HEADER.unpack_from(self.data, offset)
+            entries.append((offset, start))
+            offset += BLOCK_HEADER.size + compressed_length
+            start += length
+        return entries
+
+    def _block(self, block_number):
+        """Decompressed contents of a block, through the LRU cache."""
+        data = self.block_cache.get(block_number)
+        if data is not None:
+            self.block_cache.move_to_end(block_number)
+            return data
+        data = self._read_block(block_number)
+        self.block_cache[block_number] = data
+        if len(self.block_cache) > self.BLOCK_CACHE_SIZE:
+            self.block_cache.popitem(last=False)
+        return data
+
+    def _read_block(self, block_number):
+        offset = self.block_offsets[block_number]
+        compressed_length, _ = BLOCK_HEADER.unpack_from(self.data, offset)
+        return self.decompress(self.data[offset + BLOCK_HEADER.size : offset + BLOCK_HEADER.size + compressed_length])
+
+    def _locate(self, offset):
+        """(buffer, position) holding the record at stream offset."""
+        if not self.compression:
+            return self.data, offset
+        block_number = bisect.bisect_right(self.block_starts, offset) - 1
+        return self._block(block_number), offset - self.block_starts[block_number]
+
+    def _open_index(self):
+        try:
+            self.index_file = open(self.path + INDEX_SUFFIX, "rb")
+            self.index = mmap.mmap(self.index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.index[: len(INDEX_MAGIC)] != INDEX_MAGIC:
+                raise ValueError("bad index magic")
+        except (OSError, ValueError) as e:
+            print(f"Capture index unusable ({e}); rebuilding from {self.path}")
+            self.close_index()
+            self.index = self._scan_index()
+        self.count = (len(self.index) - len(INDEX_MAGIC)) // INDEX_ENTRY.size
+        # Entries are written after their records, but drop any that point past the data anyway
+        while self.count and self.entry(self.count - 1)[0] + RECORD_HEADER.size > self.data_end:
+            self.count -= 1
+
+    def _scan_index(self):
+        """Build index entries in memory by walking every record of the capture."""
+        index = bytearray(INDEX_MAGIC)
+        if not self.compression:
+            self._scan_records(index, self.data, self.data_start, len(self.data), 0)
+        for block_number, start in enumerate(self.block_starts if self.compression else []):
+            data = self._read_block(block_number)
+            self._scan_records(index, data, 0, len(data), start)
+        return index
+
+    def _scan_records(self, index, data, offset, end, base):
+        """Append index entries for the records in data[offset:end]; base maps positions to stream offsets."""
+        while offset + RECORD_HEADER.size <= end:
+            ts_ns, socket_id, num_frames = RECORD_HEADER.unpack_from(data, offset)
+            position = offset + RECORD_HEADER.size
+            key = 0
+            for frame_number in range(num_frames):
+                if position + FRAME_LENGTH.size > end:
+                    return
+                (length,) = FRAME_LENGTH.unpack_from(data, position)
+                position += FRAME_LENGTH.size
+                if frame_number == 0:
+                    key = stream_key(data[position : position + length])
+                position += length
+            if position > end:
+                return  # Truncated last record
+            index += INDEX_ENTRY.pack(base + offset, ts_ns, socket_id, key)
+            offset = position
+
+    def __len__(self):
+        return self.count
+
+    def entry(self, index):
+        """(record offset, receive time ns, socket id, stream key) of record index."""
+        return INDEX_ENTRY.unpack_from(self.index, len(INDEX_MAGIC) + index * INDEX_ENTRY.size)
+
+    def socket_name(self, socket_id):
+        return self.sockets[socket_id] if socket_id < len(self.sockets) else f"#{socket_id}"
+
+    def record(self, index):
+        """Return (receive time ns, socket name, [frames]) of record index."""
+        data, position = self._locate(self.entry(index)[0])
+        ts_ns, socket_id, num_frames = RECORD_HEADER.unpack_from(data, position)
+        position += RECORD_HEADER.size
+        frames = []
+        for _ in range(num_frames):
+            (length,) = FRAME_LENGTH.unpack_from(data, position)
+            position += FRAME_LENGTH.size
+            frames.append(data[position : position + length])
+            position += length
+        return ts_ns, self.socket_name(socket_id), frames
+
+    def find_time(self, ts_ns):
+        """Index of the first record received at or after ts_ns (len(self) if none)."""
+        return bisect.bisect_left(_IndexTimes(self), ts_ns)
+
+    def find_stream(self, first_frame, start, forward=True):
+        """Index of the next (or previous) record after/before start whose first frame is
+        first_frame (a topic, group or peer identity), or None."""
+        key = stream_key(first_frame)
+        step = self.SEARCH_CHUNK
+        if forward:
+            position = start + 1
+            while position < self.count:
+                stop = min(position + step, self.count)
+                chunk = memoryview(self.index)[len(INDEX_MAGIC) + position * INDEX_ENTRY.size : len(INDEX_MAGIC) + stop * INDEX_ENTRY.size]
+                for offset, (_, _, _, entry_key) in enumerate(INDEX_ENTRY.iter_unpack(chunk)):
+                    if entry_key == key and self._first_frame(position + offset) == first_frame:
+                        return position + offset
+                position = stop
+        else:
+            position = min(start, self.count)
+            while position > 0:
+                begin = max(position - step, 0)
+                chunk = memoryview(self.index)[len(INDEX_MAGIC) + begin * INDEX_ENTRY.size : len(INDEX_MAGIC) + position * INDEX_ENTRY.size]
+                entries = list(INDEX_ENTRY.iter_unpack(chunk))
+                for offset in range(len(entries) - 1, -1, -1):
+                    if entries[offset][3] == key and self._first_frame(begin + offset) == first_frame:
+                        return begin + offset
+                position = begin
+        return None
+
+    def _first_frame(self, index):
+        """First frame of record index (CRC-32 keys can collide, so matches are confirmed)."""
+        frames = self.record(index)[2]
+        return frames[0] if frames else b""
+
+    def close_index(self):
+        if isinstance(self.index, mmap.mmap):
+            self.index.close()
+        self.index = None
+        if self.index_file:
+            self.index_file.close()
+            self.index_file = None
+
+    def close(self):
+        self.close_index()
+        self.block_cache.clear()
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+        self.file.close()
@@ -0,0 +1,164 @@
+import argparse
+import sqlite3
+import sys
+import time
+
+from zmq_capture import CODECS, DEFAULT_BLOCK_SIZE, CaptureWriter
+from zmq_store import SqliteSink
+from zmq_engine import DEFAULT_RECV_BATCH_SIZE, Dish, Gather, Puller, Reactor, Subscriber, format_bytes, format_speed
+
+COMMANDS = ("sub", "pull", "dish", "gather")
+SOURCE_NAMES = {"sub": "Subscriber", "pull": "Puller", "dish": "Dish", "gather": "Gather"}  # Engine source names in captures
+
+
+def _split_list(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+ENGINES = {"sub": Subscriber, "pull": Puller, "dish": Dish, "gather": Gather}
+
+
+def _start_engine(engine, args):
+    """Start engine for the chosen subcommand. Returns (success, message)."""
+    success, message = engine.set_sequence_source(args.seq or "")
+    if not success:
+        return success, message
+
+    if args.command == "sub":
+        topics = _split_list(args.topics) or [""]  # Empty topic subscribes to everything
+        success, message = engine.start(topics, args.address, args.batch_size)
+    elif args.command == "dish":
+        success, message = engine.start(_split_list(args.groups), args.address, args.batch_size)
+    else:
+        success, message = engine.start(args.address, args.batch_size)
+    return success, message
+
+
+def _format_sequence(engine):
+    """Sequence counters summary, or an empty string when tracking is off."""
+    totals = engine.get_sequence_totals()
+    if not totals:
+        return ""
+    return f" | lost {totals['lost']}, out-of-order {totals['out_of_order']}, duplicates {totals['duplicates']}, resets {totals['resets']}"
+
+
+def _read_totals(engine):
+    """Cumulative (messages, bytes) received by engine."""
+    stats = engine.get_instant_totals() if isinstance(engine, Subscriber) else engine.get_stats()
+    return stats["count"], stats["bytes"]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="zmqanalyzer",
+        description="Headless capture mode. Run without arguments to open the GUI.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sub = subparsers.add_parser("sub", help="Subscribe to a PUB/XPUB socket")
+    sub.add_argument("--topics", default="", help="Comma-separated topic prefixes (default: all)")
+    pull = subparsers.add_parser("pull", help="Pull from a PUSH socket")
+    dish = subparsers.add_parser("dish", help="Receive from a RADIO socket (draft API)")
+    dish.add_argument("--groups", required=True, help="Comma-separated groups to join")
+    gather = subparsers.add_parser("gather", help="Gather from a SCATTER socket (draft API)")
+
+    for command in (sub, pull, dish, gather):
+        command.add_argument("address", help="Endpoint to connect to, e.g. tcp://localhost:5556")
+        command.add_argument("--out", help="Record received messages to this capture file (plus a .idx index)")
+        command.add_argument("--db", help="Store received messages in this SQLite database (searchable from the GUI)")
+        command.add_argument("--compress", choices=sorted(CODECS), help="Compress the capture in blocks with this codec")
+        command.add_argument(
+            "--block-size",
+            type=int,
+            default=DEFAULT_BLOCK_SIZE // 1024,
+            help=f"Uncompressed KiB per compressed block (default: {DEFAULT_BLOCK_SIZE // 1024})",
+        )
+        command.add_argument("--interval", type=float, default=1.0, help="Seconds between throughput reports (default: 1)")
+        command.add_argument("--duration", type=float, help="Stop after this many seconds")
+        command.add_argument("--count", type=int, help="Stop after this many messages")
+        command.add_argument("--batch-size", type=int, default=DEFAULT_RECV_BATCH_SIZE, help="Max messages drained per wake-up")
+        command.add_argument("--seq", help="Count lost/out-of-order/duplicate messages using frame:N or json:field.path")
+    return parser
+
+
+def run_capture(args):
+    sink = store = None
+    if args.out:
+        try:
+            sink = CaptureWriter(args.out, [SOURCE_NAMES[args.command]], compression=args.compress, block_size=args.block_size * 1024)
+        except OSError as e:
+            print(f"Cannot open capture file: {e}", file=sys.stderr)
+            return 1
+    if args.db:
+        try:
+            store = SqliteSink(args.db)
+        except sqlite3.Error as e:
+            print(f"Cannot open database: {e}", file=sys.stderr)
+            if sink:
+                sink.close()
+            return 1
+    sinks = [each_sink for each_sink in (sink, store) if each_sink]
+
+    # Attach the sinks first so the messages received right after start() are recorded too
+    engine = ENGINES[args.command]()
+    for each_sink in sinks:
+        engine.add_sink(each_sink)
+    success, message = _start_engine(engine, args)
+    if not success:
+        print(message, file=sys.stderr)
+        Reactor().shutdown()
+        for each_sink in sinks:
+            engine.remove_sink(each_sink)
+            each_sink.close()
+        return 1
+
+    start_time = time.time()
+    last_time, last_count, last_bytes = start_time, 0, 0
+    try:
+        while True:
+            time.sleep(args.interval)
+            now = time.time()
+            count, total_bytes = _read_totals(engine)
+            span = max(now - last_time, 1e-6)
+            print(
+                f"[{now - start_time:8.1f}s] {count} msgs, {format_bytes(total_bytes)} | "
+                f"{(count - last_count) / span:.1f} msg/s, {format_speed((total_bytes - last_bytes) / span)}{_format_sequence(engine)}",
+                flush=True,
+            )
+            last_time, last_count, last_bytes = now, count, total_bytes
+            if args.duration is not None and now - start_time >= args.duration:
+                break
+            if args.count is not None and count >= args.count:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.stop()
+        Reactor().shutdown()
+        for each_sink in sinks:
+            engine.remove_sink(each_sink)
+            each_sink.close()
+
+    elapsed = max(time.time() - start_time, 1e-6)
+    count, total_bytes = _read_totals(engine)
+    print(f"Received {count} msgs, {format_bytes(total_bytes)} in {elapsed:.1f}s ({count / elapsed:.1f} msg/s){_format_sequence(engine)}")
+    if sink:
+        capture_stats = sink.get_stats()
+        print(f"Capture written to {args.out}: {capture_stats['messages']} msgs, {format_bytes(capture_stats['bytes'])}", end="")
+        if args.compress:
+            print(f" ({format_bytes(capture_stats['stored_bytes'])} compressed)", end="")
+        print(f" ({capture_stats['dropped']} dropped, writer too slow)" if capture_stats["dropped"] else "")
+    if store:
+        store_stats = store.get_stats()
+        print(f"Stored {store_stats['messages']} msgs in {args.db}", end="")
+        print(f" ({store_stats['dropped']} dropped, database too slow)" if store_stats["dropped"] else "")
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return run_capture(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
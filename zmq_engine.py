@@ -0,0 +1,4149 @@
+import collections
+import functools
+import json
+import os
+import queue
+import random
+import re
+import struct
+import threading
+import time
+import zmq
+
+from zmq_capture import CaptureReader
+
+# Constants
+CONFIG_FILE = os.path.expanduser("~/.zmqanalyzer-config.json")
+CONFIG_PUBLISHER_PORT_KEY = "publisher_port"
+CONFIG_PUBLISHER_TOPIC_KEY = "publisher_last_topic"
+CONFIG_SUBSCRIBER_TOPICS_KEY = "subscriber_last_topic"
+CONFIG_SUBSCRIBER_ADDRESS_KEY = "subscriber_address"
+CONFIG_REQUESTER_ADDRESS_KEY = "requester_address"
+CONFIG_REPLYER_ADDRESS_KEY = "replyer_address"
+CONFIG_RECENT_SENT_MSGS_PUB_KEY = "publisher_recent_messages"
+CONFIG_RECENT_SENT_MSGS_REQ_KEY = "requester_recent_messages"
+CONFIG_RECENT_SENT_MSGS_REP_KEY = "replyer_recent_messages"
+# PUSH/PULL pattern
+CONFIG_PUSHER_PORT_KEY = "pusher_port"
+CONFIG_PULLER_ADDRESS_KEY = "puller_address"
+CONFIG_RECENT_SENT_MSGS_PUSH_KEY = "pusher_recent_messages"
+CONFIG_PULLER_BUFFER_SIZE_KEY = "puller_buffer_size"
+# DEALER/ROUTER pattern
+CONFIG_DEALER_ADDRESS_KEY = "dealer_address"
+CONFIG_ROUTER_PORT_KEY = "router_port"
+CONFIG_ROUTER_RULES_KEY = "router_auto_reply_rules"
+CONFIG_ROUTER_PEER_IDLE_KEY = "router_peer_idle_sec"
+CONFIG_RECENT_SENT_MSGS_DEALER_KEY = "dealer_recent_messages"
+CONFIG_DEALER_WINDOW_KEY = "dealer_window"
+CONFIG_DEALER_TIMEOUT_KEY = "dealer_timeout_ms"
+CONFIG_RECENT_SENT_MSGS_ROUTER_KEY = "router_recent_messages"
+# PAIR pattern
+CONFIG_PAIR_ADDRESS_KEY = "pair_address"
+CONFIG_PAIR_MODE_KEY = "pair_mode"
+CONFIG_RECENT_SENT_MSGS_PAIR_KEY = "pair_recent_messages"
+# XPUB/XSUB pattern (broker/proxy)
+CONFIG_XPUB_PORT_KEY = "xpub_port"
+CONFIG_XSUB_ADDRESS_KEY = "xsub_address"
+CONFIG_RECENT_SENT_MSGS_XPUB_KEY = "xpub_recent_messages"
+# STREAM pattern (raw TCP)
+CONFIG_STREAM_ADDRESS_KEY = "stream_address"
+CONFIG_STREAM_MODE_KEY = "stream_mode"
+CONFIG_RECENT_SENT_MSGS_STREAM_KEY = "stream_recent_messages"
+# CLIENT/SERVER pattern (draft)
+CONFIG_CLIENT_ADDRESS_KEY = "client_address"
+CONFIG_SERVER_PORT_KEY = "server_port"
+CONFIG_RECENT_SENT_MSGS_CLIENT_KEY = "client_recent_messages"
+CONFIG_RECENT_SENT_MSGS_SERVER_KEY = "server_recent_messages"
+# RADIO/DISH pattern (draft)
+CONFIG_RADIO_PORT_KEY = "radio_port"
+CONFIG_RADIO_GROUP_KEY = "radio_group"
+CONFIG_DISH_ADDRESS_KEY = "dish_address"
+CONFIG_DISH_GROUP_KEY = "dish_group"
+CONFIG_RECENT_SENT_MSGS_RADIO_KEY = "radio_recent_messages"
+CONFIG_DISH_BUFFER_SIZE_KEY = "dish_buffer_size"
+# SCATTER/GATHER pattern (draft)
+CONFIG_SCATTER_PORT_KEY = "scatter_port"
+CONFIG_GATHER_ADDRESS_KEY = "gather_address"
+CONFIG_RECENT_SENT_MSGS_SCATTER_KEY = "scatter_recent_messages"
+CONFIG_GATHER_BUFFER_SIZE_KEY = "gather_buffer_size"
+# Sequence tracking source per receiver tab ("frame:N" or "json:path")
+CONFIG_SUBSCRIBER_SEQUENCE_KEY = "subscriber_sequence_source"
+CONFIG_PULLER_SEQUENCE_KEY = "puller_sequence_source"
+CONFIG_DISH_SEQUENCE_KEY = "dish_sequence_source"
+CONFIG_GATHER_SEQUENCE_KEY = "gather_sequence_source"
+# Recording
+CONFIG_CAPTURE_DIR_KEY = "capture_directory"
+CONFIG_CAPTURE_COMPRESSION_KEY = "capture_compression"  # "", "zlib" or "lzma"
+CONFIG_CAPTURE_BLOCK_SIZE_KEY = "capture_block_size"  # Uncompressed bytes per compressed block
+# Load generator (Publish tab)
+CONFIG_LOADGEN_RATE_KEY = "loadgen_rate"
+CONFIG_LOADGEN_TOPICS_KEY = "loadgen_topics"
+CONFIG_LOADGEN_PAYLOAD_SIZE_KEY = "loadgen_payload_size"
+# Capture replay
+CONFIG_BENCH_CONNECTIONS_KEY = "bench_connections"
+CONFIG_BENCH_SOCKET_TYPE_KEY = "bench_socket_type"  # "REQ" or "DEALER"
+CONFIG_BENCH_DURATION_KEY = "bench_duration"
+
+CONFIG_REPLAY_TARGET_KEY = "replay_target"
+CONFIG_REPLAY_SPEED_KEY = "replay_speed"
+DEFAULT_REPLAY_GROUP = "replay"  # RADIO group for replayed messages that were captured without one
+# Latency stamping: optional trailing frame LATENCY_MAGIC, uint64 sequence, uint64 send time (ns since epoch), little-endian
+LATENCY_MAGIC = b"ZMQA"
+LATENCY_HEADER = struct.Struct("<4sQQ")
+# Receive tuning
+CONFIG_RECV_BATCH_SIZE_KEY = "recv_batch_size"
+DEFAULT_RECV_BATCH_SIZE = 256  # Max messages drained per reactor wake-up
+# Display tuning
+CONFIG_DISPLAY_MAX_CHARS_KEY = "display_max_chars"
+DEFAULT_DISPLAY_MAX_CHARS = 200000  # Max characters kept in streaming text displays
+
+
+# --- Config Class ---
+class Config:
+    _config = {}
+
+    @staticmethod
+    def load():
+        if os.path.exists(CONFIG_FILE):
+            try:
+                with open(CONFIG_FILE, "r") as f:
+                    Config._config = json.load(f)
+                print(f"Config loaded from {CONFIG_FILE}")
+            except Exception as e:
+                print(f"Failed to load config: {e}")
+                Config._config = {}
+        else:
+            Config._config = {}
+
+    @staticmethod
+    def save():
+        try:
+            with open(CONFIG_FILE, "w") as f:
+                json.dump(Config._config, f, indent=4)
+        except Exception as e:
+            print(f"Failed to save config: {e}")
+
+    @staticmethod
+    def get(key, default=None):
+        return Config._config.get(key, default)
+
+    @staticmethod
+    def set(key, value):
+        Config._config[key] = value
+        Config.save()
+
+    @staticmethod
+    def add_to_list(key, value):
+        if key not in Config._config:
+            Config._config[key] = []
+        if value not in Config._config[key]:
+            Config._config[key].insert(0, value)  # Add to front
+            Config.save()
+
+    @staticmethod
+    def remove_from_list(key, value):
+        if key in Config._config and value in Config._config[key]:
+            Config._config[key].remove(value)
+            Config.save()
+
+    @staticmethod
+    def get_list(key):
+        return Config._config.get(key, [])
+
+
+# --- Callback Dispatch ---
+
+
+class DirectDispatcher:
+    """Run callbacks immediately in the engine thread that raised them (headless default)."""
+
+    def __call__(self, fn, *args):
+        fn(*args)
+
+
+class ThreadDispatcher:
+    """Run callbacks in order on a dedicated worker thread, so slow callbacks never stall the reactor."""
+
+    def __init__(self, name="ZmqCallbacks"):
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def __call__(self, fn, *args):
+        self.queue.put((fn, args))
+
+    def stop(self):
+        """Finish the callbacks already queued, then stop the worker thread."""
+        self.queue.put(None)
+        self.thread.join(timeout=1.0)
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            fn, args = item
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"Callback error: {e}")
+
+
+class AsyncioDispatcher:
+    """Run callbacks on an asyncio event loop, for scripts built around asyncio."""
+
+    def __init__(self, loop):
+        self.loop = loop
+
+    def __call__(self, fn, *args):
+        self.loop.call_soon_threadsafe(fn, *args)
+
+
+class WxDispatcher:
+    """Run callbacks on the wx main loop. wx is imported when this is constructed, never by the engine itself."""
+
+    def __init__(self):
+        import wx
+
+        self.call_after = wx.CallAfter
+
+    def __call__(self, fn, *args):
+        self.call_after(fn, *args)
+
+
+_dispatcher = DirectDispatcher()
+
+
+def set_dispatcher(dispatcher):
+    """Route engine callbacks through dispatcher(fn, *args); None restores direct calls."""
+    global _dispatcher
+    _dispatcher = dispatcher if dispatcher is not None else DirectDispatcher()
+
+
+def get_dispatcher():
+    return _dispatcher
+
+
+def dispatch(fn, *args):
+    """Deliver a callback raised by an engine thread."""
+    _dispatcher(fn, *args)
+
+
+# --- ZMQ Logic Classes ---
+
+
+def get_context():
+    """Return the process-wide ZMQ context shared by every socket."""
+    return zmq.Context.instance()
+
+
+def drain_socket(recv, batch_size):
+    """Call recv(zmq.NOBLOCK) up to batch_size times, stopping early once the socket is empty."""
+    messages = []
+    try:
+        for _ in range(batch_size):
+            messages.append(recv(zmq.NOBLOCK))
+    except zmq.Again:
+        pass
+    return messages
+
+
+class LazyMessage:
+    """Raw message payload that is decoded and formatted only when first displayed.
+
+    The receive path stores the wire bytes as-is; JSON parsing and (pretty-)printing
+    happen on demand in the UI thread and are cached on the instance.
+    """
+
+    __slots__ = ("raw", "_decoded", "_text", "_pretty")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._decoded = None
+        self._text = None
+        self._pretty = None
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __str__(self):
+        return self.text()
+
+    def decoded(self):
+        """Parsed JSON value, or the decoded string if the payload is not JSON."""
+        if self._decoded is None:
+            text = self.raw.decode("utf-8", errors="replace")
+            try:
+                self._decoded = json.loads(text)
+            except json.JSONDecodeError:
+                self._decoded = text
+        return self._decoded
+
+    def text(self):
+        """Compact single-string form for tables."""
+        if self._text is None:
+            decoded = self.decoded()
+            self._text = json.dumps(decoded) if isinstance(decoded, (dict, list)) else str(decoded)
+        return self._text
+
+    def pretty(self):
+        """Indented form for detail views."""
+        if self._pretty is None:
+            decoded = self.decoded()
+            self._pretty = json.dumps(decoded, indent=2) if isinstance(decoded, (dict, list)) else str(decoded)
+        return self._pretty
+
+
+class RateCounter:
+    """Sliding-window message and byte rate kept in a fixed ring of time buckets.
+
+    add() is O(1) and memory does not grow with the message rate; queries walk the
+    buckets once. Not thread-safe: callers guard it with their own lock.
+    """
+
+    __slots__ = ("window_sec", "bucket_sec", "num_buckets", "ticks", "counts", "sizes")
+
+    def __init__(self, window_sec=1.0, num_buckets=100):
+        self.window_sec = window_sec
+        self.bucket_sec = window_sec / num_buckets
+        self.num_buckets = num_buckets
+        self.ticks = [-1] * num_buckets  # Absolute bucket number currently held by each slot
+        self.counts = [0] * num_buckets
+        self.sizes = [0] * num_buckets
+
+    def add(self, count, num_bytes, now):
+        """Record count messages totalling num_bytes at time now."""
+        tick = int(now / self.bucket_sec)
+        slot = tick % self.num_buckets
+        if self.ticks[slot] != tick:
+            # Slot holds an expired bucket; recycle it
+            self.ticks[slot] = tick
+            self.counts[slot] = count
+            self.sizes[slot] = num_bytes
+        else:
+            self.counts[slot] += count
+            self.sizes[slot] += num_bytes
+
+    def totals(self, now):
+        """Return (messages, bytes) received within the window ending at now."""
+        oldest = int(now / self.bucket_sec) - self.num_buckets + 1
+        total_count = 0
+        total_bytes = 0
+        for tick, count, num_bytes in zip(self.ticks, self.counts, self.sizes):
+            if tick >= oldest:
+                total_count += count
+                total_bytes += num_bytes
+        return total_count, total_bytes
+
+    def rates(self, now):
+        """Return (messages/s, bytes/s) over the window ending at now."""
+        total_count, total_bytes = self.totals(now)
+        return total_count / self.window_sec, total_bytes / self.window_sec
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of nanosecond latencies in a preallocated count array.
+
+    Values below 2**SUB_BITS get their own bucket; above that each power of two is split into
+    2**(SUB_BITS - 1) linear buckets, so every bucket is within ~3% of the values it holds.
+    record() does integer math only; percentiles() walks the buckets once for all quantiles.
+    Not thread-safe: callers guard it with their own lock.
+    """
+
+    SUB_BITS = 6
+    SUB_COUNT = 1 << SUB_BITS  # 64
+    HALF_COUNT = SUB_COUNT >> 1  # 32 buckets per power of two above SUB_COUNT
+    MAX_EXPONENT = 40  # Values up to ~2**46 ns (~19 hours); larger ones land in the last bucket
+
+    __slots__ = ("counts", "count", "total", "max_value", "last_index")
+
+    def __init__(self):
+        self.last_index = self.SUB_COUNT + self.MAX_EXPONENT * self.HALF_COUNT - 1
+        self.counts = [0] * (self.last_index + 1)
+        self.count = 0
+        self.total = 0
+        self.max_value = 0
+
+    def record(self, value):
+        if value < 0:
+            value = 0  # Sender clock ahead of ours
+        if value < self.SUB_COUNT:
+            index = value
+        else:
+            exponent = value.bit_length() - self.SUB_BITS
+            index = self.SUB_COUNT + (exponent - 1) * self.HALF_COUNT + (value >> exponent) - self.HALF_COUNT
+            if index > self.last_index:
+                index = self.last_index
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max_value:
+            self.max_value = value
+
+    def _bucket_high(self, index):
+        """Highest value that maps to bucket index."""
+        if index < self.SUB_COUNT:
+            return index
+        exponent, offset = divmod(index - self.SUB_COUNT, self.HALF_COUNT)
+        exponent += 1
+        return ((offset + self.HALF_COUNT + 1) << exponent) - 1
+
+    def percentiles(self, quantiles):
+        """Return the value at each quantile (0..1, ascending), capped at the recorded max."""
+        results = []
+        if not self.count:
+            return [0] * len(quantiles)
+        targets = [max(1, int(q * self.count + 0.5)) for q in quantiles]
+        seen = 0
+        target_index = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while target_index < len(targets) and seen >= targets[target_index]:
+                results.append(min(self._bucket_high(index), self.max_value))
+                target_index += 1
+            if target_index == len(targets):
+                break
+        while len(results) < len(quantiles):
+            results.append(self.max_value)
+        return results
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def buckets(self):
+        """(low, high, count) of every non-empty bucket, in ascending order."""
+        result = []
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                low = self._bucket_high(index - 1) + 1 if index else 0
+                result.append((low, self._bucket_high(index), bucket_count))
+        return result
+
+
+class MessageRing:
+    """Bounded buffer of entries whose first field is a monotonically increasing message number.
+
+    Appending is O(1) (the oldest entry falls off once full) and get_since() only walks the
+    entries newer than the caller's last number. Not thread-safe: callers hold their own lock.
+    """
+
+    def __init__(self, maxlen):
+        self.entries = collections.deque(maxlen=maxlen)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def maxlen(self):
+        return self.entries.maxlen
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+    def append(self, entry):
+        self.entries.append(entry)
+
+    def clear(self):
+        self.entries.clear()
+
+    def resize(self, maxlen):
+        """Change the capacity, keeping the newest entries."""
+        self.entries = collections.deque(self.entries, maxlen=maxlen)
+
+    def get_since(self, last_num):
+        """Return entries with a number greater than last_num, oldest first."""
+        newer = []
+        for entry in reversed(self.entries):
+            if entry[0] <= last_num:
+                break
+            newer.append(entry)
+        newer.reverse()
+        return newer
+
+
+class SequenceTracker:
+    """Loss, reordering and duplicate detection for one stream of sequence numbers in O(1) state.
+
+    Keeps the highest sequence seen plus a 64-bit mask of which of the 64 numbers below it
+    arrived. A jump forward counts the skipped numbers as lost; one of them arriving later is
+    reclassified as out-of-order. A number more than the mask window below the highest means
+    the sender restarted its numbering: tracking starts over from it and a reset is counted.
+    """
+
+    WINDOW = 64
+    WINDOW_MASK = (1 << 64) - 1
+
+    __slots__ = ("highest", "seen_mask", "received", "lost", "out_of_order", "duplicates", "resets")
+
+    def __init__(self):
+        self.highest = None
+        self.seen_mask = 0  # Bit i set: highest - i was received
+        self.received = 0
+        self.lost = 0
+        self.out_of_order = 0
+        self.duplicates = 0
+        self.resets = 0  # Times the sender restarted its numbering
+
+    def track(self, seq):
+        self.received += 1
+        if self.highest is None:
+            self.highest = seq
+            self.seen_mask = 1
+        elif seq > self.highest:
+            distance = seq - self.highest
+            self.lost += distance - 1
+            self.seen_mask = ((self.seen_mask << distance) | 1) & self.WINDOW_MASK if distance < self.WINDOW else 1
+            self.highest = seq
+        else:
+            distance = self.highest - seq
+            if distance >= self.WINDOW:
+                # New stream (e.g. publisher restart); gaps from here on are counted again
+                self.highest = seq
+                self.seen_mask = 1
+                self.resets += 1
+            elif self.seen_mask & (1 << distance):
+                self.duplicates += 1
+            else:
+                self.seen_mask |= 1 << distance
+                self.out_of_order += 1
+                self.lost -= 1  # Counted as lost when it was skipped
+
+    def as_dict(self):
+        return {"received": self.received, "lost": self.lost, "out_of_order": self.out_of_order, "duplicates": self.duplicates, "resets": self.resets}
+
+
+class SequenceReader:
+    """Reads a message's sequence number as described by a source spec.
+
+    "frame:N" reads frame N (negative counts from the end): a decimal number, an 8-byte
+    little-endian uint64, or a LATENCY_HEADER frame. "json:a.b.0" reads a field of the JSON
+    payload, following dict keys and list indexes. Raises ValueError for a bad spec.
+    """
+
+    UINT64 = struct.Struct("<Q")
+
+    def __init__(self, spec):
+        self.spec = spec.strip()
+        kind, _, arg = self.spec.partition(":")
+        self.frame_index = None
+        self.json_path = None
+        if kind == "frame":
+            try:
+                self.frame_index = int(arg)
+            except ValueError:
+                raise ValueError(f"Sequence source '{spec}': frame index must be a number")
+        elif kind == "json" and arg:
+            self.json_path = [int(key) if key.lstrip("-").isdigit() else key for key in arg.split(".")]
+        else:
+            raise ValueError(f"Sequence source '{spec}': use frame:N or json:field.path")
+
+    def read(self, frames, payload_index=-1, parsed=None):
+        """Return the sequence number of a message, or None if it has none.
+
+        parsed may carry an already-decoded JSON payload to avoid parsing it twice.
+        """
+        try:
+            if self.frame_index is not None:
+                frame = frames[self.frame_index]
+                if len(frame) == LATENCY_HEADER.size and frame.startswith(LATENCY_MAGIC):
+                    return LATENCY_HEADER.unpack_from(frame)[1]
+                try:
+                    return int(frame)
+                except ValueError:
+                    if len(frame) == 8:
+                        return self.UINT64.unpack(frame)[0]
+                    return None
+            value = parsed if parsed is not None else json.loads(frames[payload_index])
+            for key in self.json_path:
+                value = value[key]
+            return value if isinstance(value, int) else int(value)
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
+
+class SequenceMixin:
+    """Optional per-stream sequence tracking for receivers (streams are topics, groups or the socket).
+
+    Receivers read sequence numbers with self.sequence_reader outside their lock, then call
+    _track_sequence() while holding it.
+    """
+
+    sequence_reader = None
+
+    def set_sequence_source(self, spec):
+        """Set where sequence numbers are read from ("" disables tracking) and clear counters."""
+        reader = None
+        if spec and spec.strip():
+            try:
+                reader = SequenceReader(spec)
+            except ValueError as e:
+                return False, str(e)
+        with self.lock:
+            self.sequence_reader = reader
+            self.sequences = {}
+        return True, "Sequence tracking enabled" if reader else "Sequence tracking disabled"
+
+    def _track_sequence(self, stream, seq):
+        """Record seq for stream. Caller holds self.lock."""
+        tracker = self.sequences.get(stream)
+        if tracker is None:
+            tracker = self.sequences[stream] = SequenceTracker()
+        tracker.track(seq)
+
+    def get_sequence_totals(self):
+        """Sequence counters summed over all streams, or None if nothing was tracked (thread-safe)."""
+        with self.lock:
+            return self._sequence_totals()
+
+    def _sequence_totals(self):
+        """Counters summed over all streams, or None if nothing was tracked. Caller holds self.lock."""
+        if not self.sequences:
+            return None
+        totals = {"received": 0, "lost": 0, "out_of_order": 0, "duplicates": 0, "resets": 0}
+        for tracker in self.sequences.values():
+            for key, value in tracker.as_dict().items():
+                totals[key] += value
+        return totals
+
+
+class SinkMixin:
+    """Forwards every batch a receiving engine drains to attached sinks (capture files, databases, ...).
+
+    A sink implements write_batch(source, recv_time, messages), where messages is a list of frame
+    lists. It is called from the reactor thread outside the engine lock, so it must not block.
+    """
+
+    sinks = ()
+
+    def add_sink(self, sink):
+        self.sinks = self.sinks + (sink,)
+
+    def remove_sink(self, sink):
+        self.sinks = tuple(s for s in self.sinks if s is not sink)
+
+    def _write_sinks(self, source, recv_time, messages):
+        for sink in self.sinks:
+            try:
+                sink.write_batch(source, recv_time, messages)
+            except Exception as e:
+                print(f"{source} sink error: {e}")
+
+
+class MessageTemplate:
+    """Message text with placeholders, parsed once into a str.format() string plus value getters.
+
+    Placeholders: {seq} (per-sender sequence number), {ts_ns} (epoch nanoseconds), {ts} (epoch
+    seconds with microseconds) and {rand:N} (N random hex digits, default 8). Any other brace is
+    literal, so JSON needs no escaping; write {{seq}} to send a literal "{seq}".
+    """
+
+    FIELD_PATTERN = re.compile(r"\{(\{[A-Za-z_]\w*(?::[^{}]*)?\})\}|\{([A-Za-z_]\w*)(?::([^{}]*))?\}")
+
+    __slots__ = ("source", "format_string", "getters")
+
+    def __init__(self, source):
+        self.source = source
+        parts = []
+        self.getters = []
+        pos = 0
+        for match in self.FIELD_PATTERN.finditer(source):
+            parts.append(source[pos : match.start()])
+            if match.group(1):
+                parts.append(match.group(1))  # Escaped placeholder, kept as literal text
+            else:
+                parts.append(None)
+                self.getters.append(self._make_getter(match.group(2), match.group(3)))
+            pos = match.end()
+        parts.append(source[pos:])
+        self.format_string = "".join("{}" if part is None else part.replace("{", "{{").replace("}", "}}") for part in parts)
+
+    @staticmethod
+    def _make_getter(name, arg):
+        if name == "seq":
+            return lambda seq: seq
+        if name == "ts_ns":
+            return lambda seq: time.time_ns()
+        if name == "ts":
+            return lambda seq: f"{time.time():.6f}"
+        if name == "rand":
+            try:
+                digits = int(arg) if arg else 8
+            except ValueError:
+                raise ValueError(f"{{rand:{arg}}}: length must be a number")
+            if digits < 1:
+                raise ValueError(f"{{rand:{arg}}}: length must be positive")
+            bits = digits * 4
+            return lambda seq: f"{random.getrandbits(bits):0{digits}x}"
+        raise ValueError(f"Unknown placeholder {{{name}}}")
+
+    @property
+    def is_static(self):
+        """True if the template has no placeholders (every render returns the same text)."""
+        return not self.getters
+
+    def render(self, seq):
+        if not self.getters:
+            return self.format_string.format()
+        return self.format_string.format(*[getter(seq) for getter in self.getters])
+
+
+@functools.lru_cache(maxsize=64)
+def compile_template(text):
+    """Parse text into a MessageTemplate once; sending the same text again reuses it. Raises ValueError."""
+    return MessageTemplate(text)
+
+
+class TemplateMixin:
+    """Template expansion for senders, each with its own {seq} counter."""
+
+    template_seq = 0
+
+    def render_template(self, message):
+        """Expand message as a template. Returns (success, expanded message or error)."""
+        try:
+            template = compile_template(message)
+        except ValueError as e:
+            return False, f"Template error: {e}"
+        seq = self.template_seq
+        self.template_seq = seq + 1
+        return True, template.render(seq)
+
+
+class Reactor:
+    """Single I/O thread that polls every receiving socket and dispatches to its handler.
+
+    Sockets are registered with a handler that is called (in the reactor thread) whenever
+    the socket is readable. The poll blocks without a timeout, so an idle application does
+    not wake up at all; registration changes wake the poller through an inproc pipe.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Reactor, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.poller = zmq.Poller()
+            cls._instance.handlers = {}  # {socket: (handler, name)}
+            cls._instance.commands = []  # Pending (action, socket, handler, name, done_event)
+            cls._instance.lock = threading.Lock()
+            cls._instance.thread = None
+            cls._instance.running = False
+            cls._instance.starts = 0
+            cls._instance.wake_recv = None
+            cls._instance.wake_send = None
+        return cls._instance
+
+    def _ensure_started(self):
+        """Start the reactor thread on first use (caller holds the lock)."""
+        if self.running:
+            return
+        # A new address per start: a closed inproc endpoint isn't released immediately
+        self.starts += 1
+        address = f"inproc://zmqanalyzer-reactor-{id(self)}-{self.starts}"
+        self.wake_recv = self.context.socket(zmq.PAIR)
+        self.wake_recv.bind(address)
+        self.wake_send = self.context.socket(zmq.PAIR)
+        self.wake_send.connect(address)
+        self.poller.register(self.wake_recv, zmq.POLLIN)
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="ZmqReactor", daemon=True)
+        self.thread.start()
+
+    def _wake(self):
+        """Interrupt the blocking poll (caller holds the lock)."""
+        try:
+            self.wake_send.send(b"", zmq.NOBLOCK)
+        except zmq.Again:
+            pass  # A wake-up is already queued
+
+    def register(self, socket, handler, name="Socket"):
+        """Poll socket for input and call handler(socket) from the reactor thread when readable."""
+        if threading.current_thread() is self.thread:
+            self._add(socket, handler, name)
+            return
+        with self.lock:
+            self._ensure_started()
+            self.commands.append(("add", socket, handler, name, None))
+            self._wake()
+
+    def unregister(self, socket):
+        """Stop polling socket. Blocks until the reactor no longer touches it, so it can be closed."""
+        if socket is None:
+            return
+        if threading.current_thread() is self.thread:
+            self._remove(socket)
+            return
+        done = threading.Event()
+        with self.lock:
+            if not self.running:
+                return
+            self.commands.append(("remove", socket, None, None, done))
+            self._wake()
+        if not done.wait(timeout=1.0):
+            print("Reactor: timed out waiting to unregister socket")
+
+    def shutdown(self):
+        """Stop the reactor thread."""
+        with self.lock:
+            if not self.running:
+                return
+            self.running = False
+            self._wake()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        for sock in (self.wake_send, self.wake_recv):
+            if sock:
+                sock.close()
+        self.wake_send = None
+        self.wake_recv = None
+        self.poller = zmq.Poller()
+        self.handlers = {}
+
+    def _add(self, socket, handler, name):
+        self.handlers[socket] = (handler, name)
+        self.poller.register(socket, zmq.POLLIN)
+
+    def _remove(self, socket):
+        if self.handlers.pop(socket, None) is not None:
+            try:
+                self.poller.unregister(socket)
+            except KeyError:
+                pass
+
+    def _apply_commands(self):
+        with self.lock:
+            commands = self.commands
+            self.commands = []
+        for action, socket, handler, name, done in commands:
+            if action == "add":
+                self._add(socket, handler, name)
+            else:
+                self._remove(socket)
+                done.set()
+
+    def _drop_failed_sockets(self):
+        """Unregister sockets that are closed or fail a zero-timeout poll. Returns True if any were dropped."""
+        failed = []
+        for socket, (_, name) in self.handlers.items():
+            try:
+                if socket.closed:
+                    raise zmq.ZMQError(zmq.ENOTSOCK)
+                socket.poll(0)
+            except zmq.ZMQError:
+                failed.append((socket, name))
+        for socket, name in failed:
+            print(f"Reactor: dropped failing {name} socket")
+            self._remove(socket)
+        return bool(failed)
+
+    def _reset_after_error(self):
+        """Replace the failed poller and wake pipe, and start a new reactor thread for the registered sockets."""
+        time.sleep(0.1)  # Don't spin if the error persists
+        with self.lock:
+            handlers = self.handlers
+            self.running = False
+            self.thread = None
+            for sock in (self.wake_send, self.wake_recv):
+                if sock:
+                    sock.close()
+            self.wake_send = None
+            self.wake_recv = None
+            self.poller = zmq.Poller()
+            self.handlers = {}
+            commands = self.commands
+            # Healthy sockets and registrations queued meanwhile go to a new loop; waiting unregisters are released below
+            removing = {command[1] for command in commands if command[0] == "remove"}
+            self.commands = [("add", socket, handler, name, None) for socket, (handler, name) in handlers.items() if socket not in removing]
+            self.commands += [command for command in commands if command[0] == "add" and command[1] not in removing]
+            if self.commands:
+                self._ensure_started()
+                self._wake()
+        for action, _, _, _, done in commands:
+            if action != "add":
+                done.set()
+
+    def _run(self):
+        while self.running:
+            try:
+                events = self.poller.poll()
+            except zmq.ZMQError as e:
+                print(f"Reactor poll error: {e}")
+                if self._drop_failed_sockets():
+                    continue  # Keep serving the healthy sockets
+                self._reset_after_error()
+                return
+
+            for socket, _ in events:
+                if socket is self.wake_recv:
+                    try:
+                        while True:
+                            self.wake_recv.recv(zmq.NOBLOCK)
+                    except zmq.Again:
+                        pass
+                    self._apply_commands()
+                    continue
+
+                entry = self.handlers.get(socket)
+                if entry is None:
+                    continue  # Unregistered while this batch of events was pending
+                handler, name = entry
+                try:
+                    handler(socket)
+                except zmq.ZMQError as e:
+                    print(f"{name} socket error: {e}")
+                    self._remove(socket)
+                except Exception as e:
+                    print(f"{name} loop error: {e}")
+
+        # Release anyone still waiting on an unregister
+        self._apply_commands()
+
+
+class Publisher(TemplateMixin):
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Publisher, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.port = ""
+            cls._instance.is_bound = False
+            cls._instance.lock = threading.Lock()
+            cls._instance.stamp_latency = False  # Append a LATENCY_HEADER frame to every message
+            cls._instance.stamp_seqs = {}  # {topic bytes: next sequence number} for stamped messages
+        return cls._instance
+
+    def bind(self, port):
+        """Bind the publisher socket to the specified port."""
+        with self.lock:
+            if self.is_bound:
+                return False, "Publisher already bound"
+
+            try:
+                self.socket = self.context.socket(zmq.PUB)
+                self.socket.bind(f"tcp://*:{port}")
+                self.port = port
+                self.is_bound = True
+                print(f"Publisher bound to port {port}")
+                return True, f"Publisher bound to port {port}"
+            except zmq.ZMQError as e:
+                print(f"Publisher bind error: {e}")
+                if self.socket:
+                    self.socket.close()
+                    self.socket = None
+                return False, f"Bind error: {e}"
+
+    def unbind(self):
+        """Unbind the publisher socket."""
+        with self.lock:
+            if not self.is_bound:
+                return False, "Publisher not bound"
+
+            try:
+                if self.socket:
+                    self.socket.close()
+                    self.socket = None
+                self.is_bound = False
+                print(f"Publisher unbound from port {self.port}")
+                return True, f"Publisher unbound from port {self.port}"
+            except Exception as e:
+                print(f"Publisher unbind error: {e}")
+                return False, f"Unbind error: {e}"
+
+    def send_message(self, topic, message, template=False):
+        """Send a message on the specified topic. With template=True, placeholders are expanded first."""
+        if template:
+            success, message = self.render_template(message)
+            if not success:
+                return False, message
+        with self.lock:
+            if not self.is_bound or not self.socket:
+                return False, "Publisher not bound"
+
+            try:
+                frames = [topic.encode("utf-8"), message.encode("utf-8")]
+                if self.stamp_latency:
+                    frames.append(self._latency_frame(frames[0]))
+                self.socket.send_multipart(frames)
+                print(f"Published to {topic}: {message}")
+                return True, "Message published"
+            except zmq.ZMQError as e:
+                print(f"Publish error: {e}")
+                return False, f"Publish error: {e}"
+
+    def set_stamp_latency(self, enabled):
+        """Enable or disable the trailing latency/sequence frame on published messages."""
+        with self.lock:
+            self.stamp_latency = enabled
+            if not enabled:
+                self.stamp_seqs = {}
+
+    def _latency_frame(self, topic):
+        """Trailing LATENCY_HEADER frame for the next message on topic. Caller holds the lock."""
+        seq = self.stamp_seqs.get(topic, 0)
+        self.stamp_seqs[topic] = seq + 1
+        return LATENCY_HEADER.pack(LATENCY_MAGIC, seq, time.time_ns())
+
+    def send_raw(self, frames):
+        """Send pre-encoded frames without blocking or logging (load generation hot path).
+
+        Returns True if the message was queued, False if it was refused (zmq.Again) or the
+        socket is not bound. Note that PUB never refuses at the HWM: it drops silently.
+        """
+        with self.lock:
+            if not self.socket:
+                return False
+            try:
+                if self.stamp_latency:
+                    frames = frames + [self._latency_frame(frames[0])]
+                self.socket.send_multipart(frames, zmq.NOBLOCK)
+                return True
+            except zmq.ZMQError:
+                return False
+
+
+class LoadGenerator:
+    """Background thread that publishes at a target rate for load-testing subscribers.
+
+    Sends are paced by a token bucket (refilled at `rate` tokens/s, holding at most 10 ms worth
+    so that a stall never turns into an unbounded burst). The payload is encoded once at start,
+    unless it is a message template, which is rendered (with its own {seq}) for every message.
+    """
+
+    _instance = None
+    BURST_SEC = 0.01  # Token bucket depth in seconds of traffic
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LoadGenerator, cls).__new__(cls)
+            cls._instance.running = False
+            cls._instance.thread = None
+            cls._instance.callback = None
+            cls._instance.lock = threading.Lock()
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window for instant rate
+            cls._instance._reset_stats()
+        return cls._instance
+
+    def _reset_stats(self):
+        self.sent = 0
+        self.dropped = 0  # Sends refused with zmq.Again
+        self.sent_bytes = 0
+        self.start_time = None
+        self.end_time = None
+        self.cpu_time = 0.0  # time.thread_time() consumed by the generator thread
+        self.rate_counter = RateCounter(self.STATS_WINDOW_SEC)
+
+    def start(self, rate, topics, payload_size, duration=None, count=None, payload=None, template=False, callback=None):
+        """Start generating. rate is msgs/sec (0 for as fast as possible); stops after duration
+        seconds or count messages if given, otherwise on stop(). callback(message) is dispatched
+        when the run ends on its own."""
+        if self.running:
+            return False, "Load generator already running"
+        if not Publisher().is_bound:
+            return False, "Publisher not bound"
+        if not topics:
+            return False, "At least one topic is required"
+
+        if payload is None:
+            payload = "x" * payload_size
+        self.template = None
+        if template:
+            try:
+                self.template = compile_template(payload)
+            except ValueError as e:
+                return False, f"Template error: {e}"
+            if self.template.is_static:
+                self.template = None  # Nothing varies; send the pre-encoded payload
+        self.frames_by_topic = [[topic.encode("utf-8"), payload.encode("utf-8")] for topic in topics]
+        self.rate = rate
+        self.duration = duration
+        self.count = count
+        self.callback = callback
+        self._reset_stats()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        print(f"Load generator started: {rate or 'max'} msg/s, {len(topics)} topic(s), {len(payload)} byte payload")
+        return True, "Load generator started"
+
+    def stop(self):
+        if not self.running:
+            return False, "Load generator not running"
+        self.running = False
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
+        print(f"Load generator stopped after {self.sent} messages")
+        return True, "Load generator stopped"
+
+    def _run(self):
+        publisher = Publisher()
+        frames_by_topic = self.frames_by_topic
+        num_topics = len(frames_by_topic)
+        frame_bytes = [sum(len(frame) for frame in frames) for frames in frames_by_topic]
+        render = self.template.render if self.template else None
+        seq = 0
+        rate = self.rate
+        burst = max(1.0, rate * self.BURST_SEC)
+        tokens = 0.0
+        topic_index = 0
+        finished_message = None
+
+        self.start_time = time.perf_counter()
+        last_time = self.start_time
+        cpu_start = time.thread_time()
+        deadline = self.start_time + self.duration if self.duration else None
+
+        while self.running:
+            now = time.perf_counter()
+            if deadline is not None and now >= deadline:
+                finished_message = "Duration reached"
+                break
+
+            if rate > 0:
+                tokens = min(burst, tokens + (now - last_time) * rate)
+                last_time = now
+                if tokens < 1.0:
+                    time.sleep((1.0 - tokens) / rate)
+                    continue
+                batch = int(tokens)
+                tokens -= batch
+            else:
+                batch = 256  # Unpaced: send in batches between bookkeeping
+
+            if self.count is not None:
+                batch = min(batch, self.count - self.sent - self.dropped)
+
+            sent = dropped = sent_bytes = 0
+            for _ in range(batch):
+                if render is None:
+                    frames = frames_by_topic[topic_index]
+                    num_bytes = frame_bytes[topic_index]
+                else:
+                    topic = frames_by_topic[topic_index][0]
+                    payload = render(seq).encode("utf-8")
+                    frames = [topic, payload]
+                    num_bytes = len(topic) + len(payload)
+                    seq += 1
+                if publisher.send_raw(frames):
+                    sent += 1
+                    sent_bytes += num_bytes
+                else:
+                    dropped += 1
+                topic_index = (topic_index + 1) % num_topics
+
+            with self.lock:
+                self.sent += sent
+                self.dropped += dropped
+                self.sent_bytes += sent_bytes
+                self.rate_counter.add(sent, sent_bytes, time.time())
+                self.cpu_time = time.thread_time() - cpu_start
+
+            if not publisher.is_bound:
+                finished_message = "Publisher unbound"
+                break
+            if self.count is not None and self.sent + self.dropped >= self.count:
+                finished_message = "Count reached"
+                break
+
+        self.end_time = time.perf_counter()
+        self.cpu_time = time.thread_time() - cpu_start
+        if finished_message is not None:
+            self.running = False
+            print(f"Load generator finished ({finished_message}) after {self.sent} messages")
+            if self.callback:
+                dispatch(self.callback, finished_message)
+
+    def get_stats(self):
+        """Progress of the current or last run: counts, instant and average rate, CPU usage."""
+        with self.lock:
+            if self.start_time is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self.end_time if self.end_time and not self.running else time.perf_counter()) - self.start_time
+            instant_count, instant_bytes = self.rate_counter.rates(time.time())
+            return {
+                "running": self.running,
+                "sent": self.sent,
+                "dropped": self.dropped,
+                "bytes": self.sent_bytes,
+                "elapsed": elapsed,
+                "instant_rate": instant_count,
+                "instant_bytes": instant_bytes,
+                "average_rate": self.sent / elapsed if elapsed > 0 else 0.0,
+                "cpu_percent": 100.0 * self.cpu_time / elapsed if elapsed > 0 else 0.0,
+            }
+
+
+class Subscriber(SinkMixin, SequenceMixin):
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Subscriber, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.callback = None
+            cls._instance.latest_messages = {}
+            cls._instance.topic_stats = {}  # Cumulative stats: {topic: {count, bytes, first_time, last_time}}
+            cls._instance.total_count = 0  # Cumulative totals across all topics
+            cls._instance.total_bytes = 0
+            cls._instance.dirty_topics = set()  # Topics that received messages since the last pop_dirty_topics()
+            cls._instance.lock = threading.Lock()
+            cls._instance.sequences = {}  # {stream: SequenceTracker} when a sequence source is set
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window for instant rate
+            cls._instance.topic_rates = {}  # Sliding window: {topic: RateCounter}
+            cls._instance.total_rate = RateCounter(cls._instance.STATS_WINDOW_SEC)  # Sliding window across all topics
+            cls._instance.batch_size = DEFAULT_RECV_BATCH_SIZE
+            cls._instance.wake_count = 0  # Reactor wake-ups that drained this socket
+            cls._instance.wake_messages = 0  # Messages drained across those wake-ups
+            cls._instance.measure_latency = False  # Read LATENCY_HEADER trailing frames into topic_latency
+            cls._instance.topic_latency = {}  # {topic: LatencyHistogram} of one-way latency in ns
+        return cls._instance
+
+    def get_stats(self, topics=None):
+        """Get a copy of current statistics, optionally only for the given topics (thread-safe)."""
+        with self.lock:
+            current_time = time.time()
+            result = {}
+            for topic in self.topic_stats if topics is None else topics:
+                stats = self.topic_stats.get(topic)
+                if stats is None:
+                    continue
+                result[topic] = stats.copy()
+                # Calculate instant rate from sliding window
+                instant_rate, instant_speed = self.topic_rates[topic].rates(current_time)
+                result[topic]["instant_rate"] = instant_rate
+                result[topic]["instant_speed"] = instant_speed
+                histogram = self.topic_latency.get(topic)
+                if histogram is not None and histogram.count:
+                    p50, p99, p999 = histogram.percentiles((0.5, 0.99, 0.999))
+                    result[topic]["latency"] = {"p50": p50, "p99": p99, "p999": p999, "max": histogram.max_value}
+                tracker = self.sequences.get(topic)
+                if tracker is not None:
+                    result[topic]["sequence"] = tracker.as_dict()
+            return result
+
+    def get_instant_totals(self):
+        """Get instant rate totals across all topics (thread-safe)."""
+        with self.lock:
+            total_count, total_bytes = self.total_rate.totals(time.time())
+            messages_per_wake = self.wake_messages / self.wake_count if self.wake_count else 0.0
+            return {
+                "count": self.total_count,
+                "bytes": self.total_bytes,
+                "topics": len(self.topic_stats),
+                "instant_count": total_count,
+                "instant_bytes": total_bytes,
+                "messages_per_wake": messages_per_wake,
+            }
+
+    def get_messages(self, topics=None):
+        """Get a copy of latest messages as LazyMessage objects, optionally only for the given topics (thread-safe)."""
+        with self.lock:
+            if topics is None:
+                return dict(self.latest_messages)
+            return {topic: self.latest_messages[topic] for topic in topics if topic in self.latest_messages}
+
+    def pop_dirty_topics(self):
+        """Return the topics that received messages since the previous call, and clear the set (thread-safe)."""
+        with self.lock:
+            dirty = self.dirty_topics
+            self.dirty_topics = set()
+            return dirty
+
+    def reset_stats(self):
+        """Reset statistics (thread-safe)."""
+        with self.lock:
+            self.topic_stats = {}
+            self.total_count = 0
+            self.total_bytes = 0
+            self.dirty_topics = set()
+            self.topic_rates = {}
+            self.total_rate = RateCounter(self.STATS_WINDOW_SEC)
+            self.wake_count = 0
+            self.wake_messages = 0
+            self.topic_latency = {}
+            self.sequences = {}
+
+    def start(self, topics, address, batch_size=DEFAULT_RECV_BATCH_SIZE):
+        """Start subscribing to topics at the specified address.
+
+        batch_size caps how many messages are drained per reactor wake-up.
+        """
+        self.stop()
+        self.batch_size = max(1, int(batch_size))
+
+        try:
+            self.socket = self.context.socket(zmq.SUB)
+            self.socket.connect(address)
+            for topic in topics:
+                self.socket.setsockopt_string(zmq.SUBSCRIBE, topic)
+
+            self.running = True
+            Reactor().register(self.socket, self._on_readable, "Subscriber")
+            print(f"Subscriber started on {address} for topics {topics}")
+            return True, f"Subscribed to {len(topics)} topic(s)"
+        except zmq.ZMQError as e:
+            print(f"Subscriber connect error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Connection error: {e}"
+
+    def stop(self):
+        self.running = False
+        if self.socket:
+            Reactor().unregister(self.socket)
+            self.socket.close()
+            self.socket = None
+
+    def set_measure_latency(self, enabled):
+        """Enable or disable one-way latency measurement from LATENCY_HEADER trailing frames."""
+        with self.lock:
+            self.measure_latency = enabled
+            if not enabled:
+                self.topic_latency = {}
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def _on_readable(self, socket):
+        # Drain a batch outside the lock; payloads stay raw until the UI displays them
+        batch = drain_socket(socket.recv_multipart, self.batch_size)
+        measure_latency = self.measure_latency
+        sequence_reader = self.sequence_reader
+        recv_ns = time.time_ns()  # One clock read per batch
+        received = []
+        for parts in batch:
+            if len(parts) < 2:
+                continue
+            latency = None
+            if measure_latency and len(parts) > 2:
+                header = parts[-1]
+                if len(header) == LATENCY_HEADER.size and header.startswith(LATENCY_MAGIC):
+                    latency = recv_ns - LATENCY_HEADER.unpack_from(header)[2]
+            seq = sequence_reader.read(parts, 1) if sequence_reader else None
+            received.append((parts[0].decode("utf-8", errors="replace"), LazyMessage(parts[1]), latency, seq))
+
+        # Commit the whole batch under a single lock acquisition
+        with self.lock:
+            current_time = time.time()
+            self.wake_count += 1
+            self.wake_messages += len(received)
+            batch_bytes = 0
+            for topic, message, latency, seq in received:
+                msg_bytes = len(message)  # Wire length of the payload frame
+                batch_bytes += msg_bytes
+
+                # Store latest message
+                self.latest_messages[topic] = message
+
+                # Update cumulative statistics
+                if topic not in self.topic_stats:
+                    self.topic_stats[topic] = {"count": 0, "bytes": 0, "first_time": current_time, "last_time": current_time}
+                    self.topic_rates[topic] = RateCounter(self.STATS_WINDOW_SEC)
+                self.topic_stats[topic]["count"] += 1
+                self.topic_stats[topic]["bytes"] += msg_bytes
+                self.topic_stats[topic]["last_time"] = current_time
+
+                # Update sliding window for instant rate calculation
+                self.topic_rates[topic].add(1, msg_bytes, current_time)
+                self.dirty_topics.add(topic)
+
+                if latency is not None:
+                    histogram = self.topic_latency.get(topic)
+                    if histogram is None:
+                        histogram = self.topic_latency[topic] = LatencyHistogram()
+                    histogram.record(latency)
+                if seq is not None:
+                    self._track_sequence(topic, seq)
+            self.total_count += len(received)
+            self.total_bytes += batch_bytes
+            self.total_rate.add(len(received), batch_bytes, current_time)
+
+        if self.sinks:
+            self._write_sinks("Subscriber", current_time, batch)
+
+    def get_latest_message(self, topic):
+        with self.lock:
+            return self.latest_messages.get(topic, "")
+
+
+class Requester:
+    """REQ client with one long-lived socket, driven by a single worker thread.
+
+    request() only queues the message; the worker sends queued requests one at a time over a
+    socket that stays connected while the address stays the same. If no reply arrives within
+    REQUEST_TIMEOUT_MS the socket is stuck in REQ's "waiting for reply" state, so it is closed
+    and a fresh one is connected for the next attempt (the Lazy Pirate pattern). The callback
+    gets (reply, round-trip ns), or (error text, None).
+    """
+
+    _instance = None
+    REQUEST_TIMEOUT_MS = 2000
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Requester, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.callback = None
+            cls._instance.address = ""  # Address the current socket is connected to
+            cls._instance.queue = queue.Queue()
+            cls._instance.thread = None
+            cls._instance.lock = threading.Lock()
+            cls._instance.reset_stats()
+        return cls._instance
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def reset_stats(self):
+        """Reset statistics (thread-safe)."""
+        with self.lock:
+            self.request_count = 0
+            self.reply_count = 0
+            self.timeout_count = 0
+            self.reconnect_count = 0  # Sockets recreated after a timeout
+            self.last_rtt = None
+            self.rtt = LatencyHistogram()
+
+    def request(self, message, address, retries=0):
+        """Queue a request. On timeout it is resent up to retries times on a new socket
+        (only safe for requests the server can handle twice)."""
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        self.queue.put((message, address, retries))
+
+    def stop(self):
+        """Stop the worker after the request in progress and close the socket."""
+        if self.thread and self.thread.is_alive():
+            # Drop requests that haven't started
+            try:
+                while True:
+                    self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.queue.put(None)
+            self.thread.join(timeout=self.REQUEST_TIMEOUT_MS / 1000 + 1.0)
+        self.thread = None
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            message, address, retries = item
+            result = ("Error: Timeout waiting for reply", None)
+            for attempt in range(retries + 1):
+                try:
+                    reply = self._request_once(message, address)
+                except zmq.ZMQError as e:
+                    self._close_socket()
+                    result = (f"Error: {e}", None)  # Resending would fail the same way
+                    break
+                if reply is not None:
+                    result = reply
+                    break
+                if attempt < retries:
+                    print(f"Requester: no reply from {address}, retrying ({attempt + 1}/{retries})")
+            if self.callback:
+                dispatch(self.callback, *result)
+        self._close_socket()
+
+    def _request_once(self, message, address):
+        """Send one request and wait for its reply. Returns (reply, round-trip ns), or None after a timeout."""
+        if self.socket is None or self.address != address:
+            self._close_socket()
+            self.socket = self.context.socket(zmq.REQ)
+            self.socket.setsockopt(zmq.LINGER, 0)
+            self.socket.connect(address)
+            self.address = address
+        with self.lock:
+            self.request_count += 1
+        start_ns = time.perf_counter_ns()
+        self.socket.send_string(message)
+        if self.socket.poll(self.REQUEST_TIMEOUT_MS):
+            reply = self.socket.recv_string()
+            rtt = time.perf_counter_ns() - start_ns
+            with self.lock:
+                self.reply_count += 1
+                self.last_rtt = rtt
+                self.rtt.record(rtt)
+            return reply, rtt
+
+        # No reply: this REQ socket can't send again until it receives, so replace it
+        self._close_socket()
+        with self.lock:
+            self.timeout_count += 1
+            self.reconnect_count += 1
+        return None
+
+    def _close_socket(self):
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+        self.address = ""
+
+    def get_stats(self):
+        """Request counts and round-trip times in ns (thread-safe)."""
+        with self.lock:
+            p50, p99 = self.rtt.percentiles((0.5, 0.99))
+            return {
+                "requests": self.request_count,
+                "replies": self.reply_count,
+                "timeouts": self.timeout_count,
+                "reconnects": self.reconnect_count,
+                "pending": self.queue.qsize(),
+                "rtt": {"last": self.last_rtt, "p50": p50, "p99": p99, "max": self.rtt.max_value, "mean": self.rtt.mean()},
+            }
+
+
+class RequestBenchmark:
+    """Drives N concurrent REQ or DEALER connections against one address from a single thread.
+
+    Every connection keeps exactly one request in flight: a reply is timed and the next request
+    goes out on the same socket straight away, so N is the concurrency the server sees. One
+    zmq.Poller serves all sockets, so connections cost a socket each rather than a thread. A
+    request without a reply after timeout_ms is counted as a timeout and its socket replaced, so a
+    late reply can't be taken for the next one. Round-trip times go into a LatencyHistogram.
+    """
+
+    _instance = None
+    SOCKET_TYPES = {"REQ": zmq.REQ, "DEALER": zmq.DEALER}
+    DEFAULT_TIMEOUT_MS = 2000
+    CHECK_INTERVAL_MS = 10  # Longest poll wait, so timeouts and stop() are noticed promptly
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RequestBenchmark, cls).__new__(cls)
+            cls._instance.running = False
+            cls._instance.thread = None
+            cls._instance.callback = None
+            cls._instance.lock = threading.Lock()
+            cls._instance.settings = {}
+            cls._instance._reset_stats()
+        return cls._instance
+
+    def _reset_stats(self):
+        self.sent = 0
+        self.replies = 0
+        self.timeouts = 0
+        self.reply_bytes = 0
+        self.start_time = None
+        self.end_time = None
+        self.finish_reason = None
+        self.latency = LatencyHistogram()
+
+    def start(self, address, connections, socket_type="REQ", duration=None, count=None, payload="", template=False, timeout_ms=None, callback=None):
+        """Start a run. Stops after duration seconds or count requests if given, otherwise on
+        stop(). callback(reason) is dispatched when the run ends on its own."""
+        if self.running:
+            return False, "Benchmark already running"
+        if socket_type not in self.SOCKET_TYPES:
+            return False, f"Unknown socket type: {socket_type}"
+        if connections < 1:
+            return False, "At least one connection is required"
+
+        self.template = None
+        if template:
+            try:
+                self.template = compile_template(payload)
+            except ValueError as e:
+                return False, f"Template error: {e}"
+            if self.template.is_static:
+                self.template = None
+
+        sockets = []
+        try:
+            for _ in range(connections):
+                sockets.append(self._connect(address, socket_type))
+        except zmq.ZMQError as e:
+            for socket in sockets:
+                socket.close()
+            return False, f"Connect error: {e}"
+
+        self.sockets = sockets
+        self.payload = payload.encode("utf-8")
+        self.settings = {
+            "address": address,
+            "socket_type": socket_type,
+            "connections": connections,
+            "duration": duration,
+            "count": count,
+            "payload_bytes": len(self.payload),
+            "template": self.template is not None,
+            "timeout_ms": timeout_ms or self.DEFAULT_TIMEOUT_MS,
+        }
+        self.callback = callback
+        self._reset_stats()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        print(f"Benchmark started: {connections} {socket_type} connection(s) to {address}")
+        return True, "Benchmark started"
+
+    def stop(self):
+        if not self.running:
+            return False, "Benchmark not running"
+        self.running = False
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
+        print(f"Benchmark stopped after {self.replies} replies")
+        return True, "Benchmark stopped"
+
+    def _connect(self, address, socket_type):
+        socket = get_context().socket(self.SOCKET_TYPES[socket_type])
+        socket.setsockopt(zmq.LINGER, 0)
+        try:
+            socket.connect(address)
+        except zmq.ZMQError:
+            socket.close()
+            raise
+        return socket
+
+    def _run(self):
+        settings = self.settings
+        address = settings["address"]
+        socket_type = settings["socket_type"]
+        envelope = [b""] if socket_type == "DEALER" else []  # REP and ROUTER peers expect the empty delimiter
+        timeout_ns = settings["timeout_ms"] * 1_000_000
+        count = settings["count"]
+        render = self.template.render if self.template else None
+        payload = self.payload
+        seq = 0
+        poller = zmq.Poller()
+        sent_at = {}  # Socket -> perf_counter_ns of its request in flight
+        finished_reason = None
+
+        self.start_time = time.perf_counter()
+        deadline = self.start_time + settings["duration"] if settings["duration"] else None
+        sent = 0
+
+        def send_next(socket):
+            nonlocal seq, sent
+            if count is not None and sent >= count:
+                return
+            frame = payload if render is None else render(seq).encode("utf-8")
+            seq += 1
+            socket.send_multipart(envelope + [frame])
+            sent_at[socket] = time.perf_counter_ns()
+            sent += 1
+
+        try:
+            for socket in self.sockets:
+                poller.register(socket, zmq.POLLIN)
+                send_next(socket)
+
+            while self.running:
+                events = poller.poll(self.CHECK_INTERVAL_MS)
+                rtts = []
+                reply_bytes = 0
+                timeouts = 0
+                for socket, _ in events:
+                    frames = socket.recv_multipart()
+                    now = time.perf_counter_ns()
+                    started = sent_at.pop(socket, None)
+                    if started is None:
+                        continue
+                    rtts.append(now - started)
+                    reply_bytes += len(frames[-1])
+                    send_next(socket)
+
+                # Replace sockets whose request went unanswered
+                now = time.perf_counter_ns()
+                for socket, started in list(sent_at.items()):
+                    if now - started > timeout_ns:
+                        del sent_at[socket]
+                        timeouts += 1
+                        poller.unregister(socket)
+                        socket.close()
+                        self.sockets.remove(socket)
+                        socket = self._connect(address, socket_type)
+                        self.sockets.append(socket)
+                        poller.register(socket, zmq.POLLIN)
+                        send_next(socket)
+
+                with self.lock:
+                    self.sent = sent
+                    self.replies += len(rtts)
+                    self.timeouts += timeouts
+                    self.reply_bytes += reply_bytes
+                    for rtt in rtts:
+                        self.latency.record(rtt)
+
+                if deadline is not None and time.perf_counter() >= deadline:
+                    finished_reason = "Duration reached"
+                    break
+                if not sent_at:
+                    finished_reason = "Count reached"  # Only happens once no more requests may be sent
+                    break
+        except zmq.ZMQError as e:
+            finished_reason = f"Error: {e}"
+        finally:
+            for socket in self.sockets:
+                socket.close()
+            self.sockets = []
+
+        self.end_time = time.perf_counter()
+        self.finish_reason = finished_reason or "Stopped"
+        if finished_reason is not None:
+            self.running = False
+            print(f"Benchmark finished ({finished_reason}) after {self.replies} replies")
+            if self.callback:
+                dispatch(self.callback, finished_reason)
+
+    def get_stats(self):
+        """Progress of the current or last run: counts, throughput and round-trip percentiles in ns."""
+        with self.lock:
+            if self.start_time is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self.end_time if self.end_time and not self.running else time.perf_counter()) - self.start_time
+            p50, p90, p99, p999 = self.latency.percentiles((0.5, 0.9, 0.99, 0.999))
+            return {
+                "running": self.running,
+                "sent": self.sent,
+                "replies": self.replies,
+                "timeouts": self.timeouts,
+                "bytes": self.reply_bytes,
+                "elapsed": elapsed,
+                "throughput": self.replies / elapsed if elapsed > 0 else 0.0,
+                "rtt": {"p50": p50, "p90": p90, "p99": p99, "p999": p999, "max": self.latency.max_value, "mean": self.latency.mean()},
+            }
+
+    def histogram(self):
+        """(low ns, high ns, count) of every non-empty round-trip bucket."""
+        with self.lock:
+            return self.latency.buckets()
+
+    def report(self):
+        """Settings, results and histogram of the current or last run as a JSON-serialisable dict."""
+        return {
+            "settings": dict(self.settings),
+            "finished": self.finish_reason,
+            "results": self.get_stats(),
+            "histogram": [{"low_ns": low, "high_ns": high, "count": bucket_count} for low, high, bucket_count in self.histogram()],
+        }
+
+
+class Replyer(TemplateMixin):
+    """REP socket. Requests are handed to the callback for a manual reply, or answered straight
+    from the reactor thread in auto-reply mode (for measuring how many requests/s clients manage)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Replyer, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.is_bound = False
+            cls._instance.address = ""
+            cls._instance.callback = None
+            cls._instance.awaiting_reply = False  # REP must answer before it can receive again
+            cls._instance.lock = threading.Lock()
+            cls._instance.auto_reply = None  # Encoded reply, or a MessageTemplate rendered per request
+            cls._instance.batch_size = DEFAULT_RECV_BATCH_SIZE
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window for instant rate
+            cls._instance.reset_stats()
+        return cls._instance
+
+    def reset_stats(self):
+        """Reset statistics (thread-safe)."""
+        with self.lock:
+            self.request_count = 0
+            self.reply_count = 0
+            self.last_request = None  # Raw bytes of the latest request
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+
+    def set_auto_reply(self, message, template=False):
+        """Answer every request with message (expanded per request if template) right in the
+        reactor thread, without calling the callback; None switches back to manual replies."""
+        if message is None:
+            self.auto_reply = None
+            return True, "Auto reply disabled"
+        reply = message.encode("utf-8")
+        if template:
+            try:
+                compiled = compile_template(message)
+            except ValueError as e:
+                return False, f"Template error: {e}"
+            if not compiled.is_static:
+                reply = compiled
+        self.auto_reply = reply
+        # A request may already be waiting for the user
+        with self.lock:
+            if self.awaiting_reply and self.socket:
+                try:
+                    self._send_auto_reply(self.socket)
+                    self.awaiting_reply = False
+                except zmq.ZMQError as e:
+                    print(f"Replyer send error: {e}")
+        return True, "Auto reply enabled"
+
+    def _send_auto_reply(self, socket):
+        reply = self.auto_reply
+        if not isinstance(reply, bytes):
+            seq = self.template_seq
+            self.template_seq = seq + 1
+            reply = reply.render(seq).encode("utf-8")
+        socket.send(reply)
+        self.reply_count += 1
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def bind(self, address):
+        """Bind the replyer socket to the specified address."""
+        if self.is_bound:
+            return False, "Replyer already bound"
+
+        try:
+            self.socket = self.context.socket(zmq.REP)
+            self.socket.bind(address)
+            self.address = address
+            self.running = True
+            self.is_bound = True
+            self.reset_stats()
+            Reactor().register(self.socket, self._on_readable, "Replyer")
+            print(f"Replyer bound to {address}")
+            return True, f"Replyer bound to {address}"
+        except zmq.ZMQError as e:
+            print(f"Replyer bind error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Bind error: {e}"
+
+    def unbind(self):
+        """Unbind the replyer socket."""
+        if not self.is_bound:
+            return False, "Replyer not bound"
+
+        self.running = False
+        self.is_bound = False
+
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        self.awaiting_reply = False
+
+        print(f"Replyer unbound from {self.address}")
+        return True, f"Replyer unbound from {self.address}"
+
+    def send_reply(self, message):
+        """Answer the pending request."""
+        with self.lock:
+            if not self.is_bound or not self.socket:
+                return False, "Replyer not bound"
+            if not self.awaiting_reply:
+                return False, "No request to reply to"
+
+            try:
+                self.socket.send_string(message)
+                self.awaiting_reply = False
+                self.reply_count += 1
+                return True, "Reply sent"
+            except zmq.ZMQError as e:
+                print(f"Replyer send error: {e}")
+                return False, f"Send error: {e}"
+
+    def _on_readable(self, socket):
+        # The REP socket only becomes readable again once the reply has been sent,
+        # so the reactor never has to block waiting for the user.
+        if self.auto_reply is not None:
+            self._auto_reply_batch(socket)
+            return
+        raw = socket.recv()
+        with self.lock:
+            self.awaiting_reply = True
+            self.request_count += 1
+            self.last_request = raw
+            self.rate.add(1, len(raw), time.time())
+        if self.callback:
+            dispatch(self.callback, raw.decode("utf-8", errors="replace"))
+
+    def _auto_reply_batch(self, socket):
+        """Answer up to batch_size queued requests back to back (REP alternates recv/send)."""
+        count = num_bytes = 0
+        raw = None
+        with self.lock:
+            try:
+                for _ in range(self.batch_size):
+                    raw = socket.recv(zmq.NOBLOCK)
+                    count += 1
+                    num_bytes += len(raw)
+                    if self.auto_reply is None:  # Switched to manual replies meanwhile
+                        self.awaiting_reply = True
+                        break
+                    try:
+                        self._send_auto_reply(socket)
+                    except zmq.ZMQError as e:
+                        # REP now owes this request a reply; leave it to send_reply() or re-enabling auto reply
+                        print(f"Replyer auto reply error: {e}")
+                        self.awaiting_reply = True
+                        break
+            except zmq.Again:
+                pass
+            except zmq.ZMQError as e:
+                print(f"Replyer auto reply error: {e}")
+            self.request_count += count
+            if raw is not None:
+                self.last_request = raw
+            self.rate.add(count, num_bytes, time.time())
+        if self.awaiting_reply and self.callback:
+            dispatch(self.callback, raw.decode("utf-8", errors="replace"))
+
+    def get_stats(self):
+        """Request/reply counts, instant request rate and the latest request (thread-safe)."""
+        with self.lock:
+            rate, speed = self.rate.rates(time.time())
+            return {
+                "requests": self.request_count,
+                "replies": self.reply_count,
+                "rate": rate,
+                "speed": speed,
+                "last_request": self.last_request,
+            }
+
+
+class Pusher(TemplateMixin):
+    """PUSH socket - sends messages to connected PULLers in round-robin fashion."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Pusher, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.port = ""
+            cls._instance.is_bound = False
+            cls._instance.lock = threading.Lock()
+        return cls._instance
+
+    def bind(self, port):
+        """Bind the pusher socket to the specified port."""
+        with self.lock:
+            if self.is_bound:
+                return False, "Pusher already bound"
+
+            try:
+                self.socket = self.context.socket(zmq.PUSH)
+                self.socket.bind(f"tcp://*:{port}")
+                self.port = port
+                self.is_bound = True
+                print(f"Pusher bound to port {port}")
+                return True, f"Pusher bound to port {port}"
+            except zmq.ZMQError as e:
+                print(f"Pusher bind error: {e}")
+                if self.socket:
+                    self.socket.close()
+                    self.socket = None
+                return False, f"Bind error: {e}"
+
+    def unbind(self):
+        """Unbind the pusher socket."""
+        with self.lock:
+            if not self.is_bound:
+                return False, "Pusher not bound"
+
+            try:
+                if self.socket:
+                    self.socket.close()
+                    self.socket = None
+                self.is_bound = False
+                print(f"Pusher unbound from port {self.port}")
+                return True, f"Pusher unbound from port {self.port}"
+            except Exception as e:
+                print(f"Pusher unbind error: {e}")
+                return False, f"Unbind error: {e}"
+
+    def send_message(self, message, template=False):
+        """Send a message to connected pullers. With template=True, placeholders are expanded first."""
+        if template:
+            success, message = self.render_template(message)
+            if not success:
+                return False, message
+        with self.lock:
+            if not self.is_bound or not self.socket:
+                return False, "Pusher not bound"
+
+            try:
+                self.socket.send_string(message)
+                print(f"Pushed: {message[:100]}...")
+                return True, "Message pushed"
+            except zmq.ZMQError as e:
+                print(f"Push error: {e}")
+                return False, f"Push error: {e}"
+
+    def send_raw(self, frames):
+        """Send pre-encoded frames without blocking or logging. Returns False if refused or not bound."""
+        with self.lock:
+            if not self.socket:
+                return False
+            try:
+                self.socket.send_multipart(frames, zmq.NOBLOCK)
+                return True
+            except zmq.ZMQError:
+                return False
+
+
+class Puller(SinkMixin, SequenceMixin):
+    """PULL socket - receives messages from PUSHers."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Puller, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.callback = None
+            cls._instance.lock = threading.Lock()
+            cls._instance.sequences = {}  # {stream: SequenceTracker} when a sequence source is set
+            # Internal state for throttled UI updates
+            cls._instance.message_count = 0
+            cls._instance.total_bytes = 0
+            cls._instance.start_time = None
+            cls._instance.latest_message = None
+            cls._instance.messages_buffer = MessageRing(1000)  # Recent (num, message) for display
+            # Sliding window for instant rate calculation
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window
+            cls._instance.rate = RateCounter(cls._instance.STATS_WINDOW_SEC)
+            cls._instance.batch_size = DEFAULT_RECV_BATCH_SIZE
+            cls._instance.wake_count = 0  # Reactor wake-ups that drained this socket
+        return cls._instance
+
+    def start(self, address, batch_size=DEFAULT_RECV_BATCH_SIZE):
+        """Start pulling messages from the specified address.
+
+        batch_size caps how many messages are drained per reactor wake-up.
+        """
+        self.stop()
+        self.batch_size = max(1, int(batch_size))
+
+        try:
+            self.socket = self.context.socket(zmq.PULL)
+            self.socket.connect(address)
+            self.running = True
+            self.message_count = 0
+            self.total_bytes = 0
+            self.start_time = time.time()
+            self.messages_buffer.clear()
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+            self.wake_count = 0
+            self.sequences = {}
+            self.latest_message = None
+            Reactor().register(self.socket, self._on_readable, "Puller")
+            print(f"Puller connected to {address}")
+            return True, f"Puller connected to {address}"
+        except zmq.ZMQError as e:
+            print(f"Puller connect error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Connection error: {e}"
+
+    def stop(self):
+        self.running = False
+        if self.socket:
+            Reactor().unregister(self.socket)
+            self.socket.close()
+            self.socket = None
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def _on_readable(self, socket):
+        # Drain a batch and decode it outside the lock
+        batch = drain_socket(socket.recv, self.batch_size)
+        sequence_reader = self.sequence_reader
+        received = []
+        for raw in batch:
+            message = raw.decode("utf-8", errors="replace")
+            # Parse JSON if possible
+            try:
+                msg_parsed = json.loads(message)
+            except json.JSONDecodeError:
+                msg_parsed = message
+            seq = None
+            if sequence_reader:
+                seq = sequence_reader.read([raw], 0, msg_parsed if isinstance(msg_parsed, (dict, list)) else None)
+            received.append((msg_parsed, len(raw), seq))
+
+        # Commit the whole batch under a single lock acquisition
+        with self.lock:
+            current_time = time.time()
+            self.wake_count += 1
+            batch_bytes = 0
+            for msg_parsed, msg_bytes, seq in received:
+                batch_bytes += msg_bytes
+                self.message_count += 1
+                self.total_bytes += msg_bytes
+                self.latest_message = msg_parsed
+                # Add to buffer (keep last N messages)
+                self.messages_buffer.append((self.message_count, msg_parsed))
+                if seq is not None:
+                    self._track_sequence("", seq)  # PULL/GATHER don't expose the sending peer
+            # Update sliding window for instant rate
+            self.rate.add(len(received), batch_bytes, current_time)
+
+        if self.sinks:
+            self._write_sinks("Puller", current_time, [[raw] for raw in batch])
+
+    def get_stats(self):
+        """Get current statistics including instant rates."""
+        with self.lock:
+            # Calculate instant rates from sliding window
+            instant_rate, instant_speed = self.rate.rates(time.time())
+
+            return {
+                "count": self.message_count,
+                "bytes": self.total_bytes,
+                "start_time": self.start_time,
+                "instant_rate": instant_rate,
+                "instant_speed": instant_speed,
+                "messages_per_wake": self.message_count / self.wake_count if self.wake_count else 0.0,
+                "sequence": self._sequence_totals(),
+            }
+
+    def get_new_messages(self, last_count):
+        """Get messages since last_count."""
+        with self.lock:
+            return self.messages_buffer.get_since(last_count)
+
+    def set_buffer_size(self, size):
+        """Set how many recent messages are kept for display."""
+        with self.lock:
+            self.messages_buffer.resize(max(1, int(size)))
+
+    def get_buffered_count(self):
+        """Number of messages currently held in the display buffer."""
+        with self.lock:
+            return len(self.messages_buffer)
+
+    def get_buffered_message(self, index):
+        """Get the (num, message) entry at index in the display buffer (oldest first), or None."""
+        with self.lock:
+            if 0 <= index < len(self.messages_buffer):
+                return self.messages_buffer[index]
+            return None
+
+    def reset_stats(self):
+        """Reset statistics and message buffer."""
+        with self.lock:
+            self.message_count = 0
+            self.total_bytes = 0
+            self.start_time = time.time()
+            self.messages_buffer.clear()
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+            self.wake_count = 0
+            self.sequences = {}
+            self.latest_message = None
+
+
+class Dealer(TemplateMixin, SinkMixin):
+    """DEALER socket - async REQ that can send multiple requests without waiting.
+
+    With correlation on, each request carries an id frame in front of the empty delimiter
+    ([id, b"", payload]). REP peers and ROUTERs that echo the envelope return it with the reply,
+    so the reply is matched to its request with one dict lookup. At most `window` requests are
+    in flight. The in-flight dict is kept in send order, so timed-out requests are expired from
+    its front. start_load() keeps the window full from the reactor thread.
+    """
+
+    _instance = None
+    CORRELATION_ID = struct.Struct(">Q")
+    DEFAULT_WINDOW = 100
+    DEFAULT_TIMEOUT_MS = 5000
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Dealer, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.is_connected = False
+            cls._instance.address = ""
+            cls._instance.callback = None
+            cls._instance.lock = threading.Lock()
+            cls._instance.batch_size = DEFAULT_RECV_BATCH_SIZE
+            cls._instance.correlate = False
+            cls._instance.window = cls.DEFAULT_WINDOW
+            cls._instance.timeout_ns = cls.DEFAULT_TIMEOUT_MS * 1_000_000
+            cls._instance.in_flight = collections.OrderedDict()  # Correlation id -> perf_counter_ns at send, oldest first
+            cls._instance.next_id = 1
+            cls._instance.loading = False
+            cls._instance.load_payload = None  # Encoded request, or a MessageTemplate rendered per request
+            cls._instance.load_remaining = None  # Requests left to send; None until stopped
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window for instant rate
+            cls._instance.reset_stats()
+        return cls._instance
+
+    def reset_stats(self):
+        """Reset statistics (thread-safe)."""
+        with self.lock:
+            self.sent_count = 0
+            self.reply_count = 0
+            self.timeout_count = 0
+            self.unmatched_count = 0  # Replies without a known correlation id (late, or not echoed)
+            self.last_rtt = None
+            self.last_reply = None  # Raw bytes of the latest reply
+            self.rtt = LatencyHistogram()
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+
+    def set_correlation(self, enabled, window=None, timeout_ms=None):
+        """Tag requests with a correlation id and track them, allowing at most window in flight."""
+        if window is not None and window < 1:
+            return False, "Window must be at least 1"
+        with self.lock:
+            self.loading = False
+            self.correlate = enabled
+            if window is not None:
+                self.window = window
+            if timeout_ms is not None:
+                self.timeout_ns = timeout_ms * 1_000_000
+            self.in_flight.clear()
+        self.reset_stats()
+        return True, "Correlation enabled" if enabled else "Correlation disabled"
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def connect(self, address):
+        """Connect to a ROUTER socket."""
+        self.disconnect()
+
+        try:
+            self.socket = self.context.socket(zmq.DEALER)
+            self.socket.setsockopt(zmq.LINGER, 0)
+            self.socket.connect(address)
+            self.address = address
+            self.running = True
+            self.is_connected = True
+            Reactor().register(self.socket, self._on_readable, "Dealer")
+            print(f"Dealer connected to {address}")
+            return True, f"Dealer connected to {address}"
+        except zmq.ZMQError as e:
+            print(f"Dealer connect error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Connection error: {e}"
+
+    def disconnect(self):
+        """Disconnect the dealer socket."""
+        self.running = False
+        self.is_connected = False
+        self.loading = False
+
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        self.in_flight.clear()
+
+        print(f"Dealer disconnected from {self.address}")
+        return True, f"Dealer disconnected"
+
+    def send(self, message, template=False):
+        """Send a message asynchronously. With template=True, placeholders are expanded first."""
+        if template:
+            success, message = self.render_template(message)
+            if not success:
+                return False, message
+        with self.lock:
+            if not self.is_connected or not self.socket:
+                return False, "Dealer not connected"
+
+            if self.correlate:
+                self._expire(time.perf_counter_ns())
+                if len(self.in_flight) >= self.window:
+                    return False, f"In-flight window full ({self.window} requests)"
+                try:
+                    self._send_tracked(message.encode("utf-8"))
+                    print(f"Dealer sent: {message[:100]}...")
+                    return True, "Message sent"
+                except zmq.ZMQError as e:
+                    print(f"Dealer send error: {e}")
+                    return False, f"Send error: {e}"
+
+            try:
+                # DEALER sends with empty delimiter frame
+                self.socket.send_multipart([b"", message.encode("utf-8")])
+                print(f"Dealer sent: {message[:100]}...")
+                return True, "Message sent"
+            except zmq.ZMQError as e:
+                print(f"Dealer send error: {e}")
+                return False, f"Send error: {e}"
+
+    def send_raw(self, frames):
+        """Send pre-encoded message frames (the empty delimiter is added) without blocking or logging."""
+        with self.lock:
+            if not self.socket:
+                return False
+            try:
+                self.socket.send_multipart([b""] + frames, zmq.NOBLOCK)
+                return True
+            except zmq.ZMQError:
+                return False
+
+    def start_load(self, message, count=None, template=False):
+        """Send message over and over, keeping the in-flight window full: every reply or timeout
+        frees a slot for the next request. Stops after count requests, or on stop_load()."""
+        if not self.correlate:
+            return False, "Correlation must be enabled for a load run"
+        payload = message.encode("utf-8")
+        if template:
+            try:
+                compiled = compile_template(message)
+            except ValueError as e:
+                return False, f"Template error: {e}"
+            if not compiled.is_static:
+                payload = compiled
+        with self.lock:
+            if not self.is_connected or not self.socket:
+                return False, "Dealer not connected"
+            self.load_payload = payload
+            self.load_remaining = count
+            self.loading = True
+            try:
+                self._refill()
+            except zmq.ZMQError as e:
+                self.loading = False
+                return False, f"Send error: {e}"
+        print(f"Dealer load started: window {self.window}, {count or 'unlimited'} request(s)")
+        return True, "Load started"
+
+    def stop_load(self):
+        """Stop sending new load requests; requests in flight are still matched."""
+        self.loading = False
+        return True, "Load stopped"
+
+    def _send_tracked(self, payload, flags=0):
+        """Send one correlated request (caller holds the lock)."""
+        request_id = self.CORRELATION_ID.pack(self.next_id)
+        self.next_id += 1
+        self.in_flight[request_id] = time.perf_counter_ns()
+        try:
+            self.socket.send_multipart([request_id, b"", payload], flags)
+        except zmq.ZMQError:
+            del self.in_flight[request_id]
+            raise
+        self.sent_count += 1
+
+    def _expire(self, now_ns):
+        """Count requests older than the timeout as timed out (caller holds the lock)."""
+        in_flight = self.in_flight
+        deadline = now_ns - self.timeout_ns
+        while in_flight:
+            request_id, started = next(iter(in_flight.items()))
+            if started > deadline:
+                break
+            del in_flight[request_id]
+            self.timeout_count += 1
+
+    def _refill(self):
+        """Send load requests until the window is full (caller holds the lock)."""
+        payload = self.load_payload
+        while self.loading and len(self.in_flight) < self.window:
+            if self.load_remaining is not None:
+                if self.load_remaining <= 0:
+                    if not self.in_flight:
+                        self.loading = False  # Every request answered or timed out
+                    return
+                self.load_remaining -= 1
+            if isinstance(payload, bytes):
+                frame = payload
+            else:
+                seq = self.template_seq
+                self.template_seq = seq + 1
+                frame = payload.render(seq).encode("utf-8")
+            try:
+                self._send_tracked(frame, zmq.NOBLOCK)
+            except zmq.Again:
+                if self.load_remaining is not None:
+                    self.load_remaining += 1
+                return  # High-water mark reached; retry on the next reply
+
+    def _on_readable(self, socket):
+        if self.correlate:
+            self._on_readable_correlated(socket)
+            return
+        parts = socket.recv_multipart()
+        if self.sinks:
+            self._write_sinks("Dealer", time.time(), [parts])
+        # DEALER receives with empty delimiter frame
+        if len(parts) >= 2:
+            message = parts[-1].decode("utf-8")
+        else:
+            message = parts[0].decode("utf-8") if parts else ""
+
+        if self.callback and message:
+            try:
+                msg_json = json.loads(message)
+                dispatch(self.callback, msg_json)
+            except json.JSONDecodeError:
+                dispatch(self.callback, message)
+
+    def _on_readable_correlated(self, socket):
+        """Drain a batch of replies, match them to their requests and refill a load run's window."""
+        with self.lock:
+            batch = drain_socket(socket.recv_multipart, self.batch_size)
+            now = time.perf_counter_ns()  # One clock read for the whole batch
+            in_flight = self.in_flight
+            rtt = self.rtt
+            num_bytes = 0
+            matched = 0
+            for parts in batch:
+                num_bytes += len(parts[-1])
+                started = in_flight.pop(parts[0], None) if len(parts) >= 3 else None
+                if started is None:
+                    self.unmatched_count += 1
+                    continue
+                self.last_rtt = now - started
+                rtt.record(self.last_rtt)
+                matched += 1
+            if batch:
+                self.last_reply = batch[-1][-1]
+            self.reply_count += matched
+            self.rate.add(len(batch), num_bytes, time.time())
+            self._expire(now)
+            loading = self.loading
+            if loading:
+                try:
+                    self._refill()
+                except zmq.ZMQError as e:
+                    # Don't let the error reach the reactor, which would drop the socket mid-run
+                    print(f"Dealer load error: {e}")
+                    self.loading = False
+        if batch and self.sinks:
+            self._write_sinks("Dealer", time.time(), batch)
+        if loading or not self.callback:
+            return  # Load runs are followed through get_stats()
+        for parts in batch:
+            message = parts[-1].decode("utf-8", errors="replace")
+            if message:
+                dispatch(self.callback, message)
+
+    def get_stats(self):
+        """Correlated request counts, round-trip times in ns and the latest reply (thread-safe).
+        Also expires timed-out requests, so a run with no replies at all still times out."""
+        with self.lock:
+            self._expire(time.perf_counter_ns())
+            if self.loading and self.socket:
+                try:
+                    self._refill()
+                except zmq.ZMQError as e:
+                    print(f"Dealer load error: {e}")
+                    self.loading = False
+            rate, speed = self.rate.rates(time.time())
+            p50, p99 = self.rtt.percentiles((0.5, 0.99))
+            return {
+                "correlate": self.correlate,
+                "loading": self.loading,
+                "sent": self.sent_count,
+                "replies": self.reply_count,
+                "timeouts": self.timeout_count,
+                "unmatched": self.unmatched_count,
+                "outstanding": len(self.in_flight),
+                "window": self.window,
+                "rate": rate,
+                "speed": speed,
+                "rtt": {"last": self.last_rtt, "p50": p50, "p99": p99, "max": self.rtt.max_value, "mean": self.rtt.mean()},
+                "last_reply": self.last_reply,
+            }
+
+
+def parse_reply_rules(text, template=False):
+    """Parse auto-reply rules, one "pattern => reply" per line, into [(regex or None, reply)].
+
+    pattern is a regular expression searched in the request payload; "*" (or nothing) matches
+    every request. Blank lines and lines starting with # are skipped. reply is encoded once, or
+    kept as a MessageTemplate when template is set and it has placeholders. Raises ValueError.
+    """
+    rules = []
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        pattern, separator, reply = line.partition("=>")
+        if not separator:
+            raise ValueError(f"Line {number}: expected 'pattern => reply'")
+        pattern = pattern.strip()
+        reply = reply.strip()
+        try:
+            regex = None if pattern in ("", "*") else re.compile(pattern.encode("utf-8"))
+        except re.error as e:
+            raise ValueError(f"Line {number}: bad pattern: {e}")
+        encoded = reply.encode("utf-8")
+        if template:
+            try:
+                compiled = compile_template(reply)
+            except ValueError as e:
+                raise ValueError(f"Line {number}: {e}")
+            if not compiled.is_static:
+                encoded = compiled
+        rules.append((regex, encoded))
+    return rules
+
+
+class RouterPeer:
+    """One DEALER/REQ peer of the Router: traffic counters and its unanswered requests, oldest first."""
+
+    MAX_PENDING = 10000  # Unanswered requests kept per peer; the oldest are dropped beyond this
+
+    __slots__ = ("identity", "messages", "bytes", "replies", "last_seen", "pending")
+
+    def __init__(self, identity):
+        self.identity = identity
+        self.messages = 0
+        self.bytes = 0
+        self.replies = 0
+        self.last_seen = 0.0
+        self.pending = collections.deque(maxlen=self.MAX_PENDING)  # (arrival number, envelope frames, payload)
+
+
+class Router(TemplateMixin, SinkMixin):
+    """ROUTER socket - async REP that can handle multiple clients.
+
+    Every peer identity gets a RouterPeer. Requests that aren't auto-replied are queued on their
+    peer, so a reply goes to the oldest request of the chosen peer (or the oldest request of any
+    peer) with that request's own envelope. With auto-reply rules the reactor thread answers
+    matching requests itself, a batch per wake-up. The socket is ROUTER_MANDATORY, so sending to
+    a peer that has gone away fails instead of being dropped silently, and the peer is forgotten.
+    Peers with nothing pending are also forgotten after peer_idle_sec without traffic, or, least
+    recently seen first, when the table grows beyond MAX_PEERS.
+    """
+
+    _instance = None
+    DEFAULT_PEER_IDLE_SEC = 300
+    MAX_PEERS = 10000
+    SWEEP_INTERVAL_SEC = 1.0  # How often the peer table is checked for peers to forget
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Router, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.is_bound = False
+            cls._instance.port = ""
+            cls._instance.callback = None
+            cls._instance.peers = {}  # {identity: RouterPeer}, in order of first contact
+            cls._instance.arrivals = 0  # Requests queued so far; orders pending requests across peers
+            cls._instance.current_identity = None  # Most recent sender with a queued request
+            cls._instance.rules = None  # Auto-reply rules from parse_reply_rules(), or None for manual replies
+            cls._instance.batch_size = DEFAULT_RECV_BATCH_SIZE
+            cls._instance.peer_idle_sec = cls.DEFAULT_PEER_IDLE_SEC  # 0 keeps silent peers until the table is full
+            cls._instance.last_sweep = 0.0
+            cls._instance.lock = threading.Lock()
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window for instant rate
+            cls._instance.reset_stats()
+        return cls._instance
+
+    def reset_stats(self):
+        """Reset statistics (thread-safe)."""
+        with self.lock:
+            self.request_count = 0
+            self.reply_count = 0
+            self.auto_reply_count = 0
+            self.dropped = 0  # Replies refused because the peer's queue was full
+            self.evicted = 0  # Peers forgotten for being idle or to keep the table within MAX_PEERS
+            self.last_request = None  # Raw bytes of the latest request
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def bind(self, port):
+        """Bind the router socket to the specified port."""
+        if self.is_bound:
+            return False, "Router already bound"
+
+        try:
+            self.socket = self.context.socket(zmq.ROUTER)
+            self.socket.setsockopt(zmq.ROUTER_MANDATORY, 1)
+            self.socket.bind(f"tcp://*:{port}")
+            self.port = port
+            self.running = True
+            self.is_bound = True
+            self.reset_stats()
+            Reactor().register(self.socket, self._on_readable, "Router")
+            print(f"Router bound to port {port}")
+            return True, f"Router bound to port {port}"
+        except zmq.ZMQError as e:
+            print(f"Router bind error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Bind error: {e}"
+
+    def unbind(self):
+        """Unbind the router socket."""
+        if not self.is_bound:
+            return False, "Router not bound"
+
+        self.running = False
+        self.is_bound = False
+
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        with self.lock:
+            self.peers = {}
+            self.current_identity = None
+
+        print(f"Router unbound from port {self.port}")
+        return True, f"Router unbound from port {self.port}"
+
+    def set_peer_idle_timeout(self, seconds):
+        """Forget peers with no pending request after seconds without traffic; 0 only caps the table."""
+        if seconds < 0:
+            return False, "Idle time can't be negative"
+        with self.lock:
+            self.peer_idle_sec = seconds
+            self.last_sweep = 0.0  # Apply on the next check
+        return True, f"Idle peers forgotten after {seconds}s" if seconds else "Idle peers kept"
+
+    def _forget_peer(self, peer):
+        """Drop peer and its queued requests from the table (caller holds the lock)."""
+        self.peers.pop(peer.identity, None)
+        if self.current_identity == peer.identity:
+            self.current_identity = None
+
+    def _sweep_peers(self, now):
+        """Forget idle peers and trim the table to MAX_PEERS, at most once per SWEEP_INTERVAL_SEC (caller holds the lock).
+
+        Peers with pending requests are kept so their requests can still be answered."""
+        if now - self.last_sweep < self.SWEEP_INTERVAL_SEC:
+            return
+        self.last_sweep = now
+        idle = [peer for peer in self.peers.values() if not peer.pending]
+        cutoff = now - self.peer_idle_sec if self.peer_idle_sec else 0.0
+        forget = [peer for peer in idle if peer.last_seen < cutoff]
+        excess = len(self.peers) - len(forget) - self.MAX_PEERS
+        if excess > 0:
+            recent = sorted((peer for peer in idle if peer.last_seen >= cutoff), key=lambda peer: peer.last_seen)
+            forget += recent[:excess]
+        for peer in forget:
+            self._forget_peer(peer)
+        self.evicted += len(forget)
+
+    def set_auto_reply_rules(self, text, template=False):
+        """Answer requests matching a rule (see parse_reply_rules) from the reactor thread, without
+        calling the callback; requests matching no rule still queue for a manual reply. None
+        switches back to manual replies. Queued requests that match are answered right away."""
+        if text is None:
+            self.rules = None
+            return True, "Auto reply disabled"
+        try:
+            rules = parse_reply_rules(text, template)
+        except ValueError as e:
+            return False, str(e)
+        if not rules:
+            return False, "No rules given"
+        with self.lock:
+            self.rules = rules
+            if self.socket:
+                for peer in list(self.peers.values()):
+                    unanswered = collections.deque(maxlen=RouterPeer.MAX_PENDING)
+                    for request in peer.pending:
+                        reply = self._match_rule(request[2])
+                        try:
+                            answered = reply is not None and self._send(peer, request[1], reply, zmq.NOBLOCK)
+                        except zmq.ZMQError as e:
+                            print(f"Router auto reply error: {e}")
+                            answered = False
+                        if answered:
+                            self.auto_reply_count += 1
+                        else:
+                            unanswered.append(request)
+                    peer.pending = unanswered
+        return True, f"Auto reply enabled ({len(rules)} rule(s))"
+
+    def _match_rule(self, payload):
+        """Encoded reply of the first rule matching payload, or None (caller holds the lock)."""
+        for regex, reply in self.rules:
+            if regex is None or regex.search(payload):
+                if not isinstance(reply, bytes):
+                    seq = self.template_seq
+                    self.template_seq = seq + 1
+                    reply = reply.render(seq).encode("utf-8")
+                return reply
+        return None
+
+    def _send(self, peer, envelope, payload, flags=0):
+        """Send envelope + payload to peer (caller holds the lock). Returns False if it couldn't go out."""
+        try:
+            self.socket.send_multipart(envelope + [payload], flags)
+        except zmq.Again:
+            self.dropped += 1
+            return False
+        except zmq.ZMQError as e:
+            if e.errno != zmq.EHOSTUNREACH:
+                raise
+            # The peer disconnected; forget it and its queued requests
+            self._forget_peer(peer)
+            return False
+        peer.replies += 1
+        self.reply_count += 1
+        return True
+
+    def _oldest_pending_peer(self):
+        """Peer holding the oldest unanswered request, or None (caller holds the lock)."""
+        oldest = None
+        for peer in self.peers.values():
+            if peer.pending and (oldest is None or peer.pending[0][0] < oldest.pending[0][0]):
+                oldest = peer
+        return oldest
+
+    def send_reply(self, message, identity=None):
+        """Answer the oldest unanswered request of the peer with this identity, or of all peers if
+        identity is None. A peer with nothing pending gets the message as an unsolicited reply."""
+        with self.lock:
+            if not self.is_bound or not self.socket:
+                return False, "Router not bound"
+
+            if identity is None:
+                peer = self._oldest_pending_peer() or self.peers.get(self.current_identity)
+                if peer is None:
+                    return False, "No client to reply to"
+            else:
+                peer = self.peers.get(identity)
+                if peer is None:
+                    return False, "Peer is no longer connected"
+
+            envelope = peer.pending[0][1] if peer.pending else [peer.identity, b""]
+            try:
+                if not self._send(peer, envelope, message.encode("utf-8"), zmq.NOBLOCK):
+                    return False, "Peer is not accepting messages (disconnected or queue full)"
+                if peer.pending:
+                    peer.pending.popleft()  # Answered; only now leave the queue
+                print(f"Router replied: {message[:100]}...")
+                return True, "Reply sent"
+            except zmq.ZMQError as e:
+                print(f"Router send error: {e}")
+                return False, f"Send error: {e}"
+
+    def broadcast(self, message):
+        """Send message to every known peer, answering each one's oldest unanswered request."""
+        with self.lock:
+            if not self.is_bound or not self.socket:
+                return False, "Router not bound"
+            if not self.peers:
+                return False, "No clients connected"
+
+            payload = message.encode("utf-8")
+            sent = 0
+            try:
+                for peer in list(self.peers.values()):
+                    envelope = peer.pending[0][1] if peer.pending else [peer.identity, b""]
+                    if self._send(peer, envelope, payload, zmq.NOBLOCK):
+                        sent += 1
+                        if peer.pending:
+                            peer.pending.popleft()
+            except zmq.ZMQError as e:
+                print(f"Router send error: {e}")
+                return False, f"Send error: {e}"
+        print(f"Router broadcast to {sent} peer(s): {message[:100]}...")
+        return True, f"Sent to {sent} peer(s)"
+
+    def _on_readable(self, socket):
+        manual = []
+        with self.lock:
+            batch = drain_socket(socket.recv_multipart, self.batch_size)
+            now = time.time()
+            peers = self.peers
+            num_bytes = 0
+            for parts in batch:
+                size = sum(len(part) for part in parts)
+                num_bytes += size
+                if len(parts) < 2:
+                    continue
+                # ROUTER receives: [identity, (envelope...), empty, message]
+                identity = parts[0]
+                peer = peers.get(identity)
+                if peer is None:
+                    peer = peers[identity] = RouterPeer(identity)
+                peer.messages += 1
+                peer.bytes += size
+                peer.last_seen = now
+                payload = parts[-1]
+                envelope = parts[:-1]
+                if self.rules is not None:
+                    reply = self._match_rule(payload)
+                    if reply is not None:
+                        try:
+                            answered = self._send(peer, envelope, reply, zmq.NOBLOCK)
+                        except zmq.ZMQError as e:
+                            print(f"Router auto reply error: {e}")
+                            answered = False
+                        if answered:
+                            self.auto_reply_count += 1
+                            continue
+                        if identity not in peers:
+                            continue  # Peer disconnected and was forgotten
+                        # Queue it so it can still be answered by hand or by a later rule
+                self.arrivals += 1
+                peer.pending.append((self.arrivals, envelope, payload))
+                self.current_identity = identity
+                manual.append(payload)
+            self.request_count += len(batch)
+            if batch:
+                self.last_request = batch[-1][-1]
+            self.rate.add(len(batch), num_bytes, now)
+            self._sweep_peers(now)
+        if batch and self.sinks:
+            self._write_sinks("Router", now, batch)
+
+        if self.callback:
+            for payload in manual:
+                message = payload.decode("utf-8", errors="replace")
+                if not message:
+                    continue
+                try:
+                    msg_json = json.loads(message)
+                    dispatch(self.callback, msg_json)
+                except json.JSONDecodeError:
+                    dispatch(self.callback, message)
+
+    def get_peers(self):
+        """Snapshot of the peer table in order of first contact (thread-safe)."""
+        with self.lock:
+            self._sweep_peers(time.time())
+            return [
+                {
+                    "identity": peer.identity,
+                    "messages": peer.messages,
+                    "bytes": peer.bytes,
+                    "replies": peer.replies,
+                    "pending": len(peer.pending),
+                    "last_seen": peer.last_seen,
+                    "oldest_request": peer.pending[0][2] if peer.pending else None,
+                }
+                for peer in self.peers.values()
+            ]
+
+    def get_stats(self):
+        """Request/reply counts, instant request rate, peer count and the latest request (thread-safe)."""
+        with self.lock:
+            now = time.time()
+            self._sweep_peers(now)
+            rate, speed = self.rate.rates(now)
+            return {
+                "requests": self.request_count,
+                "replies": self.reply_count,
+                "auto_replies": self.auto_reply_count,
+                "dropped": self.dropped,
+                "peers": len(self.peers),
+                "evicted": self.evicted,
+                "pending": sum(len(peer.pending) for peer in self.peers.values()),
+                "rate": rate,
+                "speed": speed,
+                "last_request": self.last_request,
+            }
+
+
+class PairSocket:
+    """PAIR socket - exclusive 1:1 bidirectional connection."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PairSocket, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.is_active = False
+            cls._instance.address = ""
+            cls._instance.mode = ""  # "bind" or "connect"
+            cls._instance.callback = None
+            cls._instance.lock = threading.Lock()
+        return cls._instance
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def bind(self, port):
+        """Bind the pair socket to the specified port."""
+        self.stop()
+
+        try:
+            self.socket = self.context.socket(zmq.PAIR)
+            self.socket.setsockopt(zmq.LINGER, 0)
+            self.socket.setsockopt(zmq.SNDTIMEO, 1000)  # 1 second send timeout
+            self.socket.bind(f"tcp://*:{port}")
+            self.address = f"tcp://*:{port}"
+            self.mode = "bind"
+            self.running = True
+            self.is_active = True
+            Reactor().register(self.socket, self._on_readable, "Pair")
+            print(f"Pair bound to port {port}")
+            return True, f"Pair bound to port {port}"
+        except zmq.ZMQError as e:
+            print(f"Pair bind error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Bind error: {e}"
+
+    def connect(self, address):
+        """Connect to another pair socket."""
+        self.stop()
+
+        try:
+            self.socket = self.context.socket(zmq.PAIR)
+            self.socket.setsockopt(zmq.LINGER, 0)
+            self.socket.setsockopt(zmq.SNDTIMEO, 1000)  # 1 second send timeout
+            self.socket.connect(address)
+            self.address = address
+            self.mode = "connect"
+            self.running = True
+            self.is_active = True
+            Reactor().register(self.socket, self._on_readable, "Pair")
+            print(f"Pair connected to {address}")
+            return True, f"Pair connected to {address}"
+        except zmq.ZMQError as e:
+            print(f"Pair connect error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Connection error: {e}"
+
+    def stop(self):
+        """Stop the pair socket."""
+        self.running = False
+        self.is_active = False
+
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+
+        print("Pair stopped")
+        return True, "Pair stopped"
+
+    def send(self, message):
+        """Send a message to the peer."""
+        with self.lock:
+            if not self.is_active or not self.socket:
+                return False, "Pair not active"
+
+            try:
+                self.socket.send_string(message)
+                print(f"Pair sent: {message[:100]}...")
+                return True, "Message sent"
+            except zmq.Again:
+                print("Pair send timeout: peer not connected or not ready")
+                return False, "Send timeout: peer not connected"
+            except zmq.ZMQError as e:
+                print(f"Pair send error: {e}")
+                return False, f"Send error: {e}"
+
+    def send_raw(self, frames):
+        """Send pre-encoded frames without blocking or logging. Returns False if refused or not active."""
+        with self.lock:
+            if not self.socket:
+                return False
+            try:
+                self.socket.send_multipart(frames, zmq.NOBLOCK)
+                return True
+            except zmq.ZMQError:
+                return False
+
+    def _on_readable(self, socket):
+        message = socket.recv_string()
+        if self.callback:
+            try:
+                msg_json = json.loads(message)
+                dispatch(self.callback, msg_json)
+            except json.JSONDecodeError:
+                dispatch(self.callback, message)
+
+
+class XPublisher:
+    """XPUB socket - like PUB but receives subscription messages from clients."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(XPublisher, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.port = ""
+            cls._instance.is_bound = False
+            cls._instance.running = False
+            cls._instance.subscription_callback = None
+            cls._instance.lock = threading.Lock()
+        return cls._instance
+
+    def set_subscription_callback(self, callback):
+        self.subscription_callback = callback
+
+    def bind(self, port):
+        """Bind the XPUB socket to the specified port."""
+        with self.lock:
+            if self.is_bound:
+                return False, "XPublisher already bound"
+
+            try:
+                self.socket = self.context.socket(zmq.XPUB)
+                self.socket.bind(f"tcp://*:{port}")
+                self.port = port
+                self.is_bound = True
+                self.running = True
+                Reactor().register(self.socket, self._on_readable, "XPublisher")
+                print(f"XPublisher bound to port {port}")
+                return True, f"XPublisher bound to port {port}"
+            except zmq.ZMQError as e:
+                print(f"XPublisher bind error: {e}")
+                if self.socket:
+                    self.socket.close()
+                    self.socket = None
+                return False, f"Bind error: {e}"
+
+    def unbind(self):
+        """Unbind the XPUB socket."""
+        with self.lock:
+            if not self.is_bound:
+                return False, "XPublisher not bound"
+
+            self.running = False
+            try:
+                if self.socket:
+                    Reactor().unregister(self.socket)
+                    self.socket.close()
+                    self.socket = None
+                self.is_bound = False
+                print(f"XPublisher unbound from port {self.port}")
+                return True, f"XPublisher unbound from port {self.port}"
+            except Exception as e:
+                print(f"XPublisher unbind error: {e}")
+                return False, f"Unbind error: {e}"
+
+    def send_message(self, topic, message):
+        """Send a message on the specified topic."""
+        with self.lock:
+            if not self.is_bound or not self.socket:
+                return False, "XPublisher not bound"
+
+            try:
+                self.socket.send_multipart([topic.encode("utf-8"), message.encode("utf-8")])
+                print(f"XPublished to {topic}: {message[:100]}...")
+                return True, "Message published"
+            except zmq.ZMQError as e:
+                print(f"XPublish error: {e}")
+                return False, f"Publish error: {e}"
+
+    def _on_readable(self, socket):
+        """Receive subscription events from clients."""
+        event = socket.recv()
+        # First byte: 1 = subscribe, 0 = unsubscribe
+        # Remaining bytes: topic
+        if len(event) > 0:
+            is_subscribe = event[0] == 1
+            topic = event[1:].decode("utf-8", errors="replace")
+            action = "subscribed" if is_subscribe else "unsubscribed"
+            if self.subscription_callback:
+                dispatch(self.subscription_callback, action, topic)
+
+
+class XSubscriber(SinkMixin):
+    """XSUB socket - like SUB but can send subscription messages."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(XSubscriber, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.callback = None
+            cls._instance.latest_messages = {}
+            cls._instance.topic_stats = {}  # Cumulative stats: {topic: {count, bytes, first_time, last_time}}
+            cls._instance.total_count = 0  # Cumulative totals across all topics
+            cls._instance.total_bytes = 0
+            cls._instance.dirty_topics = set()  # Topics that received messages since the last pop_dirty_topics()
+            cls._instance.lock = threading.Lock()
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window for instant rate
+            cls._instance.topic_rates = {}  # Sliding window: {topic: RateCounter}
+            cls._instance.total_rate = RateCounter(cls._instance.STATS_WINDOW_SEC)  # Sliding window across all topics
+            cls._instance.batch_size = DEFAULT_RECV_BATCH_SIZE
+            cls._instance.wake_count = 0  # Reactor wake-ups that drained this socket
+            cls._instance.wake_messages = 0  # Messages drained across those wake-ups
+        return cls._instance
+
+    def get_stats(self, topics=None):
+        """Get a copy of current statistics, optionally only for the given topics (thread-safe)."""
+        with self.lock:
+            current_time = time.time()
+            result = {}
+            for topic in self.topic_stats if topics is None else topics:
+                stats = self.topic_stats.get(topic)
+                if stats is None:
+                    continue
+                result[topic] = stats.copy()
+                # Calculate instant rate from sliding window
+                instant_rate, instant_speed = self.topic_rates[topic].rates(current_time)
+                result[topic]["instant_rate"] = instant_rate
+                result[topic]["instant_speed"] = instant_speed
+            return result
+
+    def get_instant_totals(self):
+        """Get instant rate totals across all topics (thread-safe)."""
+        with self.lock:
+            total_count, total_bytes = self.total_rate.totals(time.time())
+            messages_per_wake = self.wake_messages / self.wake_count if self.wake_count else 0.0
+            return {
+                "count": self.total_count,
+                "bytes": self.total_bytes,
+                "topics": len(self.topic_stats),
+                "instant_count": total_count,
+                "instant_bytes": total_bytes,
+                "messages_per_wake": messages_per_wake,
+            }
+
+    def get_messages(self, topics=None):
+        """Get a copy of latest messages as LazyMessage objects, optionally only for the given topics (thread-safe)."""
+        with self.lock:
+            if topics is None:
+                return dict(self.latest_messages)
+            return {topic: self.latest_messages[topic] for topic in topics if topic in self.latest_messages}
+
+    def pop_dirty_topics(self):
+        """Return the topics that received messages since the previous call, and clear the set (thread-safe)."""
+        with self.lock:
+            dirty = self.dirty_topics
+            self.dirty_topics = set()
+            return dirty
+
+    def reset_stats(self):
+        """Reset statistics (thread-safe)."""
+        with self.lock:
+            self.topic_stats = {}
+            self.total_count = 0
+            self.total_bytes = 0
+            self.dirty_topics = set()
+            self.topic_rates = {}
+            self.total_rate = RateCounter(self.STATS_WINDOW_SEC)
+            self.wake_count = 0
+            self.wake_messages = 0
+
+    def start(self, topics, address, batch_size=DEFAULT_RECV_BATCH_SIZE):
+        """Start subscribing to topics at the specified address.
+
+        batch_size caps how many messages are drained per reactor wake-up.
+        """
+        self.stop()
+        self.batch_size = max(1, int(batch_size))
+
+        try:
+            self.socket = self.context.socket(zmq.XSUB)
+            self.socket.connect(address)
+            # XSUB requires explicit subscription messages
+            for topic in topics:
+                # Send subscribe message: 0x01 + topic
+                self.socket.send(b"\x01" + topic.encode("utf-8"))
+
+            self.running = True
+            Reactor().register(self.socket, self._on_readable, "XSubscriber")
+            print(f"XSubscriber started on {address} for topics {topics}")
+            return True, f"XSubscribed to {len(topics)} topic(s)"
+        except zmq.ZMQError as e:
+            print(f"XSubscriber connect error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Connection error: {e}"
+
+    def stop(self):
+        self.running = False
+        if self.socket:
+            Reactor().unregister(self.socket)
+            self.socket.close()
+            self.socket = None
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def subscribe(self, topic):
+        """Subscribe to a new topic."""
+        with self.lock:
+            if self.socket:
+                try:
+                    self.socket.send(b"\x01" + topic.encode("utf-8"))
+                    return True
+                except zmq.ZMQError:
+                    return False
+        return False
+
+    def unsubscribe(self, topic):
+        """Unsubscribe from a topic."""
+        with self.lock:
+            if self.socket:
+                try:
+                    self.socket.send(b"\x00" + topic.encode("utf-8"))
+                    return True
+                except zmq.ZMQError:
+                    return False
+        return False
+
+    def _on_readable(self, socket):
+        # Drain a batch outside the lock; payloads stay raw until the UI displays them
+        batch = drain_socket(socket.recv_multipart, self.batch_size)
+        received = []
+        for parts in batch:
+            if len(parts) < 2:
+                continue
+            received.append((parts[0].decode("utf-8", errors="replace"), LazyMessage(parts[1])))
+
+        # Commit the whole batch under a single lock acquisition
+        with self.lock:
+            current_time = time.time()
+            self.wake_count += 1
+            self.wake_messages += len(received)
+            batch_bytes = 0
+            for topic, message in received:
+                msg_bytes = len(message)  # Wire length of the payload frame
+                batch_bytes += msg_bytes
+
+                # Store latest message
+                self.latest_messages[topic] = message
+
+                # Update cumulative statistics
+                if topic not in self.topic_stats:
+                    self.topic_stats[topic] = {"count": 0, "bytes": 0, "first_time": current_time, "last_time": current_time}
+                    self.topic_rates[topic] = RateCounter(self.STATS_WINDOW_SEC)
+                self.topic_stats[topic]["count"] += 1
+                self.topic_stats[topic]["bytes"] += msg_bytes
+                self.topic_stats[topic]["last_time"] = current_time
+
+                # Update sliding window for instant rate calculation
+                self.topic_rates[topic].add(1, msg_bytes, current_time)
+                self.dirty_topics.add(topic)
+            self.total_count += len(received)
+            self.total_bytes += batch_bytes
+            self.total_rate.add(len(received), batch_bytes, current_time)
+
+        if self.sinks:
+            self._write_sinks("XSubscriber", current_time, batch)
+
+
+class StreamSocket:
+    """STREAM socket - raw TCP connection for non-ZMQ peers."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(StreamSocket, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.is_active = False
+            cls._instance.address = ""
+            cls._instance.mode = ""  # "bind" or "connect"
+            cls._instance.callback = None
+            cls._instance.current_identity = None
+            cls._instance.lock = threading.Lock()
+        return cls._instance
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def bind(self, port):
+        """Bind the stream socket to accept raw TCP connections."""
+        self.stop()
+
+        try:
+            self.socket = self.context.socket(zmq.STREAM)
+            self.socket.bind(f"tcp://*:{port}")
+            self.address = f"tcp://*:{port}"
+            self.mode = "bind"
+            self.running = True
+            self.is_active = True
+            Reactor().register(self.socket, self._on_readable, "Stream")
+            print(f"Stream bound to port {port}")
+            return True, f"Stream bound to port {port}"
+        except zmq.ZMQError as e:
+            print(f"Stream bind error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Bind error: {e}"
+
+    def connect(self, address):
+        """Connect to a raw TCP server."""
+        self.stop()
+
+        try:
+            self.socket = self.context.socket(zmq.STREAM)
+            self.socket.connect(address)
+            self.address = address
+            self.mode = "connect"
+            self.running = True
+            self.is_active = True
+            # Get the routing identity for sending
+            self.socket.setsockopt(zmq.LINGER, 0)
+            Reactor().register(self.socket, self._on_readable, "Stream")
+            print(f"Stream connected to {address}")
+            return True, f"Stream connected to {address}"
+        except zmq.ZMQError as e:
+            print(f"Stream connect error: {e}")
+            if self.socket:
+                self.socket.close()
+                self.socket = None
+            return False, f"Connection error: {e}"
+
+    def stop(self):
+        """Stop the stream socket."""
+        self.running = False
+        self.is_active = False
+
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+
+        self.current_identity = None
+        print("Stream stopped")
+        return True, "Stream stopped"
+
+    def send(self, message):
+        """Send raw data to the peer."""
+        with self.lock:
+            if not self.is_active or not self.socket:
+                return False, "Stream not active"
+
+            if not self.current_identity:
+                return False, "No peer connected"
+
+            try:
+                # STREAM requires identity frame + data frame
+                self.socket.send(self.current_identity, zmq.SNDMORE)
+                self.socket.send_string(message)
+                print(f"Stream sent: {message[:100]}...")
+                return True, "Data sent"
+            except zmq.ZMQError as e:
+                print(f"Stream send error: {e}")
+                return False, f"Send error: {e}"
+
+    def _on_readable(self, socket):
+        # STREAM always receives: [identity, data]
+        identity = socket.recv()
+        data = socket.recv()
+
+        # Store identity for replies
+        if data:  # Non-empty data means actual message
+            with self.lock:
+                self.current_identity = identity
+
+            message = data.decode("utf-8", errors="replace")
+            if self.callback and message:
+                dispatch(self.callback, identity.hex()[:16], message)
+        elif identity and not data:
+            # Empty data with identity means connect/disconnect event
+            with self.lock:
+                if self.current_identity == identity:
+                    pass  # Keep identity on disconnect for now
+                else:
+                    self.current_identity = identity
+            if self.callback:
+                dispatch(self.callback, identity.hex()[:16], "[Connected]")
+
+
+class Client:
+    """CLIENT socket - thread-safe async request socket (draft API)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Client, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.callback = None
+        return cls._instance
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def connect(self, address):
+        self.disconnect()
+        try:
+            self.socket = self.context.socket(zmq.CLIENT)
+            self.socket.connect(address)
+            self.running = True
+            Reactor().register(self.socket, self._on_readable, "Client")
+            print(f"Client connected to {address}")
+            return True, f"Connected to {address}"
+        except zmq.ZMQError as e:
+            print(f"Client connect error: {e}")
+            return False, f"Connection error: {e}"
+
+    def disconnect(self):
+        self.running = False
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        return True, "Disconnected"
+
+    def send(self, message):
+        if not self.socket:
+            return False, "Not connected"
+        try:
+            self.socket.send_string(message)
+            print(f"Client sent: {message[:100]}...")
+            return True, "Message sent"
+        except zmq.ZMQError as e:
+            print(f"Client send error: {e}")
+            return False, f"Send error: {e}"
+
+    def _on_readable(self, socket):
+        message = socket.recv_string()
+        if self.callback:
+            dispatch(self.callback, message)
+
+
+class Server:
+    """SERVER socket - thread-safe async reply socket (draft API)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Server, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.callback = None
+            cls._instance.current_routing_id = None
+            cls._instance.lock = threading.Lock()
+        return cls._instance
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def bind(self, port):
+        self.unbind()
+        try:
+            self.socket = self.context.socket(zmq.SERVER)
+            self.socket.bind(f"tcp://*:{port}")
+            self.running = True
+            Reactor().register(self.socket, self._on_readable, "Server")
+            print(f"Server bound to port {port}")
+            return True, f"Bound to port {port}"
+        except zmq.ZMQError as e:
+            print(f"Server bind error: {e}")
+            return False, f"Bind error: {e}"
+
+    def unbind(self):
+        self.running = False
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        self.current_routing_id = None
+        return True, "Unbound"
+
+    def send_reply(self, message):
+        with self.lock:
+            if not self.socket:
+                return False, "Not bound"
+            if not self.current_routing_id:
+                return False, "No client to reply to"
+            try:
+                # Use send() with routing_id for SERVER socket
+                self.socket.send(message.encode("utf-8"), routing_id=self.current_routing_id)
+                print(f"Server sent reply: {message[:100]}...")
+                return True, "Reply sent"
+            except zmq.ZMQError as e:
+                print(f"Server send error: {e}")
+                return False, f"Send error: {e}"
+
+    def _on_readable(self, socket):
+        # Use recv() to get Frame with routing_id
+        frame = socket.recv(copy=False)
+        message = bytes(frame.buffer).decode("utf-8", errors="replace")
+        with self.lock:
+            self.current_routing_id = frame.routing_id
+        if self.callback:
+            dispatch(self.callback, message)
+
+
+class Radio(TemplateMixin):
+    """RADIO socket - UDP-like one-to-many with groups (draft API)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Radio, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.is_bound = False
+        return cls._instance
+
+    def bind(self, port):
+        self.unbind()
+        try:
+            self.socket = self.context.socket(zmq.RADIO)
+            self.socket.bind(f"tcp://*:{port}")
+            self.is_bound = True
+            print(f"Radio bound to port {port}")
+            return True, f"Bound to port {port}"
+        except zmq.ZMQError as e:
+            print(f"Radio bind error: {e}")
+            return False, f"Bind error: {e}"
+
+    def unbind(self):
+        if self.socket:
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        self.is_bound = False
+        return True, "Unbound"
+
+    def send_message(self, group, message, template=False):
+        if not self.socket or not self.is_bound:
+            return False, "Not bound"
+        if template:
+            success, message = self.render_template(message)
+            if not success:
+                return False, message
+        try:
+            # RADIO sends to a group
+            self.socket.send_string(message, group=group)
+            print(f"Radio sent to group '{group}': {message[:100]}...")
+            return True, "Message sent"
+        except zmq.ZMQError as e:
+            print(f"Radio send error: {e}")
+            return False, f"Send error: {e}"
+
+    def send_raw(self, frames):
+        """Send the last frame to the group named by the first frame (DEFAULT_REPLAY_GROUP for
+        single-frame messages) without blocking or logging. RADIO messages are single-part."""
+        socket = self.socket
+        if not socket:
+            return False
+        group = frames[0].decode("utf-8", errors="replace") if len(frames) > 1 else DEFAULT_REPLAY_GROUP
+        try:
+            socket.send(frames[-1], zmq.NOBLOCK, group=group)
+            return True
+        except zmq.ZMQError:
+            return False
+
+
+class Dish(SinkMixin, SequenceMixin):
+    """DISH socket - receives from RADIO groups (draft API)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Dish, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.callback = None
+            cls._instance.lock = threading.Lock()
+            cls._instance.sequences = {}  # {stream: SequenceTracker} when a sequence source is set
+            # Internal state for throttled UI updates
+            cls._instance.message_count = 0
+            cls._instance.total_bytes = 0
+            cls._instance.start_time = None
+            cls._instance.latest_message = None
+            cls._instance.latest_group = None
+            cls._instance.messages_buffer = MessageRing(50)  # Recent (num, group, message) for display
+            # Sliding window for instant rate calculation
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window
+            cls._instance.rate = RateCounter(cls._instance.STATS_WINDOW_SEC)
+            cls._instance.batch_size = DEFAULT_RECV_BATCH_SIZE
+            cls._instance.wake_count = 0  # Reactor wake-ups that drained this socket
+        return cls._instance
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def start(self, groups, address, batch_size=DEFAULT_RECV_BATCH_SIZE):
+        self.stop()
+        self.batch_size = max(1, int(batch_size))
+        try:
+            self.socket = self.context.socket(zmq.DISH)
+            self.socket.connect(address)
+            # Join groups
+            for group in groups:
+                if group:
+                    self.socket.join(group)
+            self.running = True
+            self.message_count = 0
+            self.total_bytes = 0
+            self.start_time = time.time()
+            self.messages_buffer.clear()
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+            self.wake_count = 0
+            self.sequences = {}
+            self.latest_message = None
+            self.latest_group = None
+            Reactor().register(self.socket, self._on_readable, "Dish")
+            print(f"Dish connected to {address}, joined groups: {groups}")
+            return True, f"Connected and joined groups: {groups}"
+        except zmq.ZMQError as e:
+            print(f"Dish start error: {e}")
+            return False, f"Connection error: {e}"
+
+    def stop(self):
+        self.running = False
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        return True, "Stopped"
+
+    def _on_readable(self, socket):
+        # Use recv() to get Frames with group info, draining a batch outside the lock
+        sequence_reader = self.sequence_reader
+        received = []
+        frames = []  # [group, payload] per message, for sinks
+        for frame in drain_socket(lambda flags: socket.recv(flags, copy=False), self.batch_size):
+            payload = frame.bytes
+            message = payload.decode("utf-8", errors="replace")
+            seq = sequence_reader.read([payload], 0) if sequence_reader else None
+            received.append((frame.group, message, len(payload), seq))
+            frames.append([frame.group.encode("utf-8"), payload])
+
+        # Commit the whole batch under a single lock acquisition
+        with self.lock:
+            current_time = time.time()
+            self.wake_count += 1
+            batch_bytes = 0
+            for group, message, msg_bytes, seq in received:
+                batch_bytes += msg_bytes
+                self.message_count += 1
+                self.total_bytes += msg_bytes
+                self.latest_message = message
+                self.latest_group = group
+                self.messages_buffer.append((self.message_count, group, message))
+                if seq is not None:
+                    self._track_sequence(group, seq)
+            # Update sliding window for instant rate
+            self.rate.add(len(received), batch_bytes, current_time)
+
+        if self.sinks:
+            self._write_sinks("Dish", current_time, frames)
+
+    def get_stats(self):
+        """Get current statistics including instant rates."""
+        with self.lock:
+            # Calculate instant rates from sliding window
+            instant_rate, instant_speed = self.rate.rates(time.time())
+
+            return {
+                "count": self.message_count,
+                "bytes": self.total_bytes,
+                "start_time": self.start_time,
+                "instant_rate": instant_rate,
+                "instant_speed": instant_speed,
+                "messages_per_wake": self.message_count / self.wake_count if self.wake_count else 0.0,
+                "sequence": self._sequence_totals(),
+            }
+
+    def get_new_messages(self, last_count):
+        """Get messages since last_count."""
+        with self.lock:
+            return self.messages_buffer.get_since(last_count)
+
+    def set_buffer_size(self, size):
+        """Set how many recent messages are kept for display."""
+        with self.lock:
+            self.messages_buffer.resize(max(1, int(size)))
+
+    def reset_stats(self):
+        """Reset statistics and message buffer."""
+        with self.lock:
+            self.message_count = 0
+            self.total_bytes = 0
+            self.start_time = time.time()
+            self.messages_buffer.clear()
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+            self.wake_count = 0
+            self.sequences = {}
+            self.latest_message = None
+            self.latest_group = None
+
+
+class Scatter(TemplateMixin):
+    """SCATTER socket - round-robin to all peers (draft API)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Scatter, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.is_bound = False
+        return cls._instance
+
+    def bind(self, port):
+        self.unbind()
+        try:
+            self.socket = self.context.socket(zmq.SCATTER)
+            self.socket.bind(f"tcp://*:{port}")
+            self.is_bound = True
+            print(f"Scatter bound to port {port}")
+            return True, f"Bound to port {port}"
+        except zmq.ZMQError as e:
+            print(f"Scatter bind error: {e}")
+            return False, f"Bind error: {e}"
+
+    def unbind(self):
+        if self.socket:
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        self.is_bound = False
+        return True, "Unbound"
+
+    def send_message(self, message, template=False):
+        if not self.socket or not self.is_bound:
+            return False, "Not bound"
+        if template:
+            success, message = self.render_template(message)
+            if not success:
+                return False, message
+        try:
+            self.socket.send_string(message)
+            print(f"Scatter sent: {message[:100]}...")
+            return True, "Message sent"
+        except zmq.ZMQError as e:
+            print(f"Scatter send error: {e}")
+            return False, f"Send error: {e}"
+
+    def send_raw(self, frames):
+        """Send the last frame without blocking or logging. SCATTER messages are single-part."""
+        socket = self.socket
+        if not socket:
+            return False
+        try:
+            socket.send(frames[-1], zmq.NOBLOCK)
+            return True
+        except zmq.ZMQError:
+            return False
+
+
+class Gather(SinkMixin, SequenceMixin):
+    """GATHER socket - fair-queued receive from all peers (draft API)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Gather, cls).__new__(cls)
+            cls._instance.context = get_context()
+            cls._instance.socket = None
+            cls._instance.running = False
+            cls._instance.callback = None
+            cls._instance.lock = threading.Lock()
+            cls._instance.sequences = {}  # {stream: SequenceTracker} when a sequence source is set
+            # Internal state for throttled UI updates
+            cls._instance.message_count = 0
+            cls._instance.total_bytes = 0
+            cls._instance.start_time = None
+            cls._instance.latest_message = None
+            cls._instance.messages_buffer = MessageRing(50)  # Recent (num, message) for display
+            # Sliding window for instant rate calculation
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window
+            cls._instance.rate = RateCounter(cls._instance.STATS_WINDOW_SEC)
+            cls._instance.batch_size = DEFAULT_RECV_BATCH_SIZE
+            cls._instance.wake_count = 0  # Reactor wake-ups that drained this socket
+        return cls._instance
+
+    def set_callback(self, callback):
+        self.callback = callback
+
+    def start(self, address, batch_size=DEFAULT_RECV_BATCH_SIZE):
+        self.stop()
+        self.batch_size = max(1, int(batch_size))
+        try:
+            self.socket = self.context.socket(zmq.GATHER)
+            self.socket.connect(address)
+            self.running = True
+            self.message_count = 0
+            self.total_bytes = 0
+            self.start_time = time.time()
+            self.messages_buffer.clear()
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+            self.wake_count = 0
+            self.sequences = {}
+            self.latest_message = None
+            Reactor().register(self.socket, self._on_readable, "Gather")
+            print(f"Gather connected to {address}")
+            return True, f"Connected to {address}"
+        except zmq.ZMQError as e:
+            print(f"Gather start error: {e}")
+            return False, f"Connection error: {e}"
+
+    def stop(self):
+        self.running = False
+        if self.socket:
+            Reactor().unregister(self.socket)
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+        return True, "Stopped"
+
+    def _on_readable(self, socket):
+        # Drain a batch and decode it outside the lock
+        batch = drain_socket(socket.recv, self.batch_size)
+        sequence_reader = self.sequence_reader
+        received = []
+        for raw in batch:
+            message = raw.decode("utf-8", errors="replace")
+            # Parse JSON if possible
+            try:
+                msg_parsed = json.loads(message)
+            except json.JSONDecodeError:
+                msg_parsed = message
+            seq = None
+            if sequence_reader:
+                seq = sequence_reader.read([raw], 0, msg_parsed if isinstance(msg_parsed, (dict, list)) else None)
+            received.append((msg_parsed, len(raw), seq))
+
+        # Commit the whole batch under a single lock acquisition
+        with self.lock:
+            current_time = time.time()
+            self.wake_count += 1
+            batch_bytes = 0
+            for msg_parsed, msg_bytes, seq in received:
+                batch_bytes += msg_bytes
+                self.message_count += 1
+                self.total_bytes += msg_bytes
+                self.latest_message = msg_parsed
+                self.messages_buffer.append((self.message_count, msg_parsed))
+                if seq is not None:
+                    self._track_sequence("", seq)  # PULL/GATHER don't expose the sending peer
+            # Update sliding window for instant rate
+            self.rate.add(len(received), batch_bytes, current_time)
+
+        if self.sinks:
+            self._write_sinks("Gather", current_time, [[raw] for raw in batch])
+
+    def get_stats(self):
+        """Get current statistics including instant rates."""
+        with self.lock:
+            # Calculate instant rates from sliding window
+            instant_rate, instant_speed = self.rate.rates(time.time())
+
+            return {
+                "count": self.message_count,
+                "bytes": self.total_bytes,
+                "start_time": self.start_time,
+                "instant_rate": instant_rate,
+                "instant_speed": instant_speed,
+                "messages_per_wake": self.message_count / self.wake_count if self.wake_count else 0.0,
+                "sequence": self._sequence_totals(),
+            }
+
+    def get_new_messages(self, last_count):
+        """Get messages since last_count."""
+        with self.lock:
+            return self.messages_buffer.get_since(last_count)
+
+    def set_buffer_size(self, size):
+        """Set how many recent messages are kept for display."""
+        with self.lock:
+            self.messages_buffer.resize(max(1, int(size)))
+
+    def reset_stats(self):
+        """Reset statistics and message buffer."""
+        with self.lock:
+            self.message_count = 0
+            self.total_bytes = 0
+            self.start_time = time.time()
+            self.messages_buffer.clear()
+            self.rate = RateCounter(self.STATS_WINDOW_SEC)
+            self.wake_count = 0
+            self.sequences = {}
+            self.latest_message = None
+
+
+class ReplayEngine:
+    """Background thread that sends a recorded capture through one of the sending sockets.
+
+    speed scales the recorded inter-message gaps (1.0 = original timing, 10.0 = ten times
+    faster, 0 = as fast as possible). Each message is due at start + (recv_time - first) / speed
+    on the perf_counter_ns clock: the thread sleeps until shortly before the next one is due and
+    spins for the rest, and when it falls behind it sends every message already due in one
+    batch instead of sleeping. How late each message went out is recorded as schedule drift.
+    """
+
+    _instance = None
+    # Target name -> (engine class, attribute that is True while the socket can send)
+    TARGETS = {
+        "Publisher": (Publisher, "is_bound"),
+        "Pusher": (Pusher, "is_bound"),
+        "Dealer": (Dealer, "is_connected"),
+        "Scatter": (Scatter, "is_bound"),
+        "Radio": (Radio, "is_bound"),
+        "Pair": (PairSocket, "is_active"),
+    }
+    MAX_BATCH = 1024  # Messages sent between bookkeeping/stop checks
+    SPIN_NS = 200_000  # Busy-wait the last 200 us before a message is due instead of sleeping
+    LATE_NS = 1_000_000  # Messages sent more than 1 ms after their due time count as late
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ReplayEngine, cls).__new__(cls)
+            cls._instance.running = False
+            cls._instance.thread = None
+            cls._instance.reader = None
+            cls._instance.target = ""
+            cls._instance.callback = None
+            cls._instance.lock = threading.Lock()
+            cls._instance.STATS_WINDOW_SEC = 1.0  # 1 second sliding window for instant rate
+            cls._instance._reset_stats()
+        return cls._instance
+
+    def _reset_stats(self):
+        self.sent = 0
+        self.dropped = 0  # Sends refused with zmq.Again
+        self.sent_bytes = 0
+        self.total = 0
+        self.position = 0  # Messages of the capture handled so far
+        self.start_time = None
+        self.end_time = None
+        self.late = 0
+        self.last_drift = 0
+        self.drift = LatencyHistogram()
+        self.rate_counter = RateCounter(self.STATS_WINDOW_SEC)
+
+    def start(self, path, target, speed=1.0, start_index=0, callback=None):
+        """Replay the capture at path through target (a TARGETS name) from record start_index.
+        callback(message) is dispatched when the replay ends on its own."""
+        if self.running:
+            return False, "Replay already running"
+        if target not in self.TARGETS:
+            return False, f"Unknown replay target: {target}"
+        engine_class, ready_attribute = self.TARGETS[target]
+        if not getattr(engine_class(), ready_attribute):
+            return False, f"{target} is not bound/connected"
+        if speed < 0:
+            return False, "Speed must be positive (0 for max speed)"
+        try:
+            reader = CaptureReader(path)
+        except (OSError, ValueError) as e:
+            return False, f"Cannot open capture: {e}"
+        if start_index >= len(reader):
+            reader.close()
+            return False, "Nothing to replay"
+
+        self.reader = reader
+        self.target = target
+        self.speed = speed
+        self.start_index = max(0, start_index)
+        self.callback = callback
+        self._reset_stats()
+        self.total = len(reader) - self.start_index
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        print(f"Replaying {self.total} messages from {path} through {target} at {f'x{speed:g}' if speed else 'max speed'}")
+        return True, "Replay started"
+
+    def stop(self):
+        if not self.running:
+            return False, "Replay not running"
+        self.running = False
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
+        print(f"Replay stopped after {self.sent} messages")
+        return True, "Replay stopped"
+
+    @staticmethod
+    def message_frames(source, frames):
+        """Frames to resend for a captured message: without the DEALER/ROUTER envelope and without
+        a trailing latency frame (Publisher adds a fresh one if Stamp Latency is on)."""
+        if source in ("Dealer", "Router") and b"" in frames:
+            frames = frames[frames.index(b"") + 1 :]
+        if len(frames) > 1 and len(frames[-1]) == LATENCY_HEADER.size and frames[-1][:4] == LATENCY_MAGIC:
+            frames = frames[:-1]
+        return frames
+
+    def _run(self):
+        reader = self.reader
+        engine_class, ready_attribute = self.TARGETS[self.target]
+        engine = engine_class()
+        send_raw = engine.send_raw
+        entry = reader.entry
+        speed = self.speed
+        index = self.start_index
+        end = len(reader)
+        first_ns = entry(index)[1]
+        finished_message = None
+
+        self.start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
+
+        while self.running:
+            if index >= end:
+                finished_message = "Replay complete"
+                break
+            now = time.perf_counter_ns()
+            if speed:
+                wait = start_ns + int((entry(index)[1] - first_ns) / speed) - now
+                if wait > 0:
+                    if wait > self.SPIN_NS:
+                        time.sleep((wait - self.SPIN_NS) / 1e9)
+                    continue
+
+            # Everything already due goes out back to back
+            sent = dropped = sent_bytes = late = 0
+            drift = 0
+            batch_end = min(index + self.MAX_BATCH, end)
+            while index < batch_end:
+                ts_ns, source, frames = reader.record(index)
+                if speed:
+                    drift = now - start_ns - int((ts_ns - first_ns) / speed)
+                    if drift < 0:
+                        break  # Not due yet
+                    self.drift.record(drift)
+                    if drift > self.LATE_NS:
+                        late += 1
+                frames = self.message_frames(source, frames)
+                index += 1
+                if not frames:
+                    continue
+                if send_raw(frames):
+                    sent += 1
+                    sent_bytes += sum(len(frame) for frame in frames)
+                else:
+                    dropped += 1
+
+            with self.lock:
+                self.sent += sent
+                self.dropped += dropped
+                self.sent_bytes += sent_bytes
+                self.late += late
+                self.last_drift = max(drift, 0)
+                self.position = index - self.start_index
+                self.rate_counter.add(sent, sent_bytes, time.time())
+
+            if not getattr(engine, ready_attribute):
+                finished_message = f"{self.target} closed"
+                break
+
+        self.end_time = time.perf_counter()
+        reader.close()
+        if finished_message is not None:
+            self.running = False
+            print(f"Replay finished ({finished_message}) after {self.sent} messages")
+            if self.callback:
+                dispatch(self.callback, finished_message)
+
+    def get_stats(self):
+        """Progress of the current or last replay: counts, rates and schedule drift (ns)."""
+        with self.lock:
+            if self.start_time is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self.end_time if self.end_time and not self.running else time.perf_counter()) - self.start_time
+            instant_count, instant_bytes = self.rate_counter.rates(time.time())
+            p50, p99 = self.drift.percentiles((0.5, 0.99))
+            return {
+                "running": self.running,
+                "target": self.target,
+                "position": self.position,
+                "total": self.total,
+                "sent": self.sent,
+                "dropped": self.dropped,
+                "bytes": self.sent_bytes,
+                "elapsed": elapsed,
+                "instant_rate": instant_count,
+                "instant_bytes": instant_bytes,
+                "drift": {"current": self.last_drift, "p50": p50, "p99": p99, "max": self.drift.max_value, "late": self.late},
+            }
+
+
+# --- Formatting Helpers ---
+
+
+def format_bytes(num_bytes):
+    """Format bytes to human readable string."""
+    if num_bytes >= 1024 * 1024:
+        return f"{num_bytes / (1024 * 1024):.2f} MB"
+    elif num_bytes >= 1024:
+        return f"{num_bytes / 1024:.2f} KB"
+    else:
+        return f"{num_bytes} bytes"
+
+
+def format_speed(bytes_per_sec):
+    """Format bytes/sec to human readable string."""
+    if bytes_per_sec >= 1024 * 1024:
+        return f"{bytes_per_sec / (1024 * 1024):.2f} MB/s"
+    elif bytes_per_sec >= 1024:
+        return f"{bytes_per_sec / 1024:.2f} KB/s"
+    else:
+        return f"{bytes_per_sec:.2f} B/s"
+
+
+def format_duration_ns(nanoseconds):
+    """Format a nanosecond duration to human readable string."""
+    if nanoseconds >= 1_000_000_000:
+        return f"{nanoseconds / 1e9:.2f} s"
+    elif nanoseconds >= 1_000_000:
+        return f"{nanoseconds / 1e6:.2f} ms"
+    elif nanoseconds >= 1_000:
+        return f"{nanoseconds / 1e3:.1f} us"
+    else:
+        return f"{nanoseconds} ns"
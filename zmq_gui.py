@@ -0,0 +1,4692 @@
+import json
+import os
+import sqlite3
+import sys
+import time
+import wx
+import wx.dataview
+
+from zmq_capture import CODECS, DEFAULT_BLOCK_SIZE, CaptureReader, CaptureWriter
+from zmq_store import MessageQuery, SqliteSink
+from zmq_engine import (
+    CONFIG_BENCH_CONNECTIONS_KEY,
+    CONFIG_BENCH_DURATION_KEY,
+    CONFIG_BENCH_SOCKET_TYPE_KEY,
+    CONFIG_CAPTURE_BLOCK_SIZE_KEY,
+    CONFIG_CAPTURE_COMPRESSION_KEY,
+    CONFIG_CAPTURE_DIR_KEY,
+    CONFIG_CLIENT_ADDRESS_KEY,
+    CONFIG_DEALER_ADDRESS_KEY,
+    CONFIG_DEALER_TIMEOUT_KEY,
+    CONFIG_DEALER_WINDOW_KEY,
+    CONFIG_DISH_ADDRESS_KEY,
+    CONFIG_DISH_BUFFER_SIZE_KEY,
+    CONFIG_DISH_GROUP_KEY,
+    CONFIG_DISH_SEQUENCE_KEY,
+    CONFIG_DISPLAY_MAX_CHARS_KEY,
+    CONFIG_GATHER_ADDRESS_KEY,
+    CONFIG_GATHER_BUFFER_SIZE_KEY,
+    CONFIG_GATHER_SEQUENCE_KEY,
+    CONFIG_LOADGEN_PAYLOAD_SIZE_KEY,
+    CONFIG_LOADGEN_RATE_KEY,
+    CONFIG_LOADGEN_TOPICS_KEY,
+    CONFIG_PAIR_ADDRESS_KEY,
+    CONFIG_PAIR_MODE_KEY,
+    CONFIG_PUBLISHER_PORT_KEY,
+    CONFIG_PUBLISHER_TOPIC_KEY,
+    CONFIG_PULLER_ADDRESS_KEY,
+    CONFIG_PULLER_BUFFER_SIZE_KEY,
+    CONFIG_PULLER_SEQUENCE_KEY,
+    CONFIG_PUSHER_PORT_KEY,
+    CONFIG_RADIO_GROUP_KEY,
+    CONFIG_RADIO_PORT_KEY,
+    CONFIG_RECENT_SENT_MSGS_CLIENT_KEY,
+    CONFIG_RECENT_SENT_MSGS_DEALER_KEY,
+    CONFIG_RECENT_SENT_MSGS_PAIR_KEY,
+    CONFIG_RECENT_SENT_MSGS_PUB_KEY,
+    CONFIG_RECENT_SENT_MSGS_PUSH_KEY,
+    CONFIG_RECENT_SENT_MSGS_RADIO_KEY,
+    CONFIG_RECENT_SENT_MSGS_REP_KEY,
+    CONFIG_RECENT_SENT_MSGS_REQ_KEY,
+    CONFIG_RECENT_SENT_MSGS_ROUTER_KEY,
+    CONFIG_RECENT_SENT_MSGS_SCATTER_KEY,
+    CONFIG_RECENT_SENT_MSGS_SERVER_KEY,
+    CONFIG_RECENT_SENT_MSGS_STREAM_KEY,
+    CONFIG_RECENT_SENT_MSGS_XPUB_KEY,
+    CONFIG_RECV_BATCH_SIZE_KEY,
+    CONFIG_REPLAY_SPEED_KEY,
+    CONFIG_REPLAY_TARGET_KEY,
+    CONFIG_REPLYER_ADDRESS_KEY,
+    CONFIG_REQUESTER_ADDRESS_KEY,
+    CONFIG_ROUTER_PEER_IDLE_KEY,
+    CONFIG_ROUTER_PORT_KEY,
+    CONFIG_ROUTER_RULES_KEY,
+    CONFIG_SCATTER_PORT_KEY,
+    CONFIG_SERVER_PORT_KEY,
+    CONFIG_STREAM_ADDRESS_KEY,
+    CONFIG_STREAM_MODE_KEY,
+    CONFIG_SUBSCRIBER_ADDRESS_KEY,
+    CONFIG_SUBSCRIBER_SEQUENCE_KEY,
+    CONFIG_SUBSCRIBER_TOPICS_KEY,
+    CONFIG_XPUB_PORT_KEY,
+    CONFIG_XSUB_ADDRESS_KEY,
+    DEFAULT_DISPLAY_MAX_CHARS,
+    DEFAULT_RECV_BATCH_SIZE,
+    Client,
+    Config,
+    Dealer,
+    Dish,
+    format_bytes,
+    format_duration_ns,
+    format_speed,
+    Gather,
+    LazyMessage,
+    LoadGenerator,
+    PairSocket,
+    Publisher,
+    Puller,
+    Pusher,
+    Radio,
+    Reactor,
+    ReplayEngine,
+    Replyer,
+    RequestBenchmark,
+    Requester,
+    Router,
+    Scatter,
+    Server,
+    set_dispatcher,
+    WxDispatcher,
+    StreamSocket,
+    Subscriber,
+    XPublisher,
+    XSubscriber,
+)
+
+# --- UI Utility Functions ---
+
+
+TEMPLATE_TOOLTIP = (
+    "Expand placeholders in every sent message: {seq} (sequence number), {ts_ns} (epoch ns), "
+    "{ts} (epoch seconds), {rand:N} (N random hex digits). Write {{seq}} for a literal {seq}."
+)
+
+
+SEQUENCE_TOOLTIP = (
+    "Track lost, out-of-order and duplicate messages. frame:N reads the sequence number from frame N "
+    "(negative counts from the end, e.g. frame:-1 for the Stamp Latency frame); json:a.b reads a JSON field. "
+    "Leave empty to disable."
+)
+
+
+RULES_TOOLTIP = (
+    "One rule per line: pattern => reply. pattern is a regular expression searched in the request; * matches any request. "
+    "The first matching rule answers; requests matching no rule wait for a manual reply. Lines starting with # are ignored."
+)
+
+
+def format_identity(identity):
+    """Peer identity as text if printable, otherwise as hex (ZeroMQ's generated identities are binary)."""
+    if identity.isascii() and identity.decode("ascii").isprintable():
+        return identity.decode("ascii")
+    return "0x" + identity.hex()
+
+
+def format_sequence_stats(sequence):
+    """Short 'lost / out-of-order / duplicates' summary for a sequence counters dict."""
+    if not sequence:
+        return "-"
+    return f"{sequence['lost']} / {sequence['out_of_order']} / {sequence['duplicates']}"
+
+
+def group_histogram(buckets):
+    """Merge (low, high, count) latency buckets into (low, high, count) rows, one per power of two."""
+    groups = {}
+    for _, high, count in buckets:
+        bits = high.bit_length()
+        groups[bits] = groups.get(bits, 0) + count
+    return [((1 << bits) >> 1, (1 << bits) - 1, count) for bits, count in sorted(groups.items())]
+
+
+def format_json_message(message):
+    """Format a message, pretty-printing JSON if valid."""
+    try:
+        if isinstance(message, dict):
+            return json.dumps(message, indent=2)
+        elif isinstance(message, str):
+            parsed = json.loads(message)
+            return json.dumps(parsed, indent=2)
+        else:
+            return str(message)
+    except json.JSONDecodeError:
+        return str(message)
+
+
+def to_single_line(msg):
+    """Convert a message to single line for display."""
+    return " ".join(msg.split())
+
+
+def append_capped_text(text_ctrl, text, max_chars):
+    """Append text to a multi-line TextCtrl, dropping whole lines from the top beyond max_chars.
+
+    Cost per call depends on the appended text, not on everything displayed so far. Trimming
+    removes an extra 10% so it does not have to run on every append.
+    """
+    text_ctrl.AppendText(text)
+    length = text_ctrl.GetLastPosition()
+    if length > max_chars:
+        cut = length - int(max_chars * 0.9)
+        # Extend the cut to the end of its line so the first visible line is complete
+        newline = text_ctrl.GetRange(cut, min(length, cut + 1000)).find("\n")
+        if newline >= 0:
+            cut += newline + 1
+        text_ctrl.Remove(0, cut)
+
+
+class VirtualListCtrl(wx.ListCtrl):
+    """Report list that renders rows on demand from get_row(index) instead of storing them.
+
+    Only the visible rows are ever formatted, so memory and paint time do not depend on
+    how many rows the list has. get_row returns a sequence of column strings, or None.
+    """
+
+    def __init__(self, parent, columns, get_row, follow_tail=False):
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL)
+        for col, (label, width) in enumerate(columns):
+            self.InsertColumn(col, label, width=width)
+        self.get_row = get_row
+        self.follow_tail = follow_tail  # Keep the newest row in view while scrolled to the bottom
+        self._cached_index = -1
+        self._cached_row = None
+
+    def OnGetItemText(self, item, col):
+        # Called once per cell; fetch each row only once
+        if item != self._cached_index:
+            self._cached_row = self.get_row(item)
+            self._cached_index = item
+        row = self._cached_row
+        return row[col] if row is not None and col < len(row) else ""
+
+    def update_rows(self, count):
+        """Set the row count and repaint the rows currently in view."""
+        self._cached_index = -1
+        old_count = self.GetItemCount()
+        at_bottom = self.GetTopItem() + self.GetCountPerPage() >= old_count
+        if count != old_count:
+            self.SetItemCount(count)
+            if self.follow_tail and at_bottom and count:
+                self.EnsureVisible(count - 1)
+        if count:
+            top = self.GetTopItem()
+            self.RefreshItems(top, min(count - 1, top + self.GetCountPerPage()))
+
+
+class RecentMessagesMixin:
+    """Mixin class providing recent messages functionality for panels with send capability."""
+
+    def setup_recent_messages(self, recent_msgs_key, msg_txt_ctrl, recent_list_ctrl):
+        """Initialize recent messages functionality. Call this in __init__."""
+        self.recent_msgs_key = recent_msgs_key
+        self.msg_txt = msg_txt_ctrl
+        self.recent_list = recent_list_ctrl
+        self.recent_messages = []
+
+        # Bind events
+        self.recent_list.Bind(wx.EVT_LISTBOX_DCLICK, self._on_recent_selected)
+        self.recent_list.Bind(wx.EVT_RIGHT_DOWN, self._on_recent_right_click)
+
+        # Load saved messages
+        self._load_recent_messages()
+
+    def _load_recent_messages(self):
+        """Load recent messages from config."""
+        msgs = Config.get_list(self.recent_msgs_key)
+        for msg in reversed(msgs):
+            self.recent_messages.insert(0, msg)
+            self.recent_list.Insert(to_single_line(msg), 0)
+
+    def add_to_recent(self, message):
+        """Add a message to recent list if not already present."""
+        if message not in self.recent_messages:
+            self.recent_messages.insert(0, message)
+            self.recent_list.Insert(to_single_line(message), 0)
+            Config.add_to_list(self.recent_msgs_key, message)
+
+    def _on_recent_selected(self, event):
+        """Handle double-click on recent message."""
+        selection = self.recent_list.GetSelection()
+        if selection != wx.NOT_FOUND:
+            self.msg_txt.SetValue(self.recent_messages[selection])
+
+    def _on_recent_right_click(self, event):
+        """Show context menu for recent messages."""
+        item = self.recent_list.HitTest(event.GetPosition())
+        if item != wx.NOT_FOUND:
+            self.recent_list.SetSelection(item)
+
+        menu = wx.Menu()
+        use_item = menu.Append(wx.ID_ANY, "Use Message")
+        copy_item = menu.Append(wx.ID_COPY, "Copy Message")
+        del_item = menu.Append(wx.ID_DELETE, "Delete Message")
+
+        self.Bind(wx.EVT_MENU, self._on_use_recent, use_item)
+        self.Bind(wx.EVT_MENU, self._on_copy_recent, copy_item)
+        self.Bind(wx.EVT_MENU, self._on_delete_recent, del_item)
+
+        self.recent_list.PopupMenu(menu, event.GetPosition())
+        menu.Destroy()
+
+    def _on_use_recent(self, event):
+        """Use selected recent message."""
+        selection = self.recent_list.GetSelection()
+        if selection != wx.NOT_FOUND:
+            self.msg_txt.SetValue(self.recent_messages[selection])
+
+    def _on_copy_recent(self, event):
+        """Copy selected recent message to clipboard."""
+        selection = self.recent_list.GetSelection()
+        if selection != wx.NOT_FOUND:
+            if wx.TheClipboard.Open():
+                wx.TheClipboard.SetData(wx.TextDataObject(self.recent_messages[selection]))
+                wx.TheClipboard.Close()
+
+    def _on_delete_recent(self, event):
+        """Delete selected recent message."""
+        selection = self.recent_list.GetSelection()
+        if selection != wx.NOT_FOUND:
+            msg = self.recent_messages[selection]
+            self.recent_messages.pop(selection)
+            self.recent_list.Delete(selection)
+            Config.remove_from_list(self.recent_msgs_key, msg)
+
+
+class SplitterInitMixin:
+    """Mixin class providing splitter initialization functionality for panels with splitters."""
+
+    def setup_splitter_init(self, h_splitter, v_splitter=None, h_ratio=0.5, v_ratio=0.5):
+        """Initialize splitter handling. Call this in __init__ after creating splitters."""
+        self._h_splitter = h_splitter
+        self._v_splitter = v_splitter
+        self._h_ratio = h_ratio
+        self._v_ratio = v_ratio
+        self._splitters_initialized = False
+        self.Bind(wx.EVT_SIZE, self._on_splitter_size)
+
+    def _on_splitter_size(self, event):
+        """Handle size event for splitter initialization."""
+        event.Skip()
+        if not self._splitters_initialized and self.GetSize().GetWidth() > 0:
+            wx.CallAfter(self._do_init_splitter_positions)
+            self._splitters_initialized = True
+
+    def _do_init_splitter_positions(self):
+        """Initialize splitter positions based on ratios."""
+        if self._h_splitter:
+            h_size = self._h_splitter.GetSize().GetWidth()
+            if h_size > 0:
+                self._h_splitter.SetSashPosition(int(h_size * self._h_ratio))
+        if self._v_splitter:
+            v_size = self._v_splitter.GetSize().GetHeight()
+            if v_size > 0:
+                self._v_splitter.SetSashPosition(int(v_size * self._v_ratio))
+
+
+class RecordMixin:
+    """Mixin adding Record and Store toggles that write everything an engine receives to a capture
+    file or a SQLite message store."""
+
+    def setup_record(self, engine_class, source_name, sizer):
+        """Add the Record button and its status label to sizer. Call this in __init__."""
+        self._record_engine_class = engine_class
+        self._record_source = source_name
+        self.record_writer = None
+
+        self.record_btn = wx.Button(self, label="Record")
+        self.record_btn.SetToolTip("Write every received message to a capture file")
+        compressions = ["No compression"] + sorted(CODECS)
+        self.record_compression_choice = wx.Choice(self, choices=compressions)
+        saved_compression = Config.get(CONFIG_CAPTURE_COMPRESSION_KEY, "")
+        self.record_compression_choice.SetSelection(compressions.index(saved_compression) if saved_compression in CODECS else 0)
+        self.record_compression_choice.SetToolTip("Compress the capture in blocks (random access is kept per block)")
+        self.record_lbl = wx.StaticText(self, label="")
+        sizer.Add(self.record_btn, 0, wx.CENTER | wx.ALL, 5)
+        sizer.Add(self.record_compression_choice, 0, wx.CENTER | wx.ALL, 5)
+        sizer.Add(self.record_lbl, 0, wx.CENTER | wx.ALL, 5)
+
+        self.store_sink = None
+        self.store_btn = wx.Button(self, label="Store")
+        self.store_btn.SetToolTip("Insert every received message into a searchable SQLite database (File > Open Message Store)")
+        self.store_lbl = wx.StaticText(self, label="")
+        sizer.Add(self.store_btn, 0, wx.CENTER | wx.ALL, 5)
+        sizer.Add(self.store_lbl, 0, wx.CENTER | wx.ALL, 5)
+
+        self.record_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_record_timer, self.record_timer)
+        self.record_btn.Bind(wx.EVT_BUTTON, self._on_record_toggle)
+        self.store_btn.Bind(wx.EVT_BUTTON, self._on_store_toggle)
+
+    def _on_record_toggle(self, event):
+        if self.record_writer:
+            self.stop_recording()
+            return
+
+        default_file = f"{self._record_source.lower()}-{time.strftime('%Y%m%d-%H%M%S')}.zcap"
+        with wx.FileDialog(
+            self,
+            "Record to capture file",
+            defaultDir=Config.get(CONFIG_CAPTURE_DIR_KEY, os.path.expanduser("~")),
+            defaultFile=default_file,
+            wildcard="ZmqAnalyzer captures (*.zcap)|*.zcap|All files (*.*)|*.*",
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+        ) as dialog:
+            if dialog.ShowModal() != wx.ID_OK:
+                return
+            path = dialog.GetPath()
+
+        compression = self.record_compression_choice.GetStringSelection()
+        compression = compression if compression in CODECS else ""
+        try:
+            self.record_writer = CaptureWriter(
+                path, [self._record_source], compression=compression, block_size=Config.get(CONFIG_CAPTURE_BLOCK_SIZE_KEY, DEFAULT_BLOCK_SIZE)
+            )
+        except OSError as e:
+            wx.MessageBox(f"Cannot open capture file: {e}", "Record Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        Config.set(CONFIG_CAPTURE_DIR_KEY, os.path.dirname(path))
+        Config.set(CONFIG_CAPTURE_COMPRESSION_KEY, compression)
+        self.record_compression_choice.Enable(False)
+        self._record_engine_class().add_sink(self.record_writer)
+        print(f"{self._record_source} recording to {path}")
+        self.record_btn.SetLabel("Stop Recording")
+        self._update_record_label("Recording")
+        self.record_timer.Start(500)
+
+    def stop_recording(self):
+        """Detach and close the capture writer, if recording."""
+        if not self.record_writer:
+            return
+        if not self.store_sink:
+            self.record_timer.Stop()
+        self._record_engine_class().remove_sink(self.record_writer)
+        self.record_writer.close()
+        self._update_record_label("Saved")
+        print(f"{self._record_source} recording saved to {self.record_writer.path}")
+        self.record_writer = None
+        self.record_btn.SetLabel("Record")
+        self.record_compression_choice.Enable(True)
+
+    def _on_store_toggle(self, event):
+        if self.store_sink:
+            self.stop_storing()
+            return
+
+        default_file = f"{self._record_source.lower()}-{time.strftime('%Y%m%d-%H%M%S')}.sqlite"
+        with wx.FileDialog(
+            self,
+            "Store messages in database",
+            defaultDir=Config.get(CONFIG_CAPTURE_DIR_KEY, os.path.expanduser("~")),
+            defaultFile=default_file,
+            wildcard="SQLite databases (*.sqlite;*.db)|*.sqlite;*.db|All files (*.*)|*.*",
+            style=wx.FD_SAVE,
+        ) as dialog:
+            if dialog.ShowModal() != wx.ID_OK:
+                return
+            path = dialog.GetPath()
+
+        try:
+            self.store_sink = SqliteSink(path)
+        except sqlite3.Error as e:
+            wx.MessageBox(f"Cannot open database: {e}", "Store Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        Config.set(CONFIG_CAPTURE_DIR_KEY, os.path.dirname(path))
+        self._record_engine_class().add_sink(self.store_sink)
+        print(f"{self._record_source} storing to {path}")
+        self.store_btn.SetLabel("Stop Storing")
+        self._update_store_label("Storing")
+        self.record_timer.Start(500)
+
+    def stop_storing(self):
+        """Detach and close the message store, if storing."""
+        if not self.store_sink:
+            return
+        self._record_engine_class().remove_sink(self.store_sink)
+        self.store_sink.close()
+        self._update_store_label("Stored")
+        print(f"{self._record_source} messages stored in {self.store_sink.path}")
+        self.store_sink = None
+        self.store_btn.SetLabel("Store")
+        if not self.record_writer:
+            self.record_timer.Stop()
+
+    def _on_record_timer(self, event):
+        if self.record_writer:
+            self._update_record_label("Recording")
+        if self.store_sink:
+            self._update_store_label("Storing")
+
+    def _update_store_label(self, state):
+        stats = self.store_sink.get_stats()
+        text = f"{state}: {stats['messages']} msgs"
+        if stats["dropped"]:
+            text += f" ({stats['dropped']} dropped)"
+        self.store_lbl.SetLabel(text)
+        self.Layout()
+
+    def _update_record_label(self, state):
+        stats = self.record_writer.get_stats()
+        text = f"{state}: {stats['messages']} msgs, {format_bytes(stats['bytes'])}"
+        if self.record_writer.compression:
+            text += f" ({format_bytes(stats['stored_bytes'])} on disk)"
+        if stats["dropped"]:
+            text += f" ({stats['dropped']} dropped)"
+        self.record_lbl.SetLabel(text)
+        self.Layout()
+
+
+# --- UI Classes ---
+
+
+class BaseComPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    def __init__(self, parent, connection_address, recent_msgs_key, send_callback):
+        super().__init__(parent)
+        self.send_callback = send_callback
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Address)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.address_lbl = wx.StaticText(self, label="Address:")
+        self.address_txt = wx.TextCtrl(self, value=connection_address, size=(200, -1))
+        self.top_sizer.Add(self.address_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.address_txt, 0, wx.EXPAND | wx.ALL, 5)
+
+        # Create horizontal splitter for Send/Recv
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Send Side Panel
+        self.send_panel = wx.Panel(self.h_splitter)
+        self.send_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_lbl = wx.StaticText(self.send_panel, label="Send:")
+
+        # Vertical splitter for message and recent list
+        self.v_splitter = wx.SplitterWindow(self.send_panel, style=wx.SP_LIVE_UPDATE)
+
+        # Message panel (in vertical splitter)
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_txt = wx.TextCtrl(
+            self.msg_panel,
+            value="Enter your message here",
+            style=wx.TE_MULTILINE,
+        )
+        self.msg_panel_sizer.Add(self.send_txt, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        # Recent panel (in vertical splitter)
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.send_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.send_sizer.Add(self.v_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.send_panel.SetSizer(self.send_sizer)
+
+        # Recv Side Panel
+        self.recv_panel = wx.Panel(self.h_splitter)
+        self.recv_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recv_lbl = wx.StaticText(self.recv_panel, label="Received:")
+        self.recv_txt = wx.TextCtrl(
+            self.recv_panel,
+            value="\n\n\n\t\tReceived message will be displayed here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+        self.recv_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.recv_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.recv_panel.SetSizer(self.recv_sizer)
+
+        # Setup horizontal splitter
+        self.h_splitter.SplitVertically(self.send_panel, self.recv_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.send_btn = wx.Button(self, label="Send Message")
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        # Bindings
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_message)
+
+        # Setup mixins
+        self.msg_txt = self.send_txt
+        self.setup_recent_messages(recent_msgs_key, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+
+    def on_send_message(self, event):
+        message = self.send_txt.GetValue()
+
+        # Try to format as JSON if valid
+        try:
+            parsed = json.loads(message)
+            formatted = json.dumps(parsed, indent=2)
+            self.send_txt.SetValue(formatted)
+            message = formatted
+        except json.JSONDecodeError:
+            pass
+
+        if self.send_callback:
+            self.send_callback(message)
+
+        self.add_to_recent(message)
+
+    def recv_message(self, message):
+        """Display received message with JSON formatting if applicable."""
+        self.recv_txt.SetValue(format_json_message(message))
+
+    def get_connection_address(self):
+        return self.address_txt.GetValue()
+
+
+class RequesterPanel(BaseComPanel):
+    def __init__(self, parent):
+        default_addr = Config.get(CONFIG_REQUESTER_ADDRESS_KEY, "tcp://localhost:5555")
+        super().__init__(parent, default_addr, CONFIG_RECENT_SENT_MSGS_REQ_KEY, self.send_request)
+
+        # Round-trip stats, updated on each reply
+        self.stats_lbl = wx.StaticText(self, label="RTT: -")
+        self.ctrl_sizer.Insert(0, self.stats_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        # Benchmark: N concurrent connections sending the message above
+        self.bench_box = wx.StaticBoxSizer(wx.VERTICAL, self, "Benchmark")
+        self.bench_controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.bench_type_lbl = wx.StaticText(self, label="Socket:")
+        self.bench_type_choice = wx.Choice(self, choices=list(RequestBenchmark.SOCKET_TYPES))
+        self.bench_type_choice.SetStringSelection(Config.get(CONFIG_BENCH_SOCKET_TYPE_KEY, "REQ"))
+        self.bench_type_choice.SetToolTip("DEALER sends an empty delimiter frame first, so it works against REP and ROUTER services")
+        self.bench_conn_lbl = wx.StaticText(self, label="Connections:")
+        self.bench_conn_spin = wx.SpinCtrl(self, min=1, max=10000, initial=Config.get(CONFIG_BENCH_CONNECTIONS_KEY, 8), size=(80, -1))
+        self.bench_conn_spin.SetToolTip("Each connection keeps one request in flight")
+        self.bench_duration_lbl = wx.StaticText(self, label="Duration (s):")
+        self.bench_duration_spin = wx.SpinCtrl(self, min=0, max=86400, initial=Config.get(CONFIG_BENCH_DURATION_KEY, 10), size=(70, -1))
+        self.bench_duration_spin.SetToolTip("0 runs until stopped")
+        self.bench_count_lbl = wx.StaticText(self, label="Requests:")
+        self.bench_count_spin = wx.SpinCtrl(self, min=0, max=2000000000, initial=0, size=(100, -1))
+        self.bench_count_spin.SetToolTip("0 runs until stopped")
+        self.bench_template_chk = wx.CheckBox(self, label="Template")
+        self.bench_template_chk.SetToolTip(TEMPLATE_TOOLTIP)
+        self.bench_toggle_btn = wx.Button(self, label="Start Benchmark")
+        self.bench_export_btn = wx.Button(self, label="Export JSON...")
+        self.bench_export_btn.Enable(False)
+
+        for widget in (
+            self.bench_type_lbl,
+            self.bench_type_choice,
+            self.bench_conn_lbl,
+            self.bench_conn_spin,
+            self.bench_duration_lbl,
+            self.bench_duration_spin,
+            self.bench_count_lbl,
+            self.bench_count_spin,
+            self.bench_template_chk,
+            self.bench_toggle_btn,
+            self.bench_export_btn,
+        ):
+            self.bench_controls_sizer.Add(widget, 0, wx.CENTER | wx.ALL, 3)
+
+        self.bench_stats_lbl = wx.StaticText(self, label="Idle")
+        self.bench_rows = []
+        self.bench_list = VirtualListCtrl(
+            self, [("Round trip", 170), ("Count", 90), ("Share", 300)], lambda index: self.bench_rows[index] if index < len(self.bench_rows) else None
+        )
+        self.bench_list.SetMinSize((-1, 150))
+        self.bench_box.Add(self.bench_controls_sizer, 0, wx.EXPAND)
+        self.bench_box.Add(self.bench_stats_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.bench_box.Add(self.bench_list, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.bench_box, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.bench_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_bench_timer, self.bench_timer)
+        self.bench_toggle_btn.Bind(wx.EVT_BUTTON, self.on_bench_toggle)
+        self.bench_export_btn.Bind(wx.EVT_BUTTON, self.on_bench_export)
+
+        Requester().set_callback(self.on_reply)
+
+    def send_request(self, message):
+        addr = self.get_connection_address()
+        Config.set(CONFIG_REQUESTER_ADDRESS_KEY, addr)
+        Requester().request(message, addr)
+
+    def on_reply(self, message, rtt_ns):
+        self.recv_message(message)
+        stats = Requester().get_stats()
+        rtt = stats["rtt"]
+        last = format_duration_ns(rtt_ns) if rtt_ns is not None else "-"
+        self.stats_lbl.SetLabel(
+            f"RTT: {last} (p50 {format_duration_ns(rtt['p50'])}, p99 {format_duration_ns(rtt['p99'])}) | "
+            f"Replies: {stats['replies']} | Timeouts: {stats['timeouts']} | Reconnects: {stats['reconnects']}"
+        )
+        self.ctrl_sizer.Layout()
+
+    def on_bench_toggle(self, event):
+        benchmark = RequestBenchmark()
+        if benchmark.running:
+            benchmark.stop()
+            self._on_bench_stopped("Stopped")
+            return
+
+        addr = self.get_connection_address()
+        socket_type = self.bench_type_choice.GetStringSelection()
+        connections = self.bench_conn_spin.GetValue()
+        duration = self.bench_duration_spin.GetValue()
+        success, message = benchmark.start(
+            addr,
+            connections,
+            socket_type,
+            duration=duration or None,
+            count=self.bench_count_spin.GetValue() or None,
+            payload=self.send_txt.GetValue(),
+            template=self.bench_template_chk.GetValue(),
+            callback=self._on_bench_stopped,
+        )
+        if not success:
+            wx.MessageBox(message, "Benchmark Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        Config.set(CONFIG_REQUESTER_ADDRESS_KEY, addr)
+        Config.set(CONFIG_BENCH_SOCKET_TYPE_KEY, socket_type)
+        Config.set(CONFIG_BENCH_CONNECTIONS_KEY, connections)
+        Config.set(CONFIG_BENCH_DURATION_KEY, duration)
+        self.bench_toggle_btn.SetLabel("Stop Benchmark")
+        self.bench_export_btn.Enable(False)
+        self.bench_timer.Start(500)
+
+    def _on_bench_stopped(self, reason):
+        """Called when a run is stopped by the user or finishes on its own."""
+        self.bench_timer.Stop()
+        self.bench_toggle_btn.SetLabel("Start Benchmark")
+        self.bench_export_btn.Enable(True)
+        self._update_bench_stats(reason)
+
+    def on_bench_timer(self, event):
+        self._update_bench_stats("Running")
+
+    def _update_bench_stats(self, state):
+        benchmark = RequestBenchmark()
+        stats = benchmark.get_stats()
+        rtt = stats["rtt"]
+        self.bench_stats_lbl.SetLabel(
+            f"{state} | Replies: {stats['replies']} in {stats['elapsed']:.1f}s ({stats['throughput']:.0f} req/s) | Timeouts: {stats['timeouts']} | "
+            f"RTT p50 {format_duration_ns(rtt['p50'])}, p90 {format_duration_ns(rtt['p90'])}, p99 {format_duration_ns(rtt['p99'])}, "
+            f"max {format_duration_ns(rtt['max'])}"
+        )
+
+        rows = group_histogram(benchmark.histogram())
+        total = sum(count for _, _, count in rows) or 1
+        largest = max((count for _, _, count in rows), default=1)
+        self.bench_rows = [
+            (
+                f"{format_duration_ns(low)} - {format_duration_ns(high)}",
+                str(count),
+                f"{'#' * max(1, round(40 * count / largest))} {100 * count / total:.1f}%",
+            )
+            for low, high, count in rows
+        ]
+        self.bench_list.update_rows(len(self.bench_rows))
+
+    def on_bench_export(self, event):
+        default_file = f"benchmark-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        with wx.FileDialog(
+            self,
+            "Export benchmark results",
+            defaultDir=Config.get(CONFIG_CAPTURE_DIR_KEY, os.path.expanduser("~")),
+            defaultFile=default_file,
+            wildcard="JSON files (*.json)|*.json|All files (*.*)|*.*",
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+        ) as dialog:
+            if dialog.ShowModal() != wx.ID_OK:
+                return
+            path = dialog.GetPath()
+
+        try:
+            with open(path, "w") as f:
+                json.dump(RequestBenchmark().report(), f, indent=2)
+        except OSError as e:
+            wx.MessageBox(f"Cannot write {path}: {e}", "Export Error", wx.OK | wx.ICON_ERROR)
+            return
+        print(f"Benchmark results exported to {path}")
+
+
+class ReplyerPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        # Extract port from config (remove tcp://*: prefix if present)
+        default_addr = Config.get(CONFIG_REPLYER_ADDRESS_KEY, "tcp://*:5555")
+        default_port = default_addr.replace("tcp://*:", "")
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.is_bound = False
+
+        # Top Sizer (Port and Bind button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.port_lbl = wx.StaticText(self, label="Port:")
+        self.port_txt = wx.TextCtrl(self, value=default_port, size=(80, -1))
+        self.bind_toggle_btn = wx.Button(self, label="Bind")
+
+        self.top_sizer.Add(self.port_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.port_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.bind_toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+
+        # Create horizontal splitter for Send/Recv
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Send Side Panel
+        self.send_panel = wx.Panel(self.h_splitter)
+        self.send_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_lbl = wx.StaticText(self.send_panel, label="Send:")
+
+        # Vertical splitter for message and recent list
+        self.v_splitter = wx.SplitterWindow(self.send_panel, style=wx.SP_LIVE_UPDATE)
+
+        # Message panel (in vertical splitter)
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_txt = wx.TextCtrl(self.msg_panel, value="Enter your message here", style=wx.TE_MULTILINE)
+        self.msg_panel_sizer.Add(self.send_txt, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        # Recent panel (in vertical splitter)
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.send_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.send_sizer.Add(self.v_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.send_panel.SetSizer(self.send_sizer)
+
+        # Recv Side Panel
+        self.recv_panel = wx.Panel(self.h_splitter)
+        self.recv_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recv_lbl = wx.StaticText(self.recv_panel, label="Received:")
+        self.recv_txt = wx.TextCtrl(
+            self.recv_panel,
+            value="\n\n\n\t\tReceived message will be displayed here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+        self.recv_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.recv_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.recv_panel.SetSizer(self.recv_sizer)
+
+        # Setup horizontal splitter
+        self.h_splitter.SplitVertically(self.send_panel, self.recv_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.send_btn = wx.Button(self, label="Send Message")
+        self.send_btn.Enable(False)
+        self.auto_reply_chk = wx.CheckBox(self, label="Auto Reply")
+        self.auto_reply_chk.SetToolTip(
+            "Answer every request immediately with the message on the left (for load tests); requests are counted but not shown one by one"
+        )
+        self.template_chk = wx.CheckBox(self, label="Template")
+        self.template_chk.SetToolTip(TEMPLATE_TOOLTIP)
+        self.stats_lbl = wx.StaticText(self, label="")
+        self.ctrl_sizer.Add(self.stats_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.auto_reply_chk, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.Add(self.template_chk, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        # Request counters while bound (and the latest request in auto-reply mode)
+        self.stats_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_stats_timer, self.stats_timer)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        # Bindings
+        self.bind_toggle_btn.Bind(wx.EVT_BUTTON, self.on_bind_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_message)
+        self.auto_reply_chk.Bind(wx.EVT_CHECKBOX, self.on_auto_reply_toggle)
+        self.template_chk.Bind(wx.EVT_CHECKBOX, self.on_auto_reply_toggle)
+
+        # Setup mixins
+        self.msg_txt = self.send_txt
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_REP_KEY, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+
+        Replyer().set_callback(self.on_request_received)
+
+    def on_bind_toggle(self, event):
+        if self.is_bound:
+            success, message = Replyer().unbind()
+            if success:
+                self.is_bound = False
+                self.bind_toggle_btn.SetLabel("Bind")
+                self.send_btn.Enable(False)
+                self.port_txt.Enable(True)
+                self.stats_timer.Stop()
+                self._update_stats()
+            else:
+                wx.MessageBox(message, "Unbind Error", wx.OK | wx.ICON_ERROR)
+        else:
+            port = self.port_txt.GetValue().strip()
+            if not port:
+                wx.MessageBox("Please enter a port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            if not port.isdigit():
+                wx.MessageBox("Port must be a number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            addr = f"tcp://*:{port}"
+            Config.set(CONFIG_REPLYER_ADDRESS_KEY, addr)
+            success, message = Replyer().bind(addr)
+            if success:
+                self.is_bound = True
+                self.bind_toggle_btn.SetLabel("Unbind")
+                self.send_btn.Enable(not self.auto_reply_chk.GetValue())
+                self.port_txt.Enable(False)
+                self.stats_timer.Start(500)
+            else:
+                wx.MessageBox(message, "Bind Error", wx.OK | wx.ICON_ERROR)
+
+    def on_send_message(self, event):
+        message = self.send_txt.GetValue()
+        try:
+            parsed = json.loads(message)
+            formatted = json.dumps(parsed, indent=2)
+            self.send_txt.SetValue(formatted)
+            message = formatted
+        except json.JSONDecodeError:
+            pass
+
+        success, msg = Replyer().send_reply(message)
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+    def on_auto_reply_toggle(self, event):
+        if not self.auto_reply_chk.GetValue():
+            Replyer().set_auto_reply(None)
+            self.send_txt.Enable(True)
+            self.send_btn.Enable(self.is_bound)
+            return
+        message = self.send_txt.GetValue()
+        success, msg = Replyer().set_auto_reply(message, template=self.template_chk.GetValue())
+        if not success:
+            self.auto_reply_chk.SetValue(False)
+            wx.MessageBox(msg, "Auto Reply Error", wx.OK | wx.ICON_ERROR)
+            return
+        # The reply text is fixed while auto-replying; untick to edit it
+        self.send_txt.Enable(False)
+        self.send_btn.Enable(False)
+        self.add_to_recent(message)
+
+    def on_stats_timer(self, event):
+        self._update_stats()
+
+    def _update_stats(self):
+        stats = Replyer().get_stats()
+        self.stats_lbl.SetLabel(f"Requests: {stats['requests']} | Replies: {stats['replies']} | Rate: {stats['rate']:.0f} req/s")
+        if self.auto_reply_chk.GetValue() and stats["last_request"] is not None:
+            self.recv_message(stats["last_request"].decode("utf-8", errors="replace"))
+
+    def recv_message(self, message):
+        self.recv_txt.SetValue(format_json_message(message))
+
+    def on_request_received(self, message):
+        self.recv_message(message)
+
+
+class PublisherPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_bound = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Controls
+        self.controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.port_lbl = wx.StaticText(self, label="Port:")
+        self.port_txt = wx.TextCtrl(self, value=Config.get(CONFIG_PUBLISHER_PORT_KEY, "5556"), size=(80, -1))
+        self.bind_toggle_btn = wx.Button(self, label="Bind")
+        self.topic_lbl = wx.StaticText(self, label="Topic:")
+        self.topic_txt = wx.TextCtrl(self, value=Config.get(CONFIG_PUBLISHER_TOPIC_KEY, "test"), size=(100, -1))
+
+        self.controls_sizer.Add(self.port_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.port_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.bind_toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.topic_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.topic_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.stamp_chk = wx.CheckBox(self, label="Stamp Latency")
+        self.stamp_chk.SetToolTip("Append a sequence/timestamp frame to every message for latency measurement on the Subscribe tab")
+        self.controls_sizer.Add(self.stamp_chk, 0, wx.CENTER | wx.ALL, 5)
+
+        # Create splitter for message area and recent list
+        self.splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Message Area Panel
+        self.msg_panel = wx.Panel(self.splitter)
+        self.msg_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.msg_lbl = wx.StaticText(self.msg_panel, label="Message:")
+        self.msg_txt = wx.TextCtrl(self.msg_panel, value="Enter your message here", style=wx.TE_MULTILINE)
+        self.msg_sizer.Add(self.msg_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.msg_sizer.Add(self.msg_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.msg_panel.SetSizer(self.msg_sizer)
+
+        # Recent List Panel
+        self.recent_panel = wx.Panel(self.splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.splitter.SetSashGravity(0.5)
+        self.splitter.SetMinimumPaneSize(80)
+
+        # Publish Button
+        self.pub_btn = wx.Button(self, label="Publish Message")
+        self.pub_btn.Enable(False)
+        self.template_chk = wx.CheckBox(self, label="Template")
+        self.template_chk.SetToolTip(TEMPLATE_TOOLTIP)
+        self.pub_btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.pub_btn_sizer.AddStretchSpacer(1)
+        self.pub_btn_sizer.Add(self.template_chk, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.pub_btn_sizer.Add(self.pub_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        # Load generator: publishes on a background thread at a target rate
+        self.load_box = wx.StaticBoxSizer(wx.VERTICAL, self, "Load Generator")
+        self.load_controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.load_rate_lbl = wx.StaticText(self, label="Rate (msg/s, 0 = max):")
+        self.load_rate_spin = wx.SpinCtrl(self, min=0, max=10000000, initial=Config.get(CONFIG_LOADGEN_RATE_KEY, 1000), size=(100, -1))
+        self.load_topics_lbl = wx.StaticText(self, label="Topics:")
+        self.load_topics_txt = wx.TextCtrl(self, value=Config.get(CONFIG_LOADGEN_TOPICS_KEY, "load"), size=(120, -1))
+        self.load_topics_txt.SetToolTip("Comma-separated; messages cycle through the topics")
+        self.load_size_lbl = wx.StaticText(self, label="Payload (bytes):")
+        self.load_size_spin = wx.SpinCtrl(self, min=1, max=10000000, initial=Config.get(CONFIG_LOADGEN_PAYLOAD_SIZE_KEY, 100), size=(90, -1))
+        self.load_use_msg_chk = wx.CheckBox(self, label="Use message text")
+        self.load_use_msg_chk.SetToolTip("Send the message above instead of filler bytes (expanded per message if Template is ticked)")
+        self.load_duration_lbl = wx.StaticText(self, label="Duration (s):")
+        self.load_duration_spin = wx.SpinCtrl(self, min=0, max=86400, initial=0, size=(70, -1))
+        self.load_duration_spin.SetToolTip("0 runs until stopped")
+        self.load_count_lbl = wx.StaticText(self, label="Count:")
+        self.load_count_spin = wx.SpinCtrl(self, min=0, max=2000000000, initial=0, size=(100, -1))
+        self.load_count_spin.SetToolTip("0 runs until stopped")
+        self.load_toggle_btn = wx.Button(self, label="Start Load")
+        self.load_toggle_btn.Enable(False)
+
+        for widget in (
+            self.load_rate_lbl,
+            self.load_rate_spin,
+            self.load_topics_lbl,
+            self.load_topics_txt,
+            self.load_size_lbl,
+            self.load_size_spin,
+            self.load_use_msg_chk,
+            self.load_duration_lbl,
+            self.load_duration_spin,
+            self.load_count_lbl,
+            self.load_count_spin,
+            self.load_toggle_btn,
+        ):
+            self.load_controls_sizer.Add(widget, 0, wx.CENTER | wx.ALL, 3)
+
+        self.load_stats_lbl = wx.StaticText(self, label="Idle")
+        self.load_stats_lbl.SetToolTip("Refused counts sends rejected with zmq.Again. PUB itself drops silently at its high-water mark.")
+        self.load_box.Add(self.load_controls_sizer, 0, wx.EXPAND)
+        self.load_box.Add(self.load_stats_lbl, 0, wx.EXPAND | wx.ALL, 5)
+
+        # Refresh load statistics while a run is active
+        self.load_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_load_timer, self.load_timer)
+
+        self.main_sizer.Add(self.controls_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.pub_btn_sizer, 0, wx.EXPAND)
+        self.main_sizer.Add(self.load_box, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.bind_toggle_btn.Bind(wx.EVT_BUTTON, self.on_bind_toggle)
+        self.pub_btn.Bind(wx.EVT_BUTTON, self.on_publish)
+        self.load_toggle_btn.Bind(wx.EVT_BUTTON, self.on_load_toggle)
+        self.stamp_chk.Bind(wx.EVT_CHECKBOX, self.on_stamp_toggle)
+
+        # Setup mixins - use v_splitter parameter since it's a vertical split
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_PUB_KEY, self.msg_txt, self.recent_list)
+        self.setup_splitter_init(None, self.splitter)
+
+    def on_bind_toggle(self, event):
+        if self.is_bound:
+            if LoadGenerator().running:
+                LoadGenerator().stop()
+                self._on_load_stopped("Stopped")
+            success, message = Publisher().unbind()
+            if success:
+                self.is_bound = False
+                self.bind_toggle_btn.SetLabel("Bind")
+                self.pub_btn.Enable(False)
+                self.load_toggle_btn.Enable(False)
+                self.port_txt.Enable(True)
+            else:
+                wx.MessageBox(message, "Unbind Error", wx.OK | wx.ICON_ERROR)
+        else:
+            port = self.port_txt.GetValue().strip()
+            if not port:
+                wx.MessageBox("Please enter a port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            if not port.isdigit():
+                wx.MessageBox("Port must be a number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            success, message = Publisher().bind(port)
+            if success:
+                Config.set(CONFIG_PUBLISHER_PORT_KEY, port)
+                self.is_bound = True
+                self.bind_toggle_btn.SetLabel("Unbind")
+                self.pub_btn.Enable(True)
+                self.load_toggle_btn.Enable(True)
+                self.port_txt.Enable(False)
+            else:
+                wx.MessageBox(message, "Bind Error", wx.OK | wx.ICON_ERROR)
+
+    def on_stamp_toggle(self, event):
+        Publisher().set_stamp_latency(self.stamp_chk.GetValue())
+
+    def on_publish(self, event):
+        topic = self.topic_txt.GetValue().strip()
+        message = self.msg_txt.GetValue()
+
+        if not topic:
+            wx.MessageBox("Please enter a topic", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+
+        try:
+            parsed = json.loads(message)
+            formatted = json.dumps(parsed, indent=2)
+            self.msg_txt.SetValue(formatted)
+            message = formatted
+        except json.JSONDecodeError:
+            pass
+
+        success, msg = Publisher().send_message(topic, message, template=self.template_chk.GetValue())
+        if not success:
+            wx.MessageBox(msg, "Publish Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        Config.set(CONFIG_PUBLISHER_TOPIC_KEY, topic)
+        self.add_to_recent(message)
+
+    def on_load_toggle(self, event):
+        generator = LoadGenerator()
+        if generator.running:
+            generator.stop()
+            self._on_load_stopped("Stopped")
+            return
+
+        topics = [topic.strip() for topic in self.load_topics_txt.GetValue().split(",") if topic.strip()]
+        if not topics:
+            wx.MessageBox("Please enter at least one topic", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+
+        rate = self.load_rate_spin.GetValue()
+        payload_size = self.load_size_spin.GetValue()
+        payload = self.msg_txt.GetValue() if self.load_use_msg_chk.GetValue() else None
+        success, message = generator.start(
+            rate,
+            topics,
+            payload_size,
+            duration=self.load_duration_spin.GetValue() or None,
+            count=self.load_count_spin.GetValue() or None,
+            payload=payload,
+            template=payload is not None and self.template_chk.GetValue(),
+            callback=self._on_load_stopped,
+        )
+        if not success:
+            wx.MessageBox(message, "Load Generator Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        Config.set(CONFIG_LOADGEN_RATE_KEY, rate)
+        Config.set(CONFIG_LOADGEN_TOPICS_KEY, ",".join(topics))
+        Config.set(CONFIG_LOADGEN_PAYLOAD_SIZE_KEY, payload_size)
+        self.load_toggle_btn.SetLabel("Stop Load")
+        self.load_timer.Start(500)
+
+    def _on_load_stopped(self, reason):
+        """Called when a run is stopped by the user or finishes on its own (duration/count reached)."""
+        self.load_timer.Stop()
+        self.load_toggle_btn.SetLabel("Start Load")
+        self._update_load_stats(reason)
+
+    def on_load_timer(self, event):
+        self._update_load_stats("Running")
+
+    def _update_load_stats(self, state):
+        stats = LoadGenerator().get_stats()
+        self.load_stats_lbl.SetLabel(
+            f"{state} | Sent: {stats['sent']} ({format_bytes(stats['bytes'])}) in {stats['elapsed']:.1f}s | "
+            f"Rate: {stats['instant_rate']:.0f} msg/s (avg {stats['average_rate']:.0f}) | "
+            f"Speed: {format_speed(stats['instant_bytes'])} | Refused: {stats['dropped']} | CPU: {stats['cpu_percent']:.0f}%"
+        )
+
+
+class TopicFrame(wx.Frame):
+    """Popup window for viewing individual topic messages with full content."""
+
+    def __init__(self, parent, topic):
+        super().__init__(parent, title=f"Topic: {topic}", size=(400, 300))
+        self.topic = topic
+        self.panel = wx.Panel(self)
+        self.sizer = wx.BoxSizer(wx.VERTICAL)
+        self.text = wx.TextCtrl(self.panel, style=wx.TE_MULTILINE | wx.TE_READONLY)
+        self.sizer.Add(self.text, 1, wx.EXPAND | wx.ALL, 5)
+        self.panel.SetSizer(self.sizer)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+        # Throttle updates to 100ms interval
+        self.pending_message = None
+        self.update_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_update_timer, self.update_timer)
+
+        self.Show()
+
+    def update_message(self, message):
+        """Queue a message update (throttled to 100ms to avoid UI freezing)."""
+        self.pending_message = message
+        # Only start timer if not already running
+        if not self.update_timer.IsRunning():
+            self.update_timer.StartOnce(100)  # 100ms delay
+
+    def on_update_timer(self, event):
+        """Actually update the display with the pending message (no size limit)."""
+        if self.pending_message is None:
+            return
+
+        message = self.pending_message
+        self.pending_message = None
+
+        try:
+            if isinstance(message, LazyMessage):
+                display_text = message.pretty()
+            elif isinstance(message, dict):
+                display_text = json.dumps(message, indent=2)
+            elif isinstance(message, str):
+                # Try to parse and pretty-print JSON
+                try:
+                    parsed = json.loads(message)
+                    display_text = json.dumps(parsed, indent=2)
+                except json.JSONDecodeError:
+                    display_text = message
+            else:
+                display_text = str(message)
+
+            # No truncation - show full message in detail view
+            self.text.SetValue(display_text)
+        except Exception as e:
+            self.text.SetValue(f"Error displaying message: {e}")
+
+    def on_close(self, event):
+        if self.update_timer.IsRunning():
+            self.update_timer.Stop()
+        self.Destroy()
+
+
+def format_frame(frame, limit):
+    """Readable text for a captured frame: UTF-8 (JSON pretty-printed) or a hex dump of binary data."""
+    try:
+        text = bytes(frame[:limit]).decode("utf-8")
+    except UnicodeDecodeError:
+        return bytes(frame[: limit // 2]).hex(" ") + (" ..." if len(frame) > limit // 2 else "")
+    if len(frame) > limit:
+        return text + f"\n... ({len(frame) - limit} more bytes)"
+    return format_json_message(text)
+
+
+def format_time_ns(ts_ns):
+    """Local date and time with microseconds for an epoch time in ns."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts_ns // 1_000_000_000)) + f".{ts_ns % 1_000_000_000 // 1000:06d}"
+
+
+def parse_time_text(text, reference_ns):
+    """Epoch ns for HH:MM:SS[.fff] (on the day of reference_ns), YYYY-MM-DD HH:MM:SS[.fff] or
+    +seconds (after reference_ns); None if text is none of these."""
+    text = text.strip()
+    if text.startswith("+"):
+        try:
+            return reference_ns + int(float(text[1:]) * 1e9)
+        except ValueError:
+            return None
+    seconds, _, fraction = text.partition(".")
+    try:
+        if " " not in seconds:
+            seconds = time.strftime("%Y-%m-%d ", time.localtime(reference_ns // 1_000_000_000)) + seconds
+        parsed = time.strptime(seconds, "%Y-%m-%d %H:%M:%S")
+        return int(time.mktime(parsed)) * 1_000_000_000 + int((fraction + "000000000")[:9])
+    except ValueError:
+        return None
+
+
+TIME_TOOLTIP = "HH:MM:SS[.fff], YYYY-MM-DD HH:MM:SS[.fff], or +seconds from the first message"
+
+
+class CaptureViewerFrame(wx.Frame):
+    """Window for browsing a capture file.
+
+    Rows are rendered from the memory-mapped capture only when they scroll into view, so opening
+    a capture of any size is immediate and memory use only depends on what is on screen.
+    """
+
+    PREVIEW_CHARS = 200  # Characters of each message shown in the list
+    DETAIL_BYTES = 100000  # Bytes of each frame shown in the detail view
+    REPLAY_SPEEDS = ["x1 (original)", "x0.5", "x2", "x10", "Max"]
+
+    def __init__(self, parent, reader):
+        super().__init__(parent, title=f"Capture: {os.path.basename(reader.path)}", size=(1000, 700))
+        self.reader = reader
+        self.first_ns = reader.entry(0)[1] if len(reader) else 0
+
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        nav_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        nav_sizer.Add(wx.StaticText(panel, label="Time:"), 0, wx.CENTER | wx.ALL, 5)
+        self.time_txt = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER, size=(180, -1))
+        self.time_txt.SetToolTip(TIME_TOOLTIP)
+        nav_sizer.Add(self.time_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.go_btn = wx.Button(panel, label="Go")
+        nav_sizer.Add(self.go_btn, 0, wx.CENTER | wx.ALL, 5)
+        nav_sizer.AddSpacer(20)
+        nav_sizer.Add(wx.StaticText(panel, label="Topic:"), 0, wx.CENTER | wx.ALL, 5)
+        self.topic_txt = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER, size=(180, -1))
+        self.topic_txt.SetToolTip("First frame to look for (topic, group or peer identity); defaults to the selected row's")
+        nav_sizer.Add(self.topic_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.prev_btn = wx.Button(panel, label="< Prev")
+        nav_sizer.Add(self.prev_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.next_btn = wx.Button(panel, label="Next >")
+        nav_sizer.Add(self.next_btn, 0, wx.CENTER | wx.ALL, 5)
+        sizer.Add(nav_sizer, 0, wx.EXPAND)
+
+        splitter = wx.SplitterWindow(panel)
+        self.message_list = VirtualListCtrl(
+            splitter,
+            [("#", 80), ("Time", 200), ("Socket", 90), ("Topic", 120), ("Frames", 60), ("Size", 80), ("Message", 400)],
+            self._get_row,
+        )
+        self.detail_txt = wx.TextCtrl(splitter, style=wx.TE_MULTILINE | wx.TE_READONLY)
+        splitter.SplitHorizontally(self.message_list, self.detail_txt, 400)
+        splitter.SetMinimumPaneSize(50)
+        sizer.Add(splitter, 1, wx.EXPAND | wx.ALL, 5)
+
+        self.status_lbl = wx.StaticText(panel, label="")
+        sizer.Add(self.status_lbl, 0, wx.EXPAND | wx.ALL, 5)
+
+        # Replay: resend the capture through one of the sending tabs' sockets
+        replay_box = wx.StaticBoxSizer(wx.VERTICAL, panel, "Replay")
+        replay_controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        targets = list(ReplayEngine.TARGETS)
+        replay_controls_sizer.Add(wx.StaticText(panel, label="Through:"), 0, wx.CENTER | wx.ALL, 3)
+        self.replay_target_choice = wx.Choice(panel, choices=targets)
+        saved_target = Config.get(CONFIG_REPLAY_TARGET_KEY, targets[0])
+        self.replay_target_choice.SetSelection(targets.index(saved_target) if saved_target in targets else 0)
+        self.replay_target_choice.SetToolTip("Bind or connect this socket in its tab first")
+        replay_controls_sizer.Add(self.replay_target_choice, 0, wx.CENTER | wx.ALL, 3)
+        replay_controls_sizer.Add(wx.StaticText(panel, label="Speed:"), 0, wx.CENTER | wx.ALL, 3)
+        self.replay_speed_combo = wx.ComboBox(
+            panel, value=Config.get(CONFIG_REPLAY_SPEED_KEY, self.REPLAY_SPEEDS[0]), choices=self.REPLAY_SPEEDS, size=(120, -1)
+        )
+        self.replay_speed_combo.SetToolTip("Multiplier for the recorded timing (e.g. x0.5, x10), or Max for as fast as possible")
+        replay_controls_sizer.Add(self.replay_speed_combo, 0, wx.CENTER | wx.ALL, 3)
+        self.replay_from_sel_chk = wx.CheckBox(panel, label="From selected message")
+        replay_controls_sizer.Add(self.replay_from_sel_chk, 0, wx.CENTER | wx.ALL, 3)
+        self.replay_btn = wx.Button(panel, label="Replay")
+        replay_controls_sizer.Add(self.replay_btn, 0, wx.CENTER | wx.ALL, 3)
+        self.replay_stats_lbl = wx.StaticText(panel, label="Idle")
+        self.replay_stats_lbl.SetToolTip("Drift: how late messages went out compared to the scaled capture timing")
+        replay_box.Add(replay_controls_sizer, 0, wx.EXPAND)
+        replay_box.Add(self.replay_stats_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        sizer.Add(replay_box, 0, wx.EXPAND | wx.ALL, 5)
+        panel.SetSizer(sizer)
+
+        self.replay_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_replay_timer, self.replay_timer)
+        self.replay_btn.Bind(wx.EVT_BUTTON, self.on_replay_toggle)
+
+        self.go_btn.Bind(wx.EVT_BUTTON, self.on_go)
+        self.time_txt.Bind(wx.EVT_TEXT_ENTER, self.on_go)
+        self.prev_btn.Bind(wx.EVT_BUTTON, lambda event: self.find_topic(forward=False))
+        self.next_btn.Bind(wx.EVT_BUTTON, lambda event: self.find_topic(forward=True))
+        self.topic_txt.Bind(wx.EVT_TEXT_ENTER, lambda event: self.find_topic(forward=True))
+        self.message_list.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_message_selected)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+        self.message_list.update_rows(len(reader))
+        self.status_lbl.SetLabel(f"{len(reader)} messages from {', '.join(reader.sockets)}, {format_bytes(len(reader.data))}")
+        self.Show()
+
+    def _get_row(self, index):
+        try:
+            ts_ns, socket_name, frames = self.reader.record(index)
+        except Exception:
+            return None
+        topic = bytes(frames[0][:100]).decode("utf-8", errors="replace") if len(frames) > 1 else ""
+        body = frames[-1] if frames else b""
+        preview = to_single_line(bytes(body[: self.PREVIEW_CHARS]).decode("utf-8", errors="replace"))
+        size = sum(len(frame) for frame in frames)
+        return (str(index + 1), format_time_ns(ts_ns), socket_name, topic, str(len(frames)), format_bytes(size), preview)
+
+    def on_go(self, event):
+        ts_ns = parse_time_text(self.time_txt.GetValue(), self.first_ns)
+        if ts_ns is None:
+            wx.MessageBox("Enter HH:MM:SS, YYYY-MM-DD HH:MM:SS or +seconds", "Invalid Time", wx.OK | wx.ICON_WARNING)
+            return
+        self.select_row(min(self.reader.find_time(ts_ns), len(self.reader) - 1))
+
+    def find_topic(self, forward):
+        if not len(self.reader):
+            return
+        current = self.message_list.GetFirstSelected()
+        topic = self.topic_txt.GetValue()
+        if not topic and current >= 0:
+            frames = self.reader.record(current)[2]
+            topic = bytes(frames[0]).decode("utf-8", errors="replace") if frames else ""
+            self.topic_txt.SetValue(topic)
+        if current < 0:
+            current = -1 if forward else len(self.reader)
+        index = self.reader.find_stream(topic.encode("utf-8"), current, forward)
+        if index is None:
+            self.status_lbl.SetLabel(f"No {'later' if forward else 'earlier'} message on '{topic}'")
+            return
+        self.select_row(index)
+
+    def select_row(self, index):
+        if index < 0:
+            return
+        selected = self.message_list.GetFirstSelected()
+        if selected >= 0:
+            self.message_list.Select(selected, False)
+        self.message_list.Select(index)
+        self.message_list.Focus(index)
+        self.message_list.EnsureVisible(index)
+
+    def on_message_selected(self, event):
+        index = event.GetIndex()
+        ts_ns, socket_name, frames = self.reader.record(index)
+        lines = [f"#{index + 1}  {format_time_ns(ts_ns)}  {socket_name}"]
+        for frame_number, frame in enumerate(frames):
+            lines.append(f"\n--- Frame {frame_number} ({len(frame)} bytes) ---")
+            lines.append(format_frame(frame, self.DETAIL_BYTES))
+        self.detail_txt.SetValue("\n".join(lines))
+        self.status_lbl.SetLabel(f"Message {index + 1} of {len(self.reader)}")
+
+    def parse_speed(self, text):
+        """Replay speed multiplier for the Speed field (0 for max), or None."""
+        text = text.strip().lower()
+        if text.startswith("max"):
+            return 0.0
+        try:
+            speed = float(text.lstrip("x").split()[0])
+        except (ValueError, IndexError):
+            return None
+        return speed if speed > 0 else None
+
+    def on_replay_toggle(self, event):
+        engine = ReplayEngine()
+        if engine.running:
+            engine.stop()
+            self._on_replay_stopped("Stopped")
+            return
+
+        speed = self.parse_speed(self.replay_speed_combo.GetValue())
+        if speed is None:
+            wx.MessageBox("Speed must be a positive multiplier (e.g. x2, 0.5) or Max", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+        target = self.replay_target_choice.GetStringSelection()
+        start_index = max(0, self.message_list.GetFirstSelected()) if self.replay_from_sel_chk.GetValue() else 0
+        success, message = engine.start(self.reader.path, target, speed, start_index=start_index, callback=self._on_replay_stopped)
+        if not success:
+            wx.MessageBox(message, "Replay Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        Config.set(CONFIG_REPLAY_TARGET_KEY, target)
+        Config.set(CONFIG_REPLAY_SPEED_KEY, self.replay_speed_combo.GetValue())
+        self.replay_btn.SetLabel("Stop Replay")
+        self.replay_timer.Start(500)
+
+    def _on_replay_stopped(self, reason):
+        """Called when a replay is stopped by the user or reaches the end of the capture."""
+        self.replay_timer.Stop()
+        self.replay_btn.SetLabel("Replay")
+        self._update_replay_stats(reason)
+
+    def on_replay_timer(self, event):
+        self._update_replay_stats("Running")
+
+    def _update_replay_stats(self, state):
+        stats = ReplayEngine().get_stats()
+        drift = stats["drift"]
+        self.replay_stats_lbl.SetLabel(
+            f"{state} | {stats['position']}/{stats['total']} via {stats['target']} in {stats['elapsed']:.1f}s | "
+            f"Rate: {stats['instant_rate']:.0f} msg/s ({format_speed(stats['instant_bytes'])}) | Refused: {stats['dropped']} | "
+            f"Drift: {format_duration_ns(drift['current'])} (p50 {format_duration_ns(drift['p50'])}, p99 {format_duration_ns(drift['p99'])}, "
+            f"max {format_duration_ns(drift['max'])}, {drift['late']} late)"
+        )
+
+    def on_close(self, event):
+        # The replay belongs to this window; don't leave it running invisibly
+        if ReplayEngine().running:
+            ReplayEngine().stop()
+        self.replay_timer.Stop()
+        self.detail_txt.SetValue("")
+        self.reader.close()
+        self.Destroy()
+
+
+class MessageStoreFrame(wx.Frame):
+    """Window for searching a SQLite message store.
+
+    Each search creates a MessageQuery; the list asks it for visible rows only, so results are
+    loaded from the database a page at a time while scrolling.
+    """
+
+    PREVIEW_CHARS = 200  # Characters of each message shown in the list
+
+    def __init__(self, parent, path, query):
+        super().__init__(parent, title=f"Message Store: {os.path.basename(path)}", size=(1000, 700))
+        self.path = path
+        self.query = query
+
+        panel = wx.Panel(self)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+
+        filter_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        filter_sizer.Add(wx.StaticText(panel, label="Socket:"), 0, wx.CENTER | wx.ALL, 3)
+        self.socket_choice = wx.Choice(panel, choices=["All"] + self.query.sockets())
+        self.socket_choice.SetSelection(0)
+        filter_sizer.Add(self.socket_choice, 0, wx.CENTER | wx.ALL, 3)
+        filter_sizer.Add(wx.StaticText(panel, label="Topic:"), 0, wx.CENTER | wx.ALL, 3)
+        self.topic_txt = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER, size=(120, -1))
+        self.topic_txt.SetToolTip("Exact topic, group or peer identity")
+        filter_sizer.Add(self.topic_txt, 0, wx.CENTER | wx.ALL, 3)
+        filter_sizer.Add(wx.StaticText(panel, label="From:"), 0, wx.CENTER | wx.ALL, 3)
+        self.since_txt = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER, size=(150, -1))
+        self.since_txt.SetToolTip(TIME_TOOLTIP)
+        filter_sizer.Add(self.since_txt, 0, wx.CENTER | wx.ALL, 3)
+        filter_sizer.Add(wx.StaticText(panel, label="To:"), 0, wx.CENTER | wx.ALL, 3)
+        self.until_txt = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER, size=(150, -1))
+        self.until_txt.SetToolTip(TIME_TOOLTIP)
+        filter_sizer.Add(self.until_txt, 0, wx.CENTER | wx.ALL, 3)
+        filter_sizer.Add(wx.StaticText(panel, label="Contains:"), 0, wx.CENTER | wx.ALL, 3)
+        self.text_txt = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER, size=(150, -1))
+        self.text_txt.SetToolTip("Text the message must contain (scans the matching rows, so narrow by topic or time first on large stores)")
+        filter_sizer.Add(self.text_txt, 1, wx.CENTER | wx.ALL, 3)
+        self.search_btn = wx.Button(panel, label="Search")
+        filter_sizer.Add(self.search_btn, 0, wx.CENTER | wx.ALL, 3)
+        sizer.Add(filter_sizer, 0, wx.EXPAND | wx.ALL, 2)
+
+        splitter = wx.SplitterWindow(panel)
+        self.message_list = VirtualListCtrl(
+            splitter,
+            [("ID", 80), ("Time", 200), ("Socket", 90), ("Topic", 120), ("Frames", 60), ("Size", 80), ("Message", 400)],
+            self._get_row,
+        )
+        self.detail_txt = wx.TextCtrl(splitter, style=wx.TE_MULTILINE | wx.TE_READONLY)
+        splitter.SplitHorizontally(self.message_list, self.detail_txt, 400)
+        splitter.SetMinimumPaneSize(50)
+        sizer.Add(splitter, 1, wx.EXPAND | wx.ALL, 5)
+
+        self.status_lbl = wx.StaticText(panel, label="")
+        sizer.Add(self.status_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        panel.SetSizer(sizer)
+
+        self.search_btn.Bind(wx.EVT_BUTTON, self.on_search)
+        for text_ctrl in (self.topic_txt, self.since_txt, self.until_txt, self.text_txt):
+            text_ctrl.Bind(wx.EVT_TEXT_ENTER, self.on_search)
+        self.message_list.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_message_selected)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+        self._show_results()
+        self.Show()
+
+    def _get_row(self, index):
+        row = self.query.row(index)
+        if row is None:
+            return None
+        row_id, recv_ns, socket_name, topic, payload, frames, size = row
+        if isinstance(payload, bytes):
+            preview = payload[: self.PREVIEW_CHARS // 2].hex(" ")
+        else:
+            preview = to_single_line(payload[: self.PREVIEW_CHARS])
+        return (str(row_id), format_time_ns(recv_ns), socket_name, topic, str(frames), format_bytes(size), preview)
+
+    def on_search(self, event):
+        # Relative times count from the first stored message
+        first = self.query.connection.execute("SELECT MIN(recv_ns) FROM messages").fetchone()[0] or 0
+        times = []
+        for text_ctrl in (self.since_txt, self.until_txt):
+            text = text_ctrl.GetValue().strip()
+            ts_ns = parse_time_text(text, first) if text else None
+            if text and ts_ns is None:
+                wx.MessageBox("Enter HH:MM:SS, YYYY-MM-DD HH:MM:SS or +seconds", "Invalid Time", wx.OK | wx.ICON_WARNING)
+                return
+            times.append(ts_ns)
+        socket_name = self.socket_choice.GetStringSelection()
+        try:
+            query = MessageQuery(
+                self.path,
+                topic=self.topic_txt.GetValue(),
+                socket=None if socket_name == "All" else socket_name,
+                since_ns=times[0],
+                until_ns=times[1],
+                text=self.text_txt.GetValue(),
+            )
+        except sqlite3.Error as e:
+            wx.MessageBox(f"Query failed: {e}", "Search Error", wx.OK | wx.ICON_ERROR)
+            return
+        self.query.close()
+        self.query = query
+        self._show_results()
+
+    def _show_results(self):
+        self.detail_txt.SetValue("")
+        self.message_list.update_rows(len(self.query))
+        self.status_lbl.SetLabel(f"{len(self.query)} matching messages")
+
+    def on_message_selected(self, event):
+        row = self.query.row(event.GetIndex())
+        if row is None:
+            return
+        row_id, recv_ns, socket_name, topic, payload, frames, size = row
+        if isinstance(payload, bytes):
+            text = payload.hex(" ")
+        else:
+            text = format_json_message(payload)
+        self.detail_txt.SetValue(f"ID {row_id}  {format_time_ns(recv_ns)}  {socket_name}  {topic}\n{frames} frame(s), {size} bytes\n\n{text}")
+
+    def on_close(self, event):
+        self.query.close()
+        self.Destroy()
+
+
+class SubscriberPanel(wx.Panel, RecordMixin):
+    # Maximum message length to display in table (truncate longer messages)
+    MAX_TABLE_MSG_LENGTH = 500
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.topic_frames = {}
+        self.stats_topics = []  # Row order of stats_list
+        self.stats_rows = {}  # {topic: [column strings]} rendered on demand by stats_list
+        self.msg_topics = []  # Row order of msg_list
+        self.msg_rows = {}  # {topic: [column strings]} rendered on demand by msg_list
+        self.active_topics = set()  # Topics shown with a non-zero rate, refreshed until it decays
+        self.is_running = False
+        self.start_time = None
+
+        # UI update timer (10ms interval)
+        self.update_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_update_timer, self.update_timer)
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Controls
+        self.controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.addr_lbl = wx.StaticText(self, label="Address:")
+        self.addr_txt = wx.TextCtrl(
+            self,
+            value=Config.get(CONFIG_SUBSCRIBER_ADDRESS_KEY, "tcp://localhost:5556"),
+            size=(200, -1),
+        )
+        self.topic_lbl = wx.StaticText(self, label="Topics (comma sep):")
+        self.topic_txt = wx.TextCtrl(self, value=Config.get(CONFIG_SUBSCRIBER_TOPICS_KEY, ""), size=(200, -1))
+
+        self.toggle_btn = wx.Button(self, label="Start")
+
+        self.controls_sizer.Add(self.addr_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.addr_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.topic_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.topic_txt, 1, wx.CENTER | wx.ALL, 5)
+        self.seq_lbl = wx.StaticText(self, label="Seq:")
+        self.seq_txt = wx.TextCtrl(self, value=Config.get(CONFIG_SUBSCRIBER_SEQUENCE_KEY, ""), size=(90, -1))
+        self.seq_txt.SetToolTip(SEQUENCE_TOOLTIP)
+        self.controls_sizer.Add(self.seq_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.seq_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.latency_chk = wx.CheckBox(self, label="Latency")
+        self.latency_chk.SetToolTip("Measure one-way latency from the publisher's timestamp frame (enable Stamp Latency on the sender)")
+        self.controls_sizer.Add(self.latency_chk, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.setup_record(Subscriber, "Subscriber", self.controls_sizer)
+
+        # Create a splitter for messages and statistics
+        self.splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Message List Panel
+        self.msg_panel = wx.Panel(self.splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.msg_list = VirtualListCtrl(self.msg_panel, [("Topic", 100), ("Message", 400)], self._get_msg_row)
+        self.msg_panel_sizer.Add(self.msg_list, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        # Statistics Panel
+        self.stats_panel = wx.Panel(self.splitter)
+        self.stats_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Stats header with reset button
+        stats_header_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        stats_header = wx.StaticText(self.stats_panel, label="Statistics")
+        stats_header.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        stats_header_sizer.Add(stats_header, 0, wx.CENTER | wx.ALL, 5)
+        stats_header_sizer.AddStretchSpacer(1)
+        self.reset_stats_btn = wx.Button(self.stats_panel, label="Reset Stats")
+        stats_header_sizer.Add(self.reset_stats_btn, 0, wx.ALL, 2)
+        self.stats_sizer.Add(stats_header_sizer, 0, wx.EXPAND | wx.ALL, 2)
+
+        # Totals section title
+        totals_title = wx.StaticText(self.stats_panel, label="Totals")
+        totals_title.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.stats_sizer.Add(totals_title, 0, wx.LEFT | wx.TOP, 5)
+
+        # Summary stats grid
+        summary_grid = wx.FlexGridSizer(2, 6, 5, 20)  # 2 rows, 6 cols, vgap=5, hgap=20
+        # Make all columns growable with equal proportion
+        for i in range(6):
+            summary_grid.AddGrowableCol(i, 1)
+
+        # Row 1: Labels
+        for label in ["Messages", "Data Size", "Topics", "Rate", "Speed", "Msgs/Wake"]:
+            lbl = wx.StaticText(self.stats_panel, label=label)
+            lbl.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            summary_grid.Add(lbl, 0, wx.ALIGN_CENTER)
+
+        # Row 2: Values
+        self.summary_msgs = wx.StaticText(self.stats_panel, label="0")
+        self.summary_bytes = wx.StaticText(self.stats_panel, label="0 bytes")
+        self.summary_topics = wx.StaticText(self.stats_panel, label="0")
+        self.summary_rate = wx.StaticText(self.stats_panel, label="-")
+        self.summary_speed = wx.StaticText(self.stats_panel, label="-")
+        self.summary_batch = wx.StaticText(self.stats_panel, label="-")
+
+        summary_grid.Add(self.summary_msgs, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_bytes, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_topics, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_rate, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_speed, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_batch, 0, wx.ALIGN_CENTER)
+
+        self.stats_sizer.Add(summary_grid, 0, wx.EXPAND | wx.ALL, 5)
+
+        # Per-Topic section title
+        per_topic_title = wx.StaticText(self.stats_panel, label="Per Topic")
+        per_topic_title.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.stats_sizer.Add(per_topic_title, 0, wx.LEFT | wx.TOP | wx.BOTTOM, 5)
+
+        # Stats list
+        self.stats_list = VirtualListCtrl(
+            self.stats_panel,
+            [
+                ("Topic", 150),
+                ("Count", 100),
+                ("Bytes", 120),
+                ("Rate (msg/s)", 120),
+                ("Last Received", 150),
+                ("p50", 80),
+                ("p99", 80),
+                ("p99.9", 80),
+                ("Max", 80),
+                ("Lost", 70),
+                ("Out of Order", 90),
+                ("Dup", 60),
+            ],
+            self._get_stats_row,
+        )
+        self.stats_sizer.Add(self.stats_list, 1, wx.EXPAND)
+
+        self.stats_panel.SetSizer(self.stats_sizer)
+
+        # Setup splitter
+        self.splitter.SplitHorizontally(self.msg_panel, self.stats_panel)
+        self.splitter.SetSashGravity(0.5)  # Messages get 50% of space
+        self.splitter.SetMinimumPaneSize(100)
+
+        self.main_sizer.Add(self.controls_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.splitter, 1, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.toggle_btn.Bind(wx.EVT_BUTTON, self.on_toggle)
+        self.reset_stats_btn.Bind(wx.EVT_BUTTON, self.on_reset_stats)
+        self.latency_chk.Bind(wx.EVT_CHECKBOX, self.on_latency_toggle)
+        self.msg_list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_item_activated)
+        self.msg_list.Bind(wx.EVT_CONTEXT_MENU, self.on_msg_list_right_click)
+        self.Bind(wx.EVT_SIZE, self.on_size)
+
+        self._splitter_initialized = False
+        # No callback needed - we poll data via timer
+
+    def on_size(self, event):
+        event.Skip()
+        if not self._splitter_initialized and self.GetSize().GetWidth() > 0:
+            wx.CallAfter(self._init_splitter_position)
+            self._splitter_initialized = True
+
+    def _init_splitter_position(self):
+        # Set splitter to 50%
+        size = self.splitter.GetSize().GetHeight()
+        if size > 0:
+            self.splitter.SetSashPosition(size // 2)
+        # Force stats panel to re-layout for proper grid alignment
+        self.stats_panel.Layout()
+
+    def on_msg_list_right_click(self, event):
+        """Show context menu for message list."""
+        menu = wx.Menu()
+        clear_item = menu.Append(wx.ID_ANY, "Clear Messages")
+        self.Bind(wx.EVT_MENU, self.on_clear_messages, clear_item)
+        self.PopupMenu(menu)
+        menu.Destroy()
+
+    def on_clear_messages(self, event):
+        """Clear all messages from the list."""
+        self.msg_topics = []
+        self.msg_rows = {}
+        self.msg_list.update_rows(0)
+
+    def on_reset_stats(self, event):
+        """Reset all statistics."""
+        Subscriber().reset_stats()
+        self.start_time = time.time() if self.is_running else None
+        self.stats_topics = []
+        self.stats_rows = {}
+        self.stats_list.update_rows(0)
+        self.active_topics = set()
+        self._update_display()
+
+    def on_latency_toggle(self, event):
+        Subscriber().set_measure_latency(self.latency_chk.GetValue())
+
+    def on_toggle(self, event):
+        if self.is_running:
+            # Stop
+            self.update_timer.Stop()
+            Subscriber().stop()
+            self.is_running = False
+            self.toggle_btn.SetLabel("Start")
+            self.addr_txt.Enable(True)
+            self.topic_txt.Enable(True)
+            self.seq_txt.Enable(True)
+        else:
+            # Start
+            addr = self.addr_txt.GetValue().strip()
+            topics_str = self.topic_txt.GetValue().strip()
+
+            if not addr:
+                wx.MessageBox("Please enter an address", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            # If topics_str is empty, subscribe to all (empty topic filter)
+            if topics_str:
+                topics = [t.strip() for t in topics_str.split(",") if t.strip()]
+            else:
+                topics = [""]  # Empty string subscribes to all messages
+
+            Config.set(CONFIG_SUBSCRIBER_ADDRESS_KEY, addr)
+            Config.set(CONFIG_SUBSCRIBER_TOPICS_KEY, topics_str)
+
+            seq_source = self.seq_txt.GetValue().strip()
+            success, message = Subscriber().set_sequence_source(seq_source)
+            if not success:
+                wx.MessageBox(message, "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            Config.set(CONFIG_SUBSCRIBER_SEQUENCE_KEY, seq_source)
+            batch_size = Config.get(CONFIG_RECV_BATCH_SIZE_KEY, DEFAULT_RECV_BATCH_SIZE)
+            success, message = Subscriber().start(topics, addr, batch_size)
+            if success:
+                self.is_running = True
+                self.start_time = time.time()
+                self.toggle_btn.SetLabel("Stop")
+                self.addr_txt.Enable(False)
+                self.topic_txt.Enable(False)
+                self.seq_txt.Enable(False)
+                # Start UI update timer (100ms interval)
+                self.update_timer.Start(100)
+                # Force layout to fix grid alignment
+                wx.CallAfter(self.stats_panel.Layout)
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_update_timer(self, event):
+        """Timer callback - update UI with latest data from Subscriber (every 100ms)."""
+        self._update_display()
+
+    def _update_display(self):
+        """Update the UI with current data from the Subscriber singleton."""
+        subscriber = Subscriber()
+        # Only topics that received messages, or whose rate is still decaying, need their rows touched
+        dirty_topics = subscriber.pop_dirty_topics()
+        topic_stats = subscriber.get_stats(dirty_topics | self.active_topics)
+        latest_messages = subscriber.get_messages(dirty_topics)
+        instant_totals = subscriber.get_instant_totals()
+
+        # Update summary statistics (cumulative counts, instant rates)
+        has_topics = instant_totals["topics"] > 0
+
+        # Use instant rates from sliding window (last 1 second)
+        instant_count = instant_totals["instant_count"]
+        instant_bytes = instant_totals["instant_bytes"]
+        rate_str = f"{instant_count:.2f} msg/s" if has_topics else "-"
+        speed_str = format_speed(instant_bytes) if has_topics else "-"
+
+        self.summary_msgs.SetLabel(str(instant_totals["count"]))
+        self.summary_bytes.SetLabel(format_bytes(instant_totals["bytes"]))
+        self.summary_topics.SetLabel(str(instant_totals["topics"]))
+        self.summary_rate.SetLabel(rate_str)
+        self.summary_speed.SetLabel(speed_str)
+        self.summary_batch.SetLabel(f"{instant_totals['messages_per_wake']:.1f}" if has_topics else "-")
+
+        # Update per-topic stats
+        active_topics = set()
+        for topic, stats in topic_stats.items():
+            # Use instant rate from sliding window for per-topic rate
+            instant_rate = stats.get("instant_rate", 0.0)
+            rate_str = f"{instant_rate:.2f}" if instant_rate > 0 else "-"
+            bytes_str = format_bytes(stats["bytes"]).replace(" bytes", " B")
+            last_time = time.strftime("%H:%M:%S", time.localtime(stats["last_time"]))
+            if instant_rate > 0:
+                active_topics.add(topic)
+
+            if topic not in self.stats_rows:
+                self.stats_topics.append(topic)
+            latency = stats.get("latency")
+            if latency:
+                latency_cols = [format_duration_ns(latency[key]) for key in ("p50", "p99", "p999", "max")]
+            else:
+                latency_cols = ["-"] * 4
+            sequence = stats.get("sequence")
+            if sequence:
+                sequence_cols = [str(sequence["lost"]), str(sequence["out_of_order"]), str(sequence["duplicates"])]
+            else:
+                sequence_cols = ["-"] * 3
+            self.stats_rows[topic] = [topic, str(stats["count"]), bytes_str, rate_str, last_time] + latency_cols + sequence_cols
+        self.active_topics = active_topics
+        if topic_stats:
+            self.stats_list.update_rows(len(self.stats_topics))
+
+        # Update message list (truncate to MAX_TABLE_MSG_LENGTH)
+        for topic, message in latest_messages.items():
+            msg_str = message.text()
+            # Truncate for table display
+            if len(msg_str) > self.MAX_TABLE_MSG_LENGTH:
+                msg_str = msg_str[: self.MAX_TABLE_MSG_LENGTH] + "..."
+
+            if topic not in self.msg_rows:
+                self.msg_topics.append(topic)
+            self.msg_rows[topic] = [topic, msg_str]
+
+            # Update topic frame if exists (with full message, no truncation)
+            if topic in self.topic_frames:
+                frame = self.topic_frames.get(topic)
+                if frame:
+                    frame.update_message(message)
+                else:
+                    del self.topic_frames[topic]
+        if latest_messages:
+            self.msg_list.update_rows(len(self.msg_topics))
+
+    def _get_stats_row(self, index):
+        if index < len(self.stats_topics):
+            return self.stats_rows[self.stats_topics[index]]
+        return None
+
+    def _get_msg_row(self, index):
+        if index < len(self.msg_topics):
+            return self.msg_rows[self.msg_topics[index]]
+        return None
+
+    def on_item_activated(self, event):
+        selection = event.GetIndex()
+        if 0 <= selection < len(self.msg_topics):
+            topic = self.msg_topics[selection]
+
+            # Get full message from Subscriber (not truncated table version)
+            latest_messages = Subscriber().get_messages()
+            message = latest_messages.get(topic, "")
+
+            if topic not in self.topic_frames or not self.topic_frames[topic]:
+                self.topic_frames[topic] = TopicFrame(self, topic)
+
+            self.topic_frames[topic].update_message(message)
+            self.topic_frames[topic].Raise()
+
+
+class PusherPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    """UI Panel for PUSH socket - sends messages to connected PULLers."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_bound = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Controls
+        self.controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.port_lbl = wx.StaticText(self, label="Port:")
+        self.port_txt = wx.TextCtrl(self, value=Config.get(CONFIG_PUSHER_PORT_KEY, "5557"), size=(80, -1))
+        self.bind_toggle_btn = wx.Button(self, label="Bind")
+
+        self.controls_sizer.Add(self.port_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.port_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.bind_toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+
+        # Create splitter for message area and recent list
+        self.splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Message Area Panel
+        self.msg_panel = wx.Panel(self.splitter)
+        self.msg_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.msg_lbl = wx.StaticText(self.msg_panel, label="Message:")
+        self.msg_txt = wx.TextCtrl(self.msg_panel, value="Enter your message here", style=wx.TE_MULTILINE)
+        self.msg_sizer.Add(self.msg_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.msg_sizer.Add(self.msg_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.msg_panel.SetSizer(self.msg_sizer)
+
+        # Recent List Panel
+        self.recent_panel = wx.Panel(self.splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.splitter.SetSashGravity(0.5)
+        self.splitter.SetMinimumPaneSize(80)
+
+        # Push Button
+        self.push_btn = wx.Button(self, label="Push Message")
+        self.push_btn.Enable(False)
+        self.template_chk = wx.CheckBox(self, label="Template")
+        self.template_chk.SetToolTip(TEMPLATE_TOOLTIP)
+        self.push_btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.push_btn_sizer.AddStretchSpacer(1)
+        self.push_btn_sizer.Add(self.template_chk, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.push_btn_sizer.Add(self.push_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.controls_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.push_btn_sizer, 0, wx.EXPAND)
+
+        self.SetSizer(self.main_sizer)
+
+        self.bind_toggle_btn.Bind(wx.EVT_BUTTON, self.on_bind_toggle)
+        self.push_btn.Bind(wx.EVT_BUTTON, self.on_push)
+
+        # Setup mixins
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_PUSH_KEY, self.msg_txt, self.recent_list)
+        self.setup_splitter_init(None, self.splitter)
+
+    def on_bind_toggle(self, event):
+        if self.is_bound:
+            success, message = Pusher().unbind()
+            if success:
+                self.is_bound = False
+                self.bind_toggle_btn.SetLabel("Bind")
+                self.push_btn.Enable(False)
+                self.port_txt.Enable(True)
+            else:
+                wx.MessageBox(message, "Unbind Error", wx.OK | wx.ICON_ERROR)
+        else:
+            port = self.port_txt.GetValue().strip()
+            if not port:
+                wx.MessageBox("Please enter a port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            if not port.isdigit():
+                wx.MessageBox("Port must be a number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            success, message = Pusher().bind(port)
+            if success:
+                Config.set(CONFIG_PUSHER_PORT_KEY, port)
+                self.is_bound = True
+                self.bind_toggle_btn.SetLabel("Unbind")
+                self.push_btn.Enable(True)
+                self.port_txt.Enable(False)
+            else:
+                wx.MessageBox(message, "Bind Error", wx.OK | wx.ICON_ERROR)
+
+    def on_push(self, event):
+        message = self.msg_txt.GetValue()
+        try:
+            parsed = json.loads(message)
+            formatted = json.dumps(parsed, indent=2)
+            self.msg_txt.SetValue(formatted)
+            message = formatted
+        except json.JSONDecodeError:
+            pass
+
+        success, msg = Pusher().send_message(message, template=self.template_chk.GetValue())
+        if not success:
+            wx.MessageBox(msg, "Push Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+
+class PullerPanel(wx.Panel, SplitterInitMixin, RecordMixin):
+    """UI Panel for PULL socket - receives messages from PUSHers."""
+
+    # Maximum message length to display in table
+    MAX_TABLE_MSG_LENGTH = 500
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_running = False
+        self.last_displayed_count = 0  # Track last message count displayed
+
+        # UI update timer (100ms interval)
+        self.update_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_update_timer, self.update_timer)
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Controls
+        self.controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.addr_lbl = wx.StaticText(self, label="Address:")
+        self.addr_txt = wx.TextCtrl(
+            self,
+            value=Config.get(CONFIG_PULLER_ADDRESS_KEY, "tcp://localhost:5557"),
+            size=(200, -1),
+        )
+        self.toggle_btn = wx.Button(self, label="Start")
+        self.buffer_lbl = wx.StaticText(self, label="Buffer:")
+        self.buffer_spin = wx.SpinCtrl(self, min=10, max=100000, initial=Config.get(CONFIG_PULLER_BUFFER_SIZE_KEY, 1000), size=(90, -1))
+        self.buffer_spin.SetToolTip("Number of recent messages kept for display")
+
+        self.controls_sizer.Add(self.addr_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.addr_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.buffer_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.buffer_spin, 0, wx.CENTER | wx.ALL, 5)
+        self.seq_lbl = wx.StaticText(self, label="Seq:")
+        self.seq_txt = wx.TextCtrl(self, value=Config.get(CONFIG_PULLER_SEQUENCE_KEY, ""), size=(90, -1))
+        self.seq_txt.SetToolTip(SEQUENCE_TOOLTIP)
+        self.controls_sizer.Add(self.seq_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.seq_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.setup_record(Puller, "Puller", self.controls_sizer)
+
+        # Create splitter for messages and stats
+        self.splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Message List Panel
+        self.msg_panel = wx.Panel(self.splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.msg_lbl = wx.StaticText(self.msg_panel, label="Received Messages:")
+        self.msg_list = VirtualListCtrl(self.msg_panel, [("#", 50), ("Message", 500)], self._get_msg_row, follow_tail=True)
+        self.msg_panel_sizer.Add(self.msg_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.msg_panel_sizer.Add(self.msg_list, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        # Stats Panel
+        self.stats_panel = wx.Panel(self.splitter)
+        self.stats_sizer = wx.BoxSizer(wx.VERTICAL)
+        stats_header = wx.StaticText(self.stats_panel, label="Statistics")
+        stats_header.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.stats_sizer.Add(stats_header, 0, wx.ALL, 5)
+
+        stats_grid = wx.FlexGridSizer(2, 7, 5, 20)
+        for i in range(7):
+            stats_grid.AddGrowableCol(i, 1)
+
+        for label in ["Messages", "Data Size", "Rate", "Speed", "Msgs/Wake", "Lost / OOO / Dup", "Running Time"]:
+            lbl = wx.StaticText(self.stats_panel, label=label)
+            lbl.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            stats_grid.Add(lbl, 0, wx.ALIGN_CENTER)
+
+        self.stats_msgs = wx.StaticText(self.stats_panel, label="0")
+        self.stats_bytes = wx.StaticText(self.stats_panel, label="0 bytes")
+        self.stats_rate = wx.StaticText(self.stats_panel, label="-")
+        self.stats_speed = wx.StaticText(self.stats_panel, label="-")
+        self.stats_batch = wx.StaticText(self.stats_panel, label="-")
+        self.stats_sequence = wx.StaticText(self.stats_panel, label="-")
+        self.stats_time = wx.StaticText(self.stats_panel, label="-")
+
+        stats_grid.Add(self.stats_msgs, 0, wx.ALIGN_CENTER)
+        stats_grid.Add(self.stats_bytes, 0, wx.ALIGN_CENTER)
+        stats_grid.Add(self.stats_rate, 0, wx.ALIGN_CENTER)
+        stats_grid.Add(self.stats_speed, 0, wx.ALIGN_CENTER)
+        stats_grid.Add(self.stats_batch, 0, wx.ALIGN_CENTER)
+        stats_grid.Add(self.stats_sequence, 0, wx.ALIGN_CENTER)
+        stats_grid.Add(self.stats_time, 0, wx.ALIGN_CENTER)
+
+        self.stats_sizer.Add(stats_grid, 0, wx.EXPAND | wx.ALL, 5)
+        self.stats_panel.SetSizer(self.stats_sizer)
+
+        self.splitter.SplitHorizontally(self.msg_panel, self.stats_panel)
+        self.splitter.SetSashGravity(0.7)
+        self.splitter.SetMinimumPaneSize(80)
+
+        self.main_sizer.Add(self.controls_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.splitter, 1, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.toggle_btn.Bind(wx.EVT_BUTTON, self.on_toggle)
+        self.buffer_spin.Bind(wx.EVT_SPINCTRL, self.on_buffer_size_changed)
+        self.msg_list.Bind(wx.EVT_CONTEXT_MENU, self.on_msg_list_right_click)
+
+        # Setup mixin with 0.7 ratio
+        self.setup_splitter_init(None, self.splitter, v_ratio=0.7)
+
+    def on_buffer_size_changed(self, event):
+        size = self.buffer_spin.GetValue()
+        Config.set(CONFIG_PULLER_BUFFER_SIZE_KEY, size)
+        Puller().set_buffer_size(size)
+
+    def on_toggle(self, event):
+        if self.is_running:
+            self.update_timer.Stop()
+            Puller().stop()
+            self.is_running = False
+            self.toggle_btn.SetLabel("Start")
+            self.addr_txt.Enable(True)
+            self.seq_txt.Enable(True)
+        else:
+            addr = self.addr_txt.GetValue().strip()
+            if not addr:
+                wx.MessageBox("Please enter an address", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            Config.set(CONFIG_PULLER_ADDRESS_KEY, addr)
+            Puller().set_buffer_size(self.buffer_spin.GetValue())
+            seq_source = self.seq_txt.GetValue().strip()
+            success, message = Puller().set_sequence_source(seq_source)
+            if not success:
+                wx.MessageBox(message, "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            Config.set(CONFIG_PULLER_SEQUENCE_KEY, seq_source)
+            batch_size = Config.get(CONFIG_RECV_BATCH_SIZE_KEY, DEFAULT_RECV_BATCH_SIZE)
+            success, message = Puller().start(addr, batch_size)
+            if success:
+                self.is_running = True
+                self.last_displayed_count = 0
+                self.msg_list.update_rows(0)  # The engine buffer starts empty
+                self.toggle_btn.SetLabel("Stop")
+                self.addr_txt.Enable(False)
+                self.seq_txt.Enable(False)
+                # Start UI update timer (100ms interval)
+                self.update_timer.Start(100)
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_update_timer(self, event):
+        """Timer callback to update UI from Puller's internal state."""
+        puller = Puller()
+
+        # Update statistics (cumulative counts, instant rates)
+        stats = puller.get_stats()
+
+        # Repaint the visible rows of the message list if anything arrived
+        if stats["count"] != self.last_displayed_count:
+            self.last_displayed_count = stats["count"]
+            self.msg_list.update_rows(puller.get_buffered_count())
+        self.stats_msgs.SetLabel(str(stats["count"]))
+        self.stats_bytes.SetLabel(format_bytes(stats["bytes"]))
+        if stats["start_time"]:
+            elapsed = time.time() - stats["start_time"]
+            # Use instant rates from sliding window
+            instant_rate = stats.get("instant_rate", 0.0)
+            instant_speed = stats.get("instant_speed", 0.0)
+            self.stats_rate.SetLabel(f"{instant_rate:.2f} msg/s")
+            self.stats_speed.SetLabel(format_speed(instant_speed))
+            self.stats_batch.SetLabel(f"{stats['messages_per_wake']:.1f}")
+            self.stats_sequence.SetLabel(format_sequence_stats(stats["sequence"]))
+            mins, secs = divmod(int(elapsed), 60)
+            self.stats_time.SetLabel(f"{mins}m {secs}s")
+
+    def on_msg_list_right_click(self, event):
+        menu = wx.Menu()
+        clear_item = menu.Append(wx.ID_ANY, "Clear Messages")
+        self.Bind(wx.EVT_MENU, self.on_clear_messages, clear_item)
+        self.PopupMenu(menu)
+        menu.Destroy()
+
+    def _get_msg_row(self, index):
+        """Format the buffered message at index for the virtual message list."""
+        entry = Puller().get_buffered_message(index)
+        if entry is None:
+            return None
+        num, msg = entry
+        msg_str = json.dumps(msg) if isinstance(msg, dict) else str(msg)
+        # Truncate message for display
+        if len(msg_str) > self.MAX_TABLE_MSG_LENGTH:
+            msg_str = msg_str[: self.MAX_TABLE_MSG_LENGTH] + "..."
+        return (str(num), msg_str)
+
+    def on_clear_messages(self, event):
+        self.last_displayed_count = 0
+        Puller().reset_stats()
+        self.msg_list.update_rows(0)
+
+
+class DealerPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin, RecordMixin):
+    """UI Panel for DEALER socket - async REQ that can send multiple requests."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_connected = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Address)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.address_lbl = wx.StaticText(self, label="Address:")
+        self.address_txt = wx.TextCtrl(
+            self,
+            value=Config.get(CONFIG_DEALER_ADDRESS_KEY, "tcp://localhost:5558"),
+            size=(200, -1),
+        )
+        self.connect_toggle_btn = wx.Button(self, label="Connect")
+
+        self.top_sizer.Add(self.address_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.address_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.connect_toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.setup_record(Dealer, "Dealer", self.top_sizer)
+
+        # Create horizontal splitter for Send/Recv
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Send Side Panel
+        self.send_panel = wx.Panel(self.h_splitter)
+        self.send_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_lbl = wx.StaticText(self.send_panel, label="Send:")
+
+        self.v_splitter = wx.SplitterWindow(self.send_panel, style=wx.SP_LIVE_UPDATE)
+
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_txt = wx.TextCtrl(self.msg_panel, value="Enter your message here", style=wx.TE_MULTILINE)
+        self.msg_panel_sizer.Add(self.send_txt, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.send_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.send_sizer.Add(self.v_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.send_panel.SetSizer(self.send_sizer)
+
+        # Recv Side Panel
+        self.recv_panel = wx.Panel(self.h_splitter)
+        self.recv_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recv_lbl = wx.StaticText(self.recv_panel, label="Received:")
+        self.recv_txt = wx.TextCtrl(
+            self.recv_panel,
+            value="\n\n\n\t\tReceived message will be displayed here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+        self.recv_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.recv_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.recv_panel.SetSizer(self.recv_sizer)
+
+        self.h_splitter.SplitVertically(self.send_panel, self.recv_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.send_btn = wx.Button(self, label="Send Message")
+        self.send_btn.Enable(False)
+        self.template_chk = wx.CheckBox(self, label="Template")
+        self.template_chk.SetToolTip(TEMPLATE_TOOLTIP)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.template_chk, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        # Pipelining: correlated requests with an in-flight window
+        self.pipe_box = wx.StaticBoxSizer(wx.VERTICAL, self, "Pipelining")
+        self.pipe_controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.correlate_chk = wx.CheckBox(self, label="Correlate")
+        self.correlate_chk.SetToolTip(
+            "Send [id, empty, message] and match replies by id. The peer must echo the envelope (REP does; ROUTER code must send it back)."
+        )
+        self.window_lbl = wx.StaticText(self, label="Window:")
+        self.window_spin = wx.SpinCtrl(self, min=1, max=100000, initial=Config.get(CONFIG_DEALER_WINDOW_KEY, Dealer.DEFAULT_WINDOW), size=(80, -1))
+        self.window_spin.SetToolTip("Maximum requests in flight")
+        self.timeout_lbl = wx.StaticText(self, label="Timeout (ms):")
+        self.timeout_spin = wx.SpinCtrl(
+            self, min=1, max=3600000, initial=Config.get(CONFIG_DEALER_TIMEOUT_KEY, Dealer.DEFAULT_TIMEOUT_MS), size=(80, -1)
+        )
+        self.load_count_lbl = wx.StaticText(self, label="Requests:")
+        self.load_count_spin = wx.SpinCtrl(self, min=0, max=2000000000, initial=0, size=(100, -1))
+        self.load_count_spin.SetToolTip("0 runs until stopped")
+        self.load_toggle_btn = wx.Button(self, label="Start Load")
+        self.load_toggle_btn.SetToolTip("Send the message continuously, keeping the window full")
+        self.load_toggle_btn.Enable(False)
+
+        for widget in (
+            self.correlate_chk,
+            self.window_lbl,
+            self.window_spin,
+            self.timeout_lbl,
+            self.timeout_spin,
+            self.load_count_lbl,
+            self.load_count_spin,
+            self.load_toggle_btn,
+        ):
+            self.pipe_controls_sizer.Add(widget, 0, wx.CENTER | wx.ALL, 3)
+
+        self.pipe_stats_lbl = wx.StaticText(self, label="Correlation off")
+        self.pipe_box.Add(self.pipe_controls_sizer, 0, wx.EXPAND)
+        self.pipe_box.Add(self.pipe_stats_lbl, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.pipe_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_pipe_timer, self.pipe_timer)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.pipe_box, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.connect_toggle_btn.Bind(wx.EVT_BUTTON, self.on_connect_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_message)
+        self.correlate_chk.Bind(wx.EVT_CHECKBOX, self.on_correlate_toggle)
+        self.load_toggle_btn.Bind(wx.EVT_BUTTON, self.on_load_toggle)
+
+        # Setup mixins
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_DEALER_KEY, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+        Dealer().set_callback(self.recv_message)
+
+    def on_connect_toggle(self, event):
+        if self.is_connected:
+            Dealer().disconnect()
+            self.is_connected = False
+            self.connect_toggle_btn.SetLabel("Connect")
+            self.send_btn.Enable(False)
+            self.address_txt.Enable(True)
+            self._on_load_stopped()
+            self.load_toggle_btn.Enable(False)
+        else:
+            addr = self.address_txt.GetValue().strip()
+            if not addr:
+                wx.MessageBox("Please enter an address", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            Config.set(CONFIG_DEALER_ADDRESS_KEY, addr)
+            success, message = Dealer().connect(addr)
+            if success:
+                self.is_connected = True
+                self.connect_toggle_btn.SetLabel("Disconnect")
+                self.send_btn.Enable(True)
+                self.address_txt.Enable(False)
+                self.load_toggle_btn.Enable(self.correlate_chk.GetValue())
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_send_message(self, event):
+        message = self.send_txt.GetValue()
+
+        try:
+            parsed = json.loads(message)
+            formatted = json.dumps(parsed, indent=2)
+            self.send_txt.SetValue(formatted)
+            message = formatted
+        except json.JSONDecodeError:
+            pass
+
+        success, msg = Dealer().send(message, template=self.template_chk.GetValue())
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+    def on_correlate_toggle(self, event):
+        enabled = self.correlate_chk.GetValue()
+        window = self.window_spin.GetValue()
+        timeout_ms = self.timeout_spin.GetValue()
+        success, message = Dealer().set_correlation(enabled, window, timeout_ms)
+        if not success:
+            self.correlate_chk.SetValue(False)
+            wx.MessageBox(message, "Pipelining Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        Config.set(CONFIG_DEALER_WINDOW_KEY, window)
+        Config.set(CONFIG_DEALER_TIMEOUT_KEY, timeout_ms)
+        # Window and timeout apply when correlation is switched on
+        self.window_spin.Enable(not enabled)
+        self.timeout_spin.Enable(not enabled)
+        self.load_toggle_btn.Enable(enabled and self.is_connected)
+        self._on_load_stopped()
+        if enabled:
+            self.pipe_timer.Start(500)
+            self._update_pipe_stats()
+        else:
+            self.pipe_timer.Stop()
+            self.pipe_stats_lbl.SetLabel("Correlation off")
+
+    def on_load_toggle(self, event):
+        dealer = Dealer()
+        if dealer.loading:
+            dealer.stop_load()
+            self._on_load_stopped()
+            return
+
+        success, message = dealer.start_load(
+            self.send_txt.GetValue(), count=self.load_count_spin.GetValue() or None, template=self.template_chk.GetValue()
+        )
+        if not success:
+            wx.MessageBox(message, "Load Error", wx.OK | wx.ICON_ERROR)
+            return
+        self.load_toggle_btn.SetLabel("Stop Load")
+        self.send_btn.Enable(False)
+
+    def _on_load_stopped(self):
+        self.load_toggle_btn.SetLabel("Start Load")
+        self.send_btn.Enable(self.is_connected)
+
+    def on_pipe_timer(self, event):
+        self._update_pipe_stats()
+
+    def _update_pipe_stats(self):
+        stats = Dealer().get_stats()
+        rtt = stats["rtt"]
+        last = format_duration_ns(rtt["last"]) if rtt["last"] is not None else "-"
+        self.pipe_stats_lbl.SetLabel(
+            f"Sent: {stats['sent']} | Replies: {stats['replies']} | In flight: {stats['outstanding']}/{stats['window']} | "
+            f"Timeouts: {stats['timeouts']} | Unmatched: {stats['unmatched']} | Rate: {stats['rate']:.0f} msg/s | "
+            f"RTT: {last} (p50 {format_duration_ns(rtt['p50'])}, p99 {format_duration_ns(rtt['p99'])}, max {format_duration_ns(rtt['max'])})"
+        )
+        if stats["loading"]:
+            if stats["last_reply"] is not None:
+                self.recv_message(stats["last_reply"].decode("utf-8", errors="replace"))
+        elif self.load_toggle_btn.GetLabel() == "Stop Load":
+            self._on_load_stopped()  # Request count reached
+
+    def recv_message(self, message):
+        try:
+            if isinstance(message, str):
+                parsed = json.loads(message)
+                self.recv_txt.SetValue(json.dumps(parsed, indent=2))
+            elif isinstance(message, dict):
+                self.recv_txt.SetValue(json.dumps(message, indent=2))
+            else:
+                self.recv_txt.SetValue(str(message))
+        except json.JSONDecodeError:
+            self.recv_txt.SetValue(str(message))
+
+
+class RouterPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin, RecordMixin):
+    """UI Panel for ROUTER socket - async REP that handles multiple clients."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_bound = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Port and Bind button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.port_lbl = wx.StaticText(self, label="Port:")
+        default_port = Config.get(CONFIG_ROUTER_PORT_KEY, "5558")
+        self.port_txt = wx.TextCtrl(self, value=default_port, size=(80, -1))
+        self.bind_toggle_btn = wx.Button(self, label="Bind")
+
+        self.top_sizer.Add(self.port_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.port_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.bind_toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.setup_record(Router, "Router", self.top_sizer)
+
+        # Create horizontal splitter for Send/Recv
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Send Side Panel
+        self.send_panel = wx.Panel(self.h_splitter)
+        self.send_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_lbl = wx.StaticText(self.send_panel, label="Reply:")
+
+        self.v_splitter = wx.SplitterWindow(self.send_panel, style=wx.SP_LIVE_UPDATE)
+
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_txt = wx.TextCtrl(self.msg_panel, value="Enter your reply here", style=wx.TE_MULTILINE)
+        self.msg_panel_sizer.Add(self.send_txt, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Replies:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.send_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.send_sizer.Add(self.v_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.send_panel.SetSizer(self.send_sizer)
+
+        # Recv Side Panel
+        self.recv_panel = wx.Panel(self.h_splitter)
+        self.recv_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recv_lbl = wx.StaticText(self.recv_panel, label="Received Request:")
+        self.recv_txt = wx.TextCtrl(
+            self.recv_panel,
+            value="\n\n\n\t\tReceived request will be displayed here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+        self.recv_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.recv_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.recv_panel.SetSizer(self.recv_sizer)
+
+        self.h_splitter.SplitVertically(self.send_panel, self.recv_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.reply_to_lbl = wx.StaticText(self, label="Reply to:")
+        self.reply_to_choice = wx.Choice(self, choices=["Oldest request", "Selected peer"])
+        self.reply_to_choice.SetSelection(0)
+        self.reply_to_choice.SetToolTip("Oldest request answers the request that has waited longest, whichever peer sent it")
+        self.send_btn = wx.Button(self, label="Send Reply")
+        self.send_btn.Enable(False)
+        self.broadcast_btn = wx.Button(self, label="Broadcast")
+        self.broadcast_btn.SetToolTip("Send to every peer, answering each one's oldest request")
+        self.broadcast_btn.Enable(False)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.reply_to_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.Add(self.reply_to_choice, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.Add(self.broadcast_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        # Peers table, refreshed while bound
+        self.peers_box = wx.StaticBoxSizer(wx.VERTICAL, self, "Peers")
+        self.peer_rows = []
+        self.selected_identity = None
+        self.peer_list = VirtualListCtrl(
+            self,
+            [("Peer", 150), ("Messages", 80), ("Bytes", 80), ("Replies", 80), ("Pending", 70), ("Last Seen", 80)],
+            self._get_peer_row,
+        )
+        self.peer_list.SetMinSize((-1, 120))
+        self.router_stats_lbl = wx.StaticText(self, label="Not bound")
+        self.idle_lbl = wx.StaticText(self, label="Forget idle (s):")
+        self.idle_spin = wx.SpinCtrl(
+            self, min=0, max=86400, initial=Config.get(CONFIG_ROUTER_PEER_IDLE_KEY, Router.DEFAULT_PEER_IDLE_SEC), size=(80, -1)
+        )
+        self.idle_spin.SetToolTip("Forget peers with no pending request after this many seconds without traffic (0 = keep them)")
+        self.peers_ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.peers_ctrl_sizer.Add(self.router_stats_lbl, 1, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.peers_ctrl_sizer.Add(self.idle_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.peers_ctrl_sizer.Add(self.idle_spin, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.peers_box.Add(self.peers_ctrl_sizer, 0, wx.EXPAND)
+        self.peers_box.Add(self.peer_list, 1, wx.EXPAND | wx.ALL, 5)
+
+        # Auto reply rules, applied in the receive thread
+        self.auto_box = wx.StaticBoxSizer(wx.VERTICAL, self, "Auto Reply Rules")
+        self.rules_txt = wx.TextCtrl(self, value=Config.get(CONFIG_ROUTER_RULES_KEY, "* => ok"), style=wx.TE_MULTILINE)
+        self.rules_txt.SetToolTip(RULES_TOOLTIP)
+        self.auto_reply_chk = wx.CheckBox(self, label="Auto Reply")
+        self.auto_template_chk = wx.CheckBox(self, label="Template")
+        self.auto_template_chk.SetToolTip(TEMPLATE_TOOLTIP)
+        self.auto_ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.auto_ctrl_sizer.Add(self.auto_reply_chk, 0, wx.CENTER | wx.ALL, 3)
+        self.auto_ctrl_sizer.Add(self.auto_template_chk, 0, wx.CENTER | wx.ALL, 3)
+        self.auto_box.Add(self.rules_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.auto_box.Add(self.auto_ctrl_sizer, 0, wx.EXPAND)
+
+        self.bottom_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.bottom_sizer.Add(self.peers_box, 2, wx.EXPAND | wx.RIGHT, 5)
+        self.bottom_sizer.Add(self.auto_box, 1, wx.EXPAND)
+
+        self.peers_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_peers_timer, self.peers_timer)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.bottom_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.bind_toggle_btn.Bind(wx.EVT_BUTTON, self.on_bind_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_reply)
+        self.broadcast_btn.Bind(wx.EVT_BUTTON, self.on_broadcast)
+        self.peer_list.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_peer_selected)
+        self.auto_reply_chk.Bind(wx.EVT_CHECKBOX, self.on_auto_reply_toggle)
+        self.idle_spin.Bind(wx.EVT_SPINCTRL, self.on_idle_changed)
+
+        # Setup mixins
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_ROUTER_KEY, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+        Router().set_callback(self.on_request_received)
+        Router().set_peer_idle_timeout(self.idle_spin.GetValue())
+
+    def on_bind_toggle(self, event):
+        if self.is_bound:
+            success, message = Router().unbind()
+            if success:
+                self.is_bound = False
+                self.bind_toggle_btn.SetLabel("Bind")
+                self.send_btn.Enable(False)
+                self.broadcast_btn.Enable(False)
+                self.port_txt.Enable(True)
+                self.peers_timer.Stop()
+                self.selected_identity = None
+                self._update_peers()
+                self.router_stats_lbl.SetLabel("Not bound")
+            else:
+                wx.MessageBox(message, "Unbind Error", wx.OK | wx.ICON_ERROR)
+        else:
+            port = self.port_txt.GetValue().strip()
+            if not port:
+                wx.MessageBox("Please enter a port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            if not port.isdigit():
+                wx.MessageBox("Port must be a number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            Config.set(CONFIG_ROUTER_PORT_KEY, port)
+            success, message = Router().bind(port)
+            if success:
+                self.is_bound = True
+                self.bind_toggle_btn.SetLabel("Unbind")
+                self.send_btn.Enable(True)
+                self.broadcast_btn.Enable(True)
+                self.port_txt.Enable(False)
+                self.peers_timer.Start(500)
+            else:
+                wx.MessageBox(message, "Bind Error", wx.OK | wx.ICON_ERROR)
+
+    def on_request_received(self, message):
+        try:
+            if isinstance(message, str):
+                parsed = json.loads(message)
+                self.recv_txt.SetValue(json.dumps(parsed, indent=2))
+            elif isinstance(message, dict):
+                self.recv_txt.SetValue(json.dumps(message, indent=2))
+            else:
+                self.recv_txt.SetValue(str(message))
+        except json.JSONDecodeError:
+            self.recv_txt.SetValue(str(message))
+
+    def _get_reply_text(self):
+        """Reply text, reformatted in place if it is JSON."""
+        message = self.send_txt.GetValue()
+
+        try:
+            parsed = json.loads(message)
+            formatted = json.dumps(parsed, indent=2)
+            self.send_txt.SetValue(formatted)
+            message = formatted
+        except json.JSONDecodeError:
+            pass
+        return message
+
+    def on_send_reply(self, event):
+        identity = None
+        if self.reply_to_choice.GetSelection() == 1:
+            if self.selected_identity is None:
+                wx.MessageBox("Select a peer in the Peers table", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            identity = self.selected_identity
+
+        message = self._get_reply_text()
+        success, msg = Router().send_reply(message, identity)
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+        self._update_peers()
+
+    def on_broadcast(self, event):
+        message = self._get_reply_text()
+        success, msg = Router().broadcast(message)
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+        self._update_peers()
+
+    def on_auto_reply_toggle(self, event):
+        if not self.auto_reply_chk.GetValue():
+            Router().set_auto_reply_rules(None)
+            self.rules_txt.Enable(True)
+            self.auto_template_chk.Enable(True)
+            return
+        rules = self.rules_txt.GetValue()
+        success, msg = Router().set_auto_reply_rules(rules, template=self.auto_template_chk.GetValue())
+        if not success:
+            self.auto_reply_chk.SetValue(False)
+            wx.MessageBox(msg, "Auto Reply Error", wx.OK | wx.ICON_ERROR)
+            return
+        Config.set(CONFIG_ROUTER_RULES_KEY, rules)
+        # Rules are fixed while auto-replying; untick to edit them
+        self.rules_txt.Enable(False)
+        self.auto_template_chk.Enable(False)
+
+    def on_idle_changed(self, event):
+        seconds = self.idle_spin.GetValue()
+        Config.set(CONFIG_ROUTER_PEER_IDLE_KEY, seconds)
+        Router().set_peer_idle_timeout(seconds)
+
+    def on_peer_selected(self, event):
+        index = event.GetIndex()
+        if index >= len(self.peer_rows):
+            return
+        peer = self.peer_rows[index]
+        self.selected_identity = peer["identity"]
+        self.reply_to_choice.SetSelection(1)
+        if peer["oldest_request"] is not None:
+            self.on_request_received(peer["oldest_request"].decode("utf-8", errors="replace"))
+
+    def _get_peer_row(self, index):
+        if index >= len(self.peer_rows):
+            return None
+        peer = self.peer_rows[index]
+        return (
+            format_identity(peer["identity"]),
+            str(peer["messages"]),
+            format_bytes(peer["bytes"]),
+            str(peer["replies"]),
+            str(peer["pending"]),
+            time.strftime("%H:%M:%S", time.localtime(peer["last_seen"])),
+        )
+
+    def on_peers_timer(self, event):
+        self._update_peers()
+
+    def _update_peers(self):
+        router = Router()
+        stats = router.get_stats()
+        self.peer_rows = router.get_peers()
+        if self.selected_identity is not None and all(peer["identity"] != self.selected_identity for peer in self.peer_rows):
+            self.selected_identity = None  # Peer went away
+        self.peer_list.update_rows(len(self.peer_rows))
+        self.router_stats_lbl.SetLabel(
+            f"Peers: {stats['peers']} (forgotten {stats['evicted']}) | Requests: {stats['requests']} | Replies: {stats['replies']} (auto {stats['auto_replies']}) | "
+            f"Pending: {stats['pending']} | Rate: {stats['rate']:.0f} req/s"
+        )
+
+
+class PairPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    """UI Panel for PAIR socket - exclusive 1:1 bidirectional connection."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_active = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Mode, Address/Port, Connect button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.mode_lbl = wx.StaticText(self, label="Mode:")
+        self.mode_choice = wx.Choice(self, choices=["Connect", "Bind"])
+        self.mode_choice.SetSelection(0 if Config.get(CONFIG_PAIR_MODE_KEY, "connect") == "connect" else 1)
+
+        self.addr_lbl = wx.StaticText(self, label="Address/Port:")
+        default_addr = Config.get(CONFIG_PAIR_ADDRESS_KEY, "tcp://localhost:5559")
+        self.addr_txt = wx.TextCtrl(self, value=default_addr, size=(200, -1))
+
+        self.connect_toggle_btn = wx.Button(self, label="Start")
+
+        self.top_sizer.Add(self.mode_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.mode_choice, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.addr_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.addr_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.connect_toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+
+        # Create horizontal splitter for Send/Recv
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Send Side Panel
+        self.send_panel = wx.Panel(self.h_splitter)
+        self.send_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_lbl = wx.StaticText(self.send_panel, label="Send:")
+
+        self.v_splitter = wx.SplitterWindow(self.send_panel, style=wx.SP_LIVE_UPDATE)
+
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_txt = wx.TextCtrl(self.msg_panel, value="Enter your message here", style=wx.TE_MULTILINE)
+        self.msg_panel_sizer.Add(self.send_txt, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.send_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.send_sizer.Add(self.v_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.send_panel.SetSizer(self.send_sizer)
+
+        # Recv Side Panel
+        self.recv_panel = wx.Panel(self.h_splitter)
+        self.recv_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recv_lbl = wx.StaticText(self.recv_panel, label="Received:")
+        self.recv_txt = wx.TextCtrl(
+            self.recv_panel,
+            value="\n\n\n\t\tReceived message will be displayed here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+        self.recv_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.recv_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.recv_panel.SetSizer(self.recv_sizer)
+
+        self.h_splitter.SplitVertically(self.send_panel, self.recv_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.send_btn = wx.Button(self, label="Send Message")
+        self.send_btn.Enable(False)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.connect_toggle_btn.Bind(wx.EVT_BUTTON, self.on_connect_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_message)
+
+        # Setup mixins
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_PAIR_KEY, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+        PairSocket().set_callback(self.recv_message)
+
+    def on_connect_toggle(self, event):
+        if self.is_active:
+            PairSocket().stop()
+            self.is_active = False
+            self.connect_toggle_btn.SetLabel("Start")
+            self.send_btn.Enable(False)
+            self.addr_txt.Enable(True)
+            self.mode_choice.Enable(True)
+        else:
+            addr = self.addr_txt.GetValue().strip()
+            if not addr:
+                wx.MessageBox("Please enter an address or port", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            mode = "connect" if self.mode_choice.GetSelection() == 0 else "bind"
+            Config.set(CONFIG_PAIR_MODE_KEY, mode)
+            Config.set(CONFIG_PAIR_ADDRESS_KEY, addr)
+
+            if mode == "connect":
+                success, message = PairSocket().connect(addr)
+            else:
+                # Extract port from address if full address given, or use as-is
+                port = addr.replace("tcp://*:", "").replace("tcp://localhost:", "")
+                if not port.isdigit():
+                    wx.MessageBox("For bind mode, please enter a port number or tcp://*:port", "Input Error", wx.OK | wx.ICON_WARNING)
+                    return
+                success, message = PairSocket().bind(port)
+
+            if success:
+                self.is_active = True
+                self.connect_toggle_btn.SetLabel("Stop")
+                self.send_btn.Enable(True)
+                self.addr_txt.Enable(False)
+                self.mode_choice.Enable(False)
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_send_message(self, event):
+        message = self.send_txt.GetValue()
+
+        try:
+            parsed = json.loads(message)
+            formatted = json.dumps(parsed, indent=2)
+            self.send_txt.SetValue(formatted)
+            message = formatted
+        except json.JSONDecodeError:
+            pass
+
+        success, msg = PairSocket().send(message)
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+    def recv_message(self, message):
+        try:
+            if isinstance(message, str):
+                parsed = json.loads(message)
+                self.recv_txt.SetValue(json.dumps(parsed, indent=2))
+            elif isinstance(message, dict):
+                self.recv_txt.SetValue(json.dumps(message, indent=2))
+            else:
+                self.recv_txt.SetValue(str(message))
+        except json.JSONDecodeError:
+            self.recv_txt.SetValue(str(message))
+
+
+class XPublisherPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    """UI Panel for XPUB socket - publishes and shows subscription events."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.is_bound = False
+
+        # Controls
+        self.controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.port_lbl = wx.StaticText(self, label="Port:")
+        self.port_txt = wx.TextCtrl(self, value=Config.get(CONFIG_XPUB_PORT_KEY, "5560"), size=(80, -1))
+
+        self.bind_toggle_btn = wx.Button(self, label="Bind")
+
+        self.topic_lbl = wx.StaticText(self, label="Topic:")
+        self.topic_txt = wx.TextCtrl(self, value="test", size=(100, -1))
+
+        self.controls_sizer.Add(self.port_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.port_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.bind_toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.topic_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.topic_txt, 0, wx.CENTER | wx.ALL, 5)
+
+        # Create horizontal splitter for message and subscriptions
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Left side - Message input
+        self.left_panel = wx.Panel(self.h_splitter)
+        self.left_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        self.v_splitter = wx.SplitterWindow(self.left_panel, style=wx.SP_LIVE_UPDATE)
+
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.msg_lbl = wx.StaticText(self.msg_panel, label="Message:")
+        self.msg_txt = wx.TextCtrl(self.msg_panel, value="Enter your message here", style=wx.TE_MULTILINE)
+        self.msg_sizer.Add(self.msg_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.msg_sizer.Add(self.msg_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.msg_panel.SetSizer(self.msg_sizer)
+
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.left_sizer.Add(self.v_splitter, 1, wx.EXPAND)
+        self.left_panel.SetSizer(self.left_sizer)
+
+        # Right side - Subscription events
+        self.right_panel = wx.Panel(self.h_splitter)
+        self.right_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.subs_lbl = wx.StaticText(self.right_panel, label="Subscription Events:")
+        self.subs_list = wx.dataview.DataViewListCtrl(self.right_panel)
+        self.subs_list.AppendTextColumn("Time", width=80)
+        self.subs_list.AppendTextColumn("Action", width=100)
+        self.subs_list.AppendTextColumn("Topic", width=150)
+        self.right_sizer.Add(self.subs_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.right_sizer.Add(self.subs_list, 1, wx.EXPAND | wx.ALL, 5)
+        self.right_panel.SetSizer(self.right_sizer)
+
+        self.h_splitter.SplitVertically(self.left_panel, self.right_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Publish Button
+        self.pub_btn = wx.Button(self, label="Publish Message")
+        self.pub_btn.Enable(False)
+
+        self.main_sizer.Add(self.controls_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.pub_btn, 0, wx.ALIGN_RIGHT | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.bind_toggle_btn.Bind(wx.EVT_BUTTON, self.on_bind_toggle)
+        self.pub_btn.Bind(wx.EVT_BUTTON, self.on_publish)
+
+        # Setup mixins
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_XPUB_KEY, self.msg_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+        XPublisher().set_subscription_callback(self.on_subscription_event)
+
+    def on_bind_toggle(self, event):
+        if self.is_bound:
+            success, message = XPublisher().unbind()
+            if success:
+                self.is_bound = False
+                self.bind_toggle_btn.SetLabel("Bind")
+                self.pub_btn.Enable(False)
+                self.port_txt.Enable(True)
+            else:
+                wx.MessageBox(message, "Unbind Error", wx.OK | wx.ICON_ERROR)
+        else:
+            port = self.port_txt.GetValue().strip()
+            if not port or not port.isdigit():
+                wx.MessageBox("Please enter a valid port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            success, message = XPublisher().bind(port)
+            if success:
+                Config.set(CONFIG_XPUB_PORT_KEY, port)
+                self.is_bound = True
+                self.bind_toggle_btn.SetLabel("Unbind")
+                self.pub_btn.Enable(True)
+                self.port_txt.Enable(False)
+            else:
+                wx.MessageBox(message, "Bind Error", wx.OK | wx.ICON_ERROR)
+
+    def on_subscription_event(self, action, topic):
+        """Handle subscription/unsubscription events from clients."""
+        timestamp = time.strftime("%H:%M:%S")
+        self.subs_list.AppendItem([timestamp, action, topic or "(all)"])
+
+    def on_publish(self, event):
+        topic = self.topic_txt.GetValue().strip()
+        message = self.msg_txt.GetValue()
+
+        if not topic:
+            wx.MessageBox("Please enter a topic", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+
+        try:
+            parsed = json.loads(message)
+            formatted = json.dumps(parsed, indent=2)
+            self.msg_txt.SetValue(formatted)
+            message = formatted
+        except json.JSONDecodeError:
+            pass
+
+        success, msg = XPublisher().send_message(topic, message)
+        if not success:
+            wx.MessageBox(msg, "Publish Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+
+class XSubscriberPanel(wx.Panel, RecordMixin):
+    """UI Panel for XSUB socket - subscribes with explicit subscription control."""
+
+    # Maximum message length to display in table (truncate longer messages)
+    MAX_TABLE_MSG_LENGTH = 500
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_running = False
+        self.topic_frames = {}  # {topic: TopicFrame}
+        self.stats_topics = []  # Row order of stats_list
+        self.stats_rows = {}  # {topic: [column strings]} rendered on demand by stats_list
+        self.msg_topics = []  # Row order of msg_list
+        self.msg_rows = {}  # {topic: [column strings]} rendered on demand by msg_list
+        self.active_topics = set()  # Topics shown with a non-zero rate, refreshed until it decays
+        self.start_time = None
+
+        # UI update timer (10ms interval)
+        self.update_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_update_timer, self.update_timer)
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Controls
+        self.controls_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.addr_lbl = wx.StaticText(self, label="Address:")
+        self.addr_txt = wx.TextCtrl(
+            self,
+            value=Config.get(CONFIG_XSUB_ADDRESS_KEY, "tcp://localhost:5560"),
+            size=(200, -1),
+        )
+        self.topic_lbl = wx.StaticText(self, label="Topics (comma sep):")
+        self.topic_txt = wx.TextCtrl(self, value="", size=(150, -1))
+
+        self.toggle_btn = wx.Button(self, label="Start")
+
+        self.controls_sizer.Add(self.addr_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.addr_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.topic_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.topic_txt, 1, wx.CENTER | wx.ALL, 5)
+        self.controls_sizer.Add(self.toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.setup_record(XSubscriber, "XSubscriber", self.controls_sizer)
+
+        # Create splitter for messages and stats
+        self.splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Message List Panel
+        self.msg_panel = wx.Panel(self.splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.msg_list = VirtualListCtrl(self.msg_panel, [("Topic", 100), ("Message", 400)], self._get_msg_row)
+        self.msg_panel_sizer.Add(self.msg_list, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        # Statistics Panel
+        self.stats_panel = wx.Panel(self.splitter)
+        self.stats_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Stats header with reset button
+        stats_header_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        stats_header = wx.StaticText(self.stats_panel, label="Statistics")
+        stats_header.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        stats_header_sizer.Add(stats_header, 0, wx.CENTER | wx.ALL, 5)
+        stats_header_sizer.AddStretchSpacer(1)
+        self.reset_stats_btn = wx.Button(self.stats_panel, label="Reset Stats")
+        stats_header_sizer.Add(self.reset_stats_btn, 0, wx.ALL, 2)
+        self.stats_sizer.Add(stats_header_sizer, 0, wx.EXPAND | wx.ALL, 2)
+
+        # Totals section title
+        totals_title = wx.StaticText(self.stats_panel, label="Totals")
+        totals_title.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.stats_sizer.Add(totals_title, 0, wx.LEFT | wx.TOP, 5)
+
+        # Summary stats grid
+        summary_grid = wx.FlexGridSizer(2, 6, 5, 20)  # 2 rows, 6 cols, vgap=5, hgap=20
+        for i in range(6):
+            summary_grid.AddGrowableCol(i, 1)
+
+        # Row 1: Labels
+        for label in ["Messages", "Data Size", "Topics", "Rate", "Speed", "Msgs/Wake"]:
+            lbl = wx.StaticText(self.stats_panel, label=label)
+            lbl.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            summary_grid.Add(lbl, 0, wx.ALIGN_CENTER)
+
+        # Row 2: Values
+        self.summary_msgs = wx.StaticText(self.stats_panel, label="0")
+        self.summary_bytes = wx.StaticText(self.stats_panel, label="0 bytes")
+        self.summary_topics = wx.StaticText(self.stats_panel, label="0")
+        self.summary_rate = wx.StaticText(self.stats_panel, label="-")
+        self.summary_speed = wx.StaticText(self.stats_panel, label="-")
+        self.summary_batch = wx.StaticText(self.stats_panel, label="-")
+
+        summary_grid.Add(self.summary_msgs, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_bytes, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_topics, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_rate, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_speed, 0, wx.ALIGN_CENTER)
+        summary_grid.Add(self.summary_batch, 0, wx.ALIGN_CENTER)
+
+        self.stats_sizer.Add(summary_grid, 0, wx.EXPAND | wx.ALL, 5)
+
+        # Per-Topic section title
+        per_topic_title = wx.StaticText(self.stats_panel, label="Per Topic")
+        per_topic_title.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.stats_sizer.Add(per_topic_title, 0, wx.LEFT | wx.TOP | wx.BOTTOM, 5)
+
+        # Stats list
+        self.stats_list = VirtualListCtrl(
+            self.stats_panel,
+            [("Topic", 150), ("Count", 100), ("Bytes", 120), ("Rate (msg/s)", 120), ("Last Received", 150)],
+            self._get_stats_row,
+        )
+        self.stats_sizer.Add(self.stats_list, 1, wx.EXPAND)
+
+        self.stats_panel.SetSizer(self.stats_sizer)
+
+        self.splitter.SplitHorizontally(self.msg_panel, self.stats_panel)
+        self.splitter.SetSashGravity(0.5)
+        self.splitter.SetMinimumPaneSize(100)
+
+        self.main_sizer.Add(self.controls_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.splitter, 1, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.toggle_btn.Bind(wx.EVT_BUTTON, self.on_toggle)
+        self.reset_stats_btn.Bind(wx.EVT_BUTTON, self.on_reset_stats)
+        self.msg_list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_item_activated)
+        self.msg_list.Bind(wx.EVT_CONTEXT_MENU, self.on_msg_list_right_click)
+        self.Bind(wx.EVT_SIZE, self.on_size)
+
+        self._splitter_initialized = False
+        # No callback needed - we poll data via timer
+
+    def on_size(self, event):
+        event.Skip()
+        if not self._splitter_initialized and self.GetSize().GetWidth() > 0:
+            wx.CallAfter(self._init_splitter_position)
+            self._splitter_initialized = True
+
+    def _init_splitter_position(self):
+        size = self.splitter.GetSize().GetHeight()
+        if size > 0:
+            self.splitter.SetSashPosition(size // 2)
+        self.stats_panel.Layout()
+
+    def on_reset_stats(self, event):
+        """Reset all statistics."""
+        XSubscriber().reset_stats()
+        self.start_time = time.time() if self.is_running else None
+        self.stats_topics = []
+        self.stats_rows = {}
+        self.stats_list.update_rows(0)
+        self.active_topics = set()
+        self._update_display()
+
+    def on_toggle(self, event):
+        if self.is_running:
+            self.update_timer.Stop()
+            XSubscriber().stop()
+            self.is_running = False
+            self.toggle_btn.SetLabel("Start")
+            self.addr_txt.Enable(True)
+            self.topic_txt.Enable(True)
+        else:
+            addr = self.addr_txt.GetValue().strip()
+            topics_str = self.topic_txt.GetValue().strip()
+
+            if not addr:
+                wx.MessageBox("Please enter an address", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            if topics_str:
+                topics = [t.strip() for t in topics_str.split(",") if t.strip()]
+            else:
+                topics = [""]
+
+            Config.set(CONFIG_XSUB_ADDRESS_KEY, addr)
+            batch_size = Config.get(CONFIG_RECV_BATCH_SIZE_KEY, DEFAULT_RECV_BATCH_SIZE)
+            success, message = XSubscriber().start(topics, addr, batch_size)
+            if success:
+                self.is_running = True
+                self.start_time = time.time()
+                self.toggle_btn.SetLabel("Stop")
+                self.addr_txt.Enable(False)
+                self.topic_txt.Enable(False)
+                # Start UI update timer (100ms interval)
+                self.update_timer.Start(100)
+                wx.CallAfter(self.stats_panel.Layout)
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_update_timer(self, event):
+        """Timer callback - update UI with latest data from XSubscriber (every 100ms)."""
+        self._update_display()
+
+    def _update_display(self):
+        """Update the UI with current data from the XSubscriber singleton."""
+        xsubscriber = XSubscriber()
+        # Only topics that received messages, or whose rate is still decaying, need their rows touched
+        dirty_topics = xsubscriber.pop_dirty_topics()
+        topic_stats = xsubscriber.get_stats(dirty_topics | self.active_topics)
+        latest_messages = xsubscriber.get_messages(dirty_topics)
+        instant_totals = xsubscriber.get_instant_totals()
+
+        # Update summary statistics (cumulative counts, instant rates)
+        has_topics = instant_totals["topics"] > 0
+
+        # Use instant rates from sliding window (last 1 second)
+        instant_count = instant_totals["instant_count"]
+        instant_bytes = instant_totals["instant_bytes"]
+        rate_str = f"{instant_count:.2f} msg/s" if has_topics else "-"
+        speed_str = format_speed(instant_bytes) if has_topics else "-"
+
+        self.summary_msgs.SetLabel(str(instant_totals["count"]))
+        self.summary_bytes.SetLabel(format_bytes(instant_totals["bytes"]))
+        self.summary_topics.SetLabel(str(instant_totals["topics"]))
+        self.summary_rate.SetLabel(rate_str)
+        self.summary_speed.SetLabel(speed_str)
+        self.summary_batch.SetLabel(f"{instant_totals['messages_per_wake']:.1f}" if has_topics else "-")
+
+        # Update per-topic stats
+        active_topics = set()
+        for topic, stats in topic_stats.items():
+            # Use instant rate from sliding window for per-topic rate
+            instant_rate = stats.get("instant_rate", 0.0)
+            rate_str = f"{instant_rate:.2f}" if instant_rate > 0 else "-"
+            bytes_str = format_bytes(stats["bytes"]).replace(" bytes", " B")
+            last_time = time.strftime("%H:%M:%S", time.localtime(stats["last_time"]))
+            if instant_rate > 0:
+                active_topics.add(topic)
+
+            if topic not in self.stats_rows:
+                self.stats_topics.append(topic)
+            self.stats_rows[topic] = [topic, str(stats["count"]), bytes_str, rate_str, last_time]
+        self.active_topics = active_topics
+        if topic_stats:
+            self.stats_list.update_rows(len(self.stats_topics))
+
+        # Update message list (truncate to MAX_TABLE_MSG_LENGTH)
+        for topic, message in latest_messages.items():
+            msg_str = message.text()
+            # Truncate for table display
+            if len(msg_str) > self.MAX_TABLE_MSG_LENGTH:
+                msg_str = msg_str[: self.MAX_TABLE_MSG_LENGTH] + "..."
+
+            if topic not in self.msg_rows:
+                self.msg_topics.append(topic)
+            self.msg_rows[topic] = [topic, msg_str]
+
+            # Update topic frame if exists (with full message, no truncation)
+            if topic in self.topic_frames:
+                frame = self.topic_frames.get(topic)
+                if frame:
+                    frame.update_message(message)
+                else:
+                    del self.topic_frames[topic]
+        if latest_messages:
+            self.msg_list.update_rows(len(self.msg_topics))
+
+    def _get_stats_row(self, index):
+        if index < len(self.stats_topics):
+            return self.stats_rows[self.stats_topics[index]]
+        return None
+
+    def _get_msg_row(self, index):
+        if index < len(self.msg_topics):
+            return self.msg_rows[self.msg_topics[index]]
+        return None
+
+    def on_item_activated(self, event):
+        selection = event.GetIndex()
+        if 0 <= selection < len(self.msg_topics):
+            topic = self.msg_topics[selection]
+
+            # Get full message from XSubscriber (not truncated table version)
+            latest_messages = XSubscriber().get_messages()
+            message = latest_messages.get(topic, "")
+
+            if topic not in self.topic_frames or not self.topic_frames[topic]:
+                self.topic_frames[topic] = TopicFrame(self, topic)
+
+            self.topic_frames[topic].update_message(message)
+            self.topic_frames[topic].Raise()
+
+    def on_msg_list_right_click(self, event):
+        menu = wx.Menu()
+        clear_item = menu.Append(wx.ID_ANY, "Clear Messages")
+        self.Bind(wx.EVT_MENU, self.on_clear_messages, clear_item)
+        self.PopupMenu(menu)
+        menu.Destroy()
+
+    def on_clear_messages(self, event):
+        self.msg_topics = []
+        self.msg_rows = {}
+        self.msg_list.update_rows(0)
+
+
+class StreamPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    """UI Panel for STREAM socket - raw TCP connection."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_active = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Mode, Address/Port, Connect button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.mode_lbl = wx.StaticText(self, label="Mode:")
+        self.mode_choice = wx.Choice(self, choices=["Connect", "Bind"])
+        self.mode_choice.SetSelection(0 if Config.get(CONFIG_STREAM_MODE_KEY, "connect") == "connect" else 1)
+
+        self.addr_lbl = wx.StaticText(self, label="Address/Port:")
+        default_addr = Config.get(CONFIG_STREAM_ADDRESS_KEY, "tcp://localhost:8080")
+        self.addr_txt = wx.TextCtrl(self, value=default_addr, size=(200, -1))
+
+        self.connect_toggle_btn = wx.Button(self, label="Start")
+
+        self.top_sizer.Add(self.mode_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.mode_choice, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.addr_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.addr_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.connect_toggle_btn, 0, wx.CENTER | wx.ALL, 5)
+
+        # Create horizontal splitter for Send/Recv
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Send Side Panel
+        self.send_panel = wx.Panel(self.h_splitter)
+        self.send_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_lbl = wx.StaticText(self.send_panel, label="Send (raw data):")
+
+        self.v_splitter = wx.SplitterWindow(self.send_panel, style=wx.SP_LIVE_UPDATE)
+
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_txt = wx.TextCtrl(self.msg_panel, value="GET / HTTP/1.1\r\nHost: localhost\r\n\r\n", style=wx.TE_MULTILINE)
+        self.msg_panel_sizer.Add(self.send_txt, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.send_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.send_sizer.Add(self.v_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.send_panel.SetSizer(self.send_sizer)
+
+        # Recv Side Panel
+        self.recv_panel = wx.Panel(self.h_splitter)
+        self.recv_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recv_lbl = wx.StaticText(self.recv_panel, label="Received (raw data):")
+        self.recv_txt = wx.TextCtrl(
+            self.recv_panel,
+            value="\n\n\n\t\tReceived data will be displayed here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+        self.recv_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.recv_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.recv_panel.SetSizer(self.recv_sizer)
+
+        self.h_splitter.SplitVertically(self.send_panel, self.recv_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.peer_lbl = wx.StaticText(self, label="Peer: None")
+        self.send_btn = wx.Button(self, label="Send Data")
+        self.send_btn.Enable(False)
+        self.ctrl_sizer.Add(self.peer_lbl, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.connect_toggle_btn.Bind(wx.EVT_BUTTON, self.on_connect_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_message)
+
+        # Setup mixins
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_STREAM_KEY, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+        StreamSocket().set_callback(self.recv_message)
+
+    def on_connect_toggle(self, event):
+        if self.is_active:
+            StreamSocket().stop()
+            self.is_active = False
+            self.connect_toggle_btn.SetLabel("Start")
+            self.send_btn.Enable(False)
+            self.addr_txt.Enable(True)
+            self.mode_choice.Enable(True)
+            self.peer_lbl.SetLabel("Peer: None")
+        else:
+            addr = self.addr_txt.GetValue().strip()
+            if not addr:
+                wx.MessageBox("Please enter an address or port", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            mode = "connect" if self.mode_choice.GetSelection() == 0 else "bind"
+            Config.set(CONFIG_STREAM_MODE_KEY, mode)
+            Config.set(CONFIG_STREAM_ADDRESS_KEY, addr)
+
+            if mode == "connect":
+                success, message = StreamSocket().connect(addr)
+            else:
+                port = addr.replace("tcp://*:", "").replace("tcp://localhost:", "")
+                if not port.isdigit():
+                    wx.MessageBox("For bind mode, enter a port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                    return
+                success, message = StreamSocket().bind(port)
+
+            if success:
+                self.is_active = True
+                self.connect_toggle_btn.SetLabel("Stop")
+                self.send_btn.Enable(True)
+                self.addr_txt.Enable(False)
+                self.mode_choice.Enable(False)
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_send_message(self, event):
+        message = self.send_txt.GetValue()
+
+        success, msg = StreamSocket().send(message)
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+    def recv_message(self, peer_id, message):
+        self.peer_lbl.SetLabel(f"Peer: {peer_id}")
+        # Append to received text, replacing the placeholder on first data
+        if self.recv_txt.GetRange(0, 5) == "\n\n\n\t\t":
+            self.recv_txt.SetValue("")
+        append_capped_text(self.recv_txt, message, Config.get(CONFIG_DISPLAY_MAX_CHARS_KEY, DEFAULT_DISPLAY_MAX_CHARS))
+
+
+class ClientPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    """UI Panel for CLIENT socket - async request (draft API)."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_connected = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Address, Connect button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.addr_lbl = wx.StaticText(self, label="Server Address:")
+        default_addr = Config.get(CONFIG_CLIENT_ADDRESS_KEY, "tcp://localhost:5555")
+        self.addr_txt = wx.TextCtrl(self, value=default_addr, size=(200, -1))
+
+        self.connect_btn = wx.Button(self, label="Connect")
+
+        self.top_sizer.Add(self.addr_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.addr_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.connect_btn, 0, wx.CENTER | wx.ALL, 5)
+
+        # Create horizontal splitter for Send/Recv
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Send Side Panel
+        self.send_panel = wx.Panel(self.h_splitter)
+        self.send_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_lbl = wx.StaticText(self.send_panel, label="Message to Send:")
+
+        self.v_splitter = wx.SplitterWindow(self.send_panel, style=wx.SP_LIVE_UPDATE)
+
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_txt = wx.TextCtrl(self.msg_panel, style=wx.TE_MULTILINE)
+        self.msg_panel_sizer.Add(self.send_txt, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.send_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.send_sizer.Add(self.v_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.send_panel.SetSizer(self.send_sizer)
+
+        # Recv Side Panel
+        self.recv_panel = wx.Panel(self.h_splitter)
+        self.recv_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recv_lbl = wx.StaticText(self.recv_panel, label="Received:")
+        self.recv_txt = wx.TextCtrl(
+            self.recv_panel,
+            value="\n\n\n\t\tServer response will be displayed here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+        self.recv_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.recv_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.recv_panel.SetSizer(self.recv_sizer)
+
+        self.h_splitter.SplitVertically(self.send_panel, self.recv_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.send_btn = wx.Button(self, label="Send Message")
+        self.send_btn.Enable(False)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.connect_btn.Bind(wx.EVT_BUTTON, self.on_connect_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_message)
+
+        # Setup mixins
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_CLIENT_KEY, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+        Client().set_callback(self.recv_message)
+
+    def on_connect_toggle(self, event):
+        if self.is_connected:
+            Client().disconnect()
+            self.is_connected = False
+            self.connect_btn.SetLabel("Connect")
+            self.send_btn.Enable(False)
+            self.addr_txt.Enable(True)
+        else:
+            addr = self.addr_txt.GetValue().strip()
+            if not addr:
+                wx.MessageBox("Please enter a server address", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            Config.set(CONFIG_CLIENT_ADDRESS_KEY, addr)
+            success, message = Client().connect(addr)
+
+            if success:
+                self.is_connected = True
+                self.connect_btn.SetLabel("Disconnect")
+                self.send_btn.Enable(True)
+                self.addr_txt.Enable(False)
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_send_message(self, event):
+        message = self.send_txt.GetValue()
+        if not message:
+            wx.MessageBox("Please enter a message", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+
+        success, msg = Client().send(message)
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+    def recv_message(self, message):
+        formatted = format_json_message(message)
+        self.recv_txt.SetValue(formatted)
+
+
+class ServerPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    """UI Panel for SERVER socket - async reply (draft API)."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_bound = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Port, Bind button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.port_lbl = wx.StaticText(self, label="Port:")
+        default_port = Config.get(CONFIG_SERVER_PORT_KEY, "5555")
+        self.port_txt = wx.TextCtrl(self, value=str(default_port), size=(100, -1))
+
+        self.bind_btn = wx.Button(self, label="Bind")
+
+        self.top_sizer.Add(self.port_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.port_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.bind_btn, 0, wx.CENTER | wx.ALL, 5)
+
+        # Create horizontal splitter for Recv/Reply
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Recv Side Panel
+        self.recv_panel = wx.Panel(self.h_splitter)
+        self.recv_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recv_lbl = wx.StaticText(self.recv_panel, label="Received Request:")
+        self.recv_txt = wx.TextCtrl(
+            self.recv_panel,
+            value="\n\n\n\t\tClient requests will appear here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+        self.recv_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.recv_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.recv_panel.SetSizer(self.recv_sizer)
+
+        # Reply Side Panel
+        self.reply_panel = wx.Panel(self.h_splitter)
+        self.reply_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.reply_lbl = wx.StaticText(self.reply_panel, label="Reply Message:")
+
+        self.v_splitter = wx.SplitterWindow(self.reply_panel, style=wx.SP_LIVE_UPDATE)
+
+        self.msg_panel = wx.Panel(self.v_splitter)
+        self.msg_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.reply_txt = wx.TextCtrl(self.msg_panel, style=wx.TE_MULTILINE)
+        self.msg_panel_sizer.Add(self.reply_txt, 1, wx.EXPAND)
+        self.msg_panel.SetSizer(self.msg_panel_sizer)
+
+        self.recent_panel = wx.Panel(self.v_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.v_splitter.SplitHorizontally(self.msg_panel, self.recent_panel)
+        self.v_splitter.SetSashGravity(0.5)
+        self.v_splitter.SetMinimumPaneSize(80)
+
+        self.reply_sizer.Add(self.reply_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.reply_sizer.Add(self.v_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.reply_panel.SetSizer(self.reply_sizer)
+
+        self.h_splitter.SplitVertically(self.recv_panel, self.reply_panel)
+        self.h_splitter.SetSashGravity(0.5)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.send_btn = wx.Button(self, label="Send Reply")
+        self.send_btn.Enable(False)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.bind_btn.Bind(wx.EVT_BUTTON, self.on_bind_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_reply)
+
+        # Setup mixins
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_SERVER_KEY, self.reply_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, self.v_splitter)
+        Server().set_callback(self.recv_message)
+
+    def on_bind_toggle(self, event):
+        if self.is_bound:
+            Server().unbind()
+            self.is_bound = False
+            self.bind_btn.SetLabel("Bind")
+            self.send_btn.Enable(False)
+            self.port_txt.Enable(True)
+        else:
+            port = self.port_txt.GetValue().strip()
+            if not port.isdigit():
+                wx.MessageBox("Please enter a valid port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            Config.set(CONFIG_SERVER_PORT_KEY, port)
+            success, message = Server().bind(port)
+
+            if success:
+                self.is_bound = True
+                self.bind_btn.SetLabel("Unbind")
+                self.send_btn.Enable(True)
+                self.port_txt.Enable(False)
+            else:
+                wx.MessageBox(message, "Bind Error", wx.OK | wx.ICON_ERROR)
+
+    def on_send_reply(self, event):
+        message = self.reply_txt.GetValue()
+        if not message:
+            wx.MessageBox("Please enter a reply message", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+
+        success, msg = Server().send_reply(message)
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+    def recv_message(self, message):
+        formatted = format_json_message(message)
+        self.recv_txt.SetValue(formatted)
+        self.send_btn.Enable(True)
+
+
+class RadioPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    """UI Panel for RADIO socket - group-based broadcast (draft API)."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_bound = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Port, Bind button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.port_lbl = wx.StaticText(self, label="Port:")
+        default_port = Config.get(CONFIG_RADIO_PORT_KEY, "5556")
+        self.port_txt = wx.TextCtrl(self, value=str(default_port), size=(100, -1))
+
+        self.bind_btn = wx.Button(self, label="Bind")
+
+        self.top_sizer.Add(self.port_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.port_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.bind_btn, 0, wx.CENTER | wx.ALL, 5)
+
+        # Horizontal splitter for message/recent
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Message panel
+        self.msg_panel = wx.Panel(self.h_splitter)
+        self.msg_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Group input
+        self.group_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.group_lbl = wx.StaticText(self.msg_panel, label="Group:")
+        default_group = Config.get(CONFIG_RADIO_GROUP_KEY, "default")
+        self.group_txt = wx.TextCtrl(self.msg_panel, value=default_group, size=(100, -1))
+        self.group_sizer.Add(self.group_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.group_sizer.Add(self.group_txt, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.send_lbl = wx.StaticText(self.msg_panel, label="Message to Broadcast:")
+        self.send_txt = wx.TextCtrl(self.msg_panel, style=wx.TE_MULTILINE)
+
+        self.msg_sizer.Add(self.group_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.msg_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.msg_sizer.Add(self.send_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.msg_panel.SetSizer(self.msg_sizer)
+
+        # Recent panel
+        self.recent_panel = wx.Panel(self.h_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND | wx.ALL, 5)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.h_splitter.SplitVertically(self.msg_panel, self.recent_panel)
+        self.h_splitter.SetSashGravity(0.6)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.send_btn = wx.Button(self, label="Broadcast")
+        self.send_btn.Enable(False)
+        self.template_chk = wx.CheckBox(self, label="Template")
+        self.template_chk.SetToolTip(TEMPLATE_TOOLTIP)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.template_chk, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.bind_btn.Bind(wx.EVT_BUTTON, self.on_bind_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_message)
+
+        # Setup mixins with 0.6 ratio for horizontal splitter
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_RADIO_KEY, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, None, h_ratio=0.6)
+
+    def on_bind_toggle(self, event):
+        if self.is_bound:
+            Radio().unbind()
+            self.is_bound = False
+            self.bind_btn.SetLabel("Bind")
+            self.send_btn.Enable(False)
+            self.port_txt.Enable(True)
+        else:
+            port = self.port_txt.GetValue().strip()
+            if not port.isdigit():
+                wx.MessageBox("Please enter a valid port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            Config.set(CONFIG_RADIO_PORT_KEY, port)
+            success, message = Radio().bind(port)
+
+            if success:
+                self.is_bound = True
+                self.bind_btn.SetLabel("Unbind")
+                self.send_btn.Enable(True)
+                self.port_txt.Enable(False)
+            else:
+                wx.MessageBox(message, "Bind Error", wx.OK | wx.ICON_ERROR)
+
+    def on_send_message(self, event):
+        group = self.group_txt.GetValue().strip()
+        if not group:
+            wx.MessageBox("Please enter a group name", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+
+        message = self.send_txt.GetValue()
+        if not message:
+            wx.MessageBox("Please enter a message", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+
+        Config.set(CONFIG_RADIO_GROUP_KEY, group)
+        success, msg = Radio().send_message(group, message, template=self.template_chk.GetValue())
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(f"[{group}] {message}")
+
+
+class DishPanel(wx.Panel, RecordMixin):
+    """UI Panel for DISH socket - group-based receive (draft API)."""
+
+    # Maximum message length to display in text area
+    MAX_DISPLAY_MSG_LENGTH = 500
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_running = False
+        self.last_displayed_count = 0
+
+        # UI update timer (100ms interval)
+        self.update_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_update_timer, self.update_timer)
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Address, Groups, Start button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.addr_lbl = wx.StaticText(self, label="Radio Address:")
+        default_addr = Config.get(CONFIG_DISH_ADDRESS_KEY, "tcp://localhost:5556")
+        self.addr_txt = wx.TextCtrl(self, value=default_addr, size=(180, -1))
+
+        self.group_lbl = wx.StaticText(self, label="Groups:")
+        default_groups = Config.get(CONFIG_DISH_GROUP_KEY, "default")
+        self.group_txt = wx.TextCtrl(self, value=default_groups, size=(150, -1))
+        self.group_txt.SetToolTip("Comma-separated group names to join")
+
+        self.start_btn = wx.Button(self, label="Start")
+        self.buffer_lbl = wx.StaticText(self, label="Buffer:")
+        self.buffer_spin = wx.SpinCtrl(self, min=10, max=100000, initial=Config.get(CONFIG_DISH_BUFFER_SIZE_KEY, 50), size=(90, -1))
+        self.buffer_spin.SetToolTip("Number of recent messages kept for display")
+
+        self.top_sizer.Add(self.addr_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.addr_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.group_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.group_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.start_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.buffer_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.buffer_spin, 0, wx.CENTER | wx.ALL, 5)
+        self.seq_lbl = wx.StaticText(self, label="Seq:")
+        self.seq_txt = wx.TextCtrl(self, value=Config.get(CONFIG_DISH_SEQUENCE_KEY, ""), size=(90, -1))
+        self.seq_txt.SetToolTip(SEQUENCE_TOOLTIP)
+        self.top_sizer.Add(self.seq_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.seq_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.setup_record(Dish, "Dish", self.top_sizer)
+
+        # Received messages
+        self.recv_lbl = wx.StaticText(self, label="Received Messages:")
+        self.recv_txt = wx.TextCtrl(
+            self,
+            value="\n\n\n\t\tMessages from Radio will appear here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+
+        # Stats
+        self.stats_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.stats_lbl = wx.StaticText(self, label="Messages: 0 | Data: 0 B | Speed: 0 B/s")
+        self.clear_btn = wx.Button(self, label="Clear")
+        self.stats_sizer.Add(self.stats_lbl, 1, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.stats_sizer.Add(self.clear_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.stats_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.start_btn.Bind(wx.EVT_BUTTON, self.on_start_toggle)
+        self.clear_btn.Bind(wx.EVT_BUTTON, self.on_clear)
+        self.buffer_spin.Bind(wx.EVT_SPINCTRL, self.on_buffer_size_changed)
+
+    def on_buffer_size_changed(self, event):
+        size = self.buffer_spin.GetValue()
+        Config.set(CONFIG_DISH_BUFFER_SIZE_KEY, size)
+        Dish().set_buffer_size(size)
+
+    def on_start_toggle(self, event):
+        if self.is_running:
+            self.update_timer.Stop()
+            Dish().stop()
+            self.is_running = False
+            self.start_btn.SetLabel("Start")
+            self.addr_txt.Enable(True)
+            self.group_txt.Enable(True)
+            self.seq_txt.Enable(True)
+        else:
+            addr = self.addr_txt.GetValue().strip()
+            if not addr:
+                wx.MessageBox("Please enter a Radio address", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            groups_str = self.group_txt.GetValue().strip()
+            if not groups_str:
+                wx.MessageBox("Please enter at least one group name", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            groups = [g.strip() for g in groups_str.split(",") if g.strip()]
+
+            Config.set(CONFIG_DISH_ADDRESS_KEY, addr)
+            Config.set(CONFIG_DISH_GROUP_KEY, groups_str)
+            Dish().set_buffer_size(self.buffer_spin.GetValue())
+
+            seq_source = self.seq_txt.GetValue().strip()
+            success, message = Dish().set_sequence_source(seq_source)
+            if not success:
+                wx.MessageBox(message, "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            Config.set(CONFIG_DISH_SEQUENCE_KEY, seq_source)
+            batch_size = Config.get(CONFIG_RECV_BATCH_SIZE_KEY, DEFAULT_RECV_BATCH_SIZE)
+            success, message = Dish().start(groups, addr, batch_size)
+
+            if success:
+                self.is_running = True
+                self.last_displayed_count = 0
+                self.start_btn.SetLabel("Stop")
+                self.addr_txt.Enable(False)
+                self.group_txt.Enable(False)
+                self.seq_txt.Enable(False)
+                self.recv_txt.SetValue("")
+                # Start UI update timer (100ms interval)
+                self.update_timer.Start(100)
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_update_timer(self, event):
+        """Timer callback to update UI from Dish's internal state."""
+        dish = Dish()
+        stats = dish.get_stats()
+
+        # Update statistics (cumulative counts, instant speed)
+        instant_speed = stats.get("instant_speed", 0.0)
+        stats_text = (
+            f"Messages: {stats['count']} | Data: {format_bytes(stats['bytes'])} | Speed: {format_speed(instant_speed)}"
+            f" | Msgs/Wake: {stats['messages_per_wake']:.1f}"
+        )
+        if stats["sequence"]:
+            stats_text += f" | Lost / OOO / Dup: {format_sequence_stats(stats['sequence'])}"
+        self.stats_lbl.SetLabel(stats_text)
+
+        # Get new messages since last update
+        new_messages = dish.get_new_messages(self.last_displayed_count)
+        if new_messages:
+            chunks = []
+            for num, group, msg in new_messages:
+                formatted = format_json_message(msg)
+                # Truncate for display
+                if len(formatted) > self.MAX_DISPLAY_MSG_LENGTH:
+                    formatted = formatted[: self.MAX_DISPLAY_MSG_LENGTH] + "..."
+                chunks.append(f"[{group}] {formatted}")
+                self.last_displayed_count = num
+
+            # Append only the new messages; the display is trimmed from the top past its limit
+            text = "\n---\n".join(chunks)
+            if not self.recv_txt.IsEmpty():
+                text = "\n---\n" + text
+            append_capped_text(self.recv_txt, text, Config.get(CONFIG_DISPLAY_MAX_CHARS_KEY, DEFAULT_DISPLAY_MAX_CHARS))
+
+    def on_clear(self, event):
+        self.recv_txt.SetValue("")
+        self.last_displayed_count = 0
+        Dish().reset_stats()
+
+
+class ScatterPanel(wx.Panel, RecentMessagesMixin, SplitterInitMixin):
+    """UI Panel for SCATTER socket - round-robin distribution (draft API)."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_bound = False
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Port, Bind button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.port_lbl = wx.StaticText(self, label="Port:")
+        default_port = Config.get(CONFIG_SCATTER_PORT_KEY, "5557")
+        self.port_txt = wx.TextCtrl(self, value=str(default_port), size=(100, -1))
+
+        self.bind_btn = wx.Button(self, label="Bind")
+
+        self.top_sizer.Add(self.port_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.port_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.bind_btn, 0, wx.CENTER | wx.ALL, 5)
+
+        # Horizontal splitter for message/recent
+        self.h_splitter = wx.SplitterWindow(self, style=wx.SP_LIVE_UPDATE)
+
+        # Message panel
+        self.msg_panel = wx.Panel(self.h_splitter)
+        self.msg_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.send_lbl = wx.StaticText(self.msg_panel, label="Message to Distribute:")
+        self.send_txt = wx.TextCtrl(self.msg_panel, style=wx.TE_MULTILINE)
+        self.msg_sizer.Add(self.send_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.msg_sizer.Add(self.send_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.msg_panel.SetSizer(self.msg_sizer)
+
+        # Recent panel
+        self.recent_panel = wx.Panel(self.h_splitter)
+        self.recent_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.recent_lbl = wx.StaticText(self.recent_panel, label="Recent Messages:")
+        self.recent_list = wx.ListBox(self.recent_panel)
+        self.recent_sizer.Add(self.recent_lbl, 0, wx.EXPAND | wx.LEFT | wx.TOP, 5)
+        self.recent_sizer.Add(self.recent_list, 1, wx.EXPAND | wx.ALL, 5)
+        self.recent_panel.SetSizer(self.recent_sizer)
+
+        self.h_splitter.SplitVertically(self.msg_panel, self.recent_panel)
+        self.h_splitter.SetSashGravity(0.6)
+        self.h_splitter.SetMinimumPaneSize(200)
+
+        # Control Sizer
+        self.ctrl_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.send_btn = wx.Button(self, label="Scatter")
+        self.send_btn.Enable(False)
+        self.template_chk = wx.CheckBox(self, label="Template")
+        self.template_chk.SetToolTip(TEMPLATE_TOOLTIP)
+        self.ctrl_sizer.AddStretchSpacer(1)
+        self.ctrl_sizer.Add(self.template_chk, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.ctrl_sizer.Add(self.send_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.h_splitter, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.ctrl_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.bind_btn.Bind(wx.EVT_BUTTON, self.on_bind_toggle)
+        self.send_btn.Bind(wx.EVT_BUTTON, self.on_send_message)
+
+        # Setup mixins with 0.6 ratio for horizontal splitter
+        self.setup_recent_messages(CONFIG_RECENT_SENT_MSGS_SCATTER_KEY, self.send_txt, self.recent_list)
+        self.setup_splitter_init(self.h_splitter, None, h_ratio=0.6)
+
+    def on_bind_toggle(self, event):
+        if self.is_bound:
+            Scatter().unbind()
+            self.is_bound = False
+            self.bind_btn.SetLabel("Bind")
+            self.send_btn.Enable(False)
+            self.port_txt.Enable(True)
+        else:
+            port = self.port_txt.GetValue().strip()
+            if not port.isdigit():
+                wx.MessageBox("Please enter a valid port number", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            Config.set(CONFIG_SCATTER_PORT_KEY, port)
+            success, message = Scatter().bind(port)
+
+            if success:
+                self.is_bound = True
+                self.bind_btn.SetLabel("Unbind")
+                self.send_btn.Enable(True)
+                self.port_txt.Enable(False)
+            else:
+                wx.MessageBox(message, "Bind Error", wx.OK | wx.ICON_ERROR)
+
+    def on_send_message(self, event):
+        message = self.send_txt.GetValue()
+        if not message:
+            wx.MessageBox("Please enter a message", "Input Error", wx.OK | wx.ICON_WARNING)
+            return
+
+        success, msg = Scatter().send_message(message, template=self.template_chk.GetValue())
+        if not success:
+            wx.MessageBox(msg, "Send Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        self.add_to_recent(message)
+
+
+class GatherPanel(wx.Panel, RecordMixin):
+    """UI Panel for GATHER socket - fair-queued receive (draft API)."""
+
+    # Maximum message length to display in text area
+    MAX_DISPLAY_MSG_LENGTH = 500
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.is_running = False
+        self.last_displayed_count = 0
+
+        # UI update timer (100ms interval)
+        self.update_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_update_timer, self.update_timer)
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        # Top Sizer (Address, Start button)
+        self.top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.addr_lbl = wx.StaticText(self, label="Scatter Address:")
+        default_addr = Config.get(CONFIG_GATHER_ADDRESS_KEY, "tcp://localhost:5557")
+        self.addr_txt = wx.TextCtrl(self, value=default_addr, size=(200, -1))
+
+        self.start_btn = wx.Button(self, label="Start")
+        self.buffer_lbl = wx.StaticText(self, label="Buffer:")
+        self.buffer_spin = wx.SpinCtrl(self, min=10, max=100000, initial=Config.get(CONFIG_GATHER_BUFFER_SIZE_KEY, 50), size=(90, -1))
+        self.buffer_spin.SetToolTip("Number of recent messages kept for display")
+
+        self.top_sizer.Add(self.addr_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.addr_txt, 0, wx.EXPAND | wx.ALL, 5)
+        self.top_sizer.Add(self.start_btn, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.buffer_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.buffer_spin, 0, wx.CENTER | wx.ALL, 5)
+        self.seq_lbl = wx.StaticText(self, label="Seq:")
+        self.seq_txt = wx.TextCtrl(self, value=Config.get(CONFIG_GATHER_SEQUENCE_KEY, ""), size=(90, -1))
+        self.seq_txt.SetToolTip(SEQUENCE_TOOLTIP)
+        self.top_sizer.Add(self.seq_lbl, 0, wx.CENTER | wx.ALL, 5)
+        self.top_sizer.Add(self.seq_txt, 0, wx.CENTER | wx.ALL, 5)
+        self.setup_record(Gather, "Gather", self.top_sizer)
+
+        # Received messages
+        self.recv_lbl = wx.StaticText(self, label="Gathered Messages:")
+        self.recv_txt = wx.TextCtrl(
+            self,
+            value="\n\n\n\t\tMessages from Scatter will appear here",
+            style=wx.TE_MULTILINE | wx.TE_READONLY,
+        )
+
+        # Stats
+        self.stats_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.stats_lbl = wx.StaticText(self, label="Messages: 0 | Data: 0 B | Speed: 0 B/s")
+        self.clear_btn = wx.Button(self, label="Clear")
+        self.stats_sizer.Add(self.stats_lbl, 1, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        self.stats_sizer.Add(self.clear_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+
+        self.main_sizer.Add(self.top_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.recv_lbl, 0, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.recv_txt, 1, wx.EXPAND | wx.ALL, 5)
+        self.main_sizer.Add(self.stats_sizer, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.SetSizer(self.main_sizer)
+
+        self.start_btn.Bind(wx.EVT_BUTTON, self.on_start_toggle)
+        self.clear_btn.Bind(wx.EVT_BUTTON, self.on_clear)
+        self.buffer_spin.Bind(wx.EVT_SPINCTRL, self.on_buffer_size_changed)
+
+    def on_buffer_size_changed(self, event):
+        size = self.buffer_spin.GetValue()
+        Config.set(CONFIG_GATHER_BUFFER_SIZE_KEY, size)
+        Gather().set_buffer_size(size)
+
+    def on_start_toggle(self, event):
+        if self.is_running:
+            self.update_timer.Stop()
+            Gather().stop()
+            self.is_running = False
+            self.start_btn.SetLabel("Start")
+            self.addr_txt.Enable(True)
+            self.seq_txt.Enable(True)
+        else:
+            addr = self.addr_txt.GetValue().strip()
+            if not addr:
+                wx.MessageBox("Please enter a Scatter address", "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+
+            Config.set(CONFIG_GATHER_ADDRESS_KEY, addr)
+            Gather().set_buffer_size(self.buffer_spin.GetValue())
+            seq_source = self.seq_txt.GetValue().strip()
+            success, message = Gather().set_sequence_source(seq_source)
+            if not success:
+                wx.MessageBox(message, "Input Error", wx.OK | wx.ICON_WARNING)
+                return
+            Config.set(CONFIG_GATHER_SEQUENCE_KEY, seq_source)
+            batch_size = Config.get(CONFIG_RECV_BATCH_SIZE_KEY, DEFAULT_RECV_BATCH_SIZE)
+            success, message = Gather().start(addr, batch_size)
+
+            if success:
+                self.is_running = True
+                self.last_displayed_count = 0
+                self.start_btn.SetLabel("Stop")
+                self.addr_txt.Enable(False)
+                self.seq_txt.Enable(False)
+                self.recv_txt.SetValue("")
+                # Start UI update timer (100ms interval)
+                self.update_timer.Start(100)
+            else:
+                wx.MessageBox(message, "Connection Error", wx.OK | wx.ICON_ERROR)
+
+    def on_update_timer(self, event):
+        """Timer callback to update UI from Gather's internal state."""
+        gather = Gather()
+        stats = gather.get_stats()
+
+        # Update statistics (cumulative counts, instant speed)
+        instant_speed = stats.get("instant_speed", 0.0)
+        stats_text = (
+            f"Messages: {stats['count']} | Data: {format_bytes(stats['bytes'])} | Speed: {format_speed(instant_speed)}"
+            f" | Msgs/Wake: {stats['messages_per_wake']:.1f}"
+        )
+        if stats["sequence"]:
+            stats_text += f" | Lost / OOO / Dup: {format_sequence_stats(stats['sequence'])}"
+        self.stats_lbl.SetLabel(stats_text)
+
+        # Get new messages since last update
+        new_messages = gather.get_new_messages(self.last_displayed_count)
+        if new_messages:
+            chunks = []
+            for num, msg in new_messages:
+                formatted = format_json_message(msg)
+                # Truncate for display
+                if len(formatted) > self.MAX_DISPLAY_MSG_LENGTH:
+                    formatted = formatted[: self.MAX_DISPLAY_MSG_LENGTH] + "..."
+                chunks.append(formatted)
+                self.last_displayed_count = num
+
+            # Append only the new messages; the display is trimmed from the top past its limit
+            text = "\n---\n".join(chunks)
+            if not self.recv_txt.IsEmpty():
+                text = "\n---\n" + text
+            append_capped_text(self.recv_txt, text, Config.get(CONFIG_DISPLAY_MAX_CHARS_KEY, DEFAULT_DISPLAY_MAX_CHARS))
+
+    def on_clear(self, event):
+        self.recv_txt.SetValue("")
+        self.last_displayed_count = 0
+        Gather().reset_stats()
+
+
+class StartupProfiler:
+    """Records how long each startup step takes and prints the breakdown when enabled."""
+
+    def __init__(self, enabled=False, started_at=None):
+        self.enabled = enabled
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.last_time = self.started_at
+        self.steps = []  # (label, seconds)
+
+    def mark(self, label):
+        now = time.perf_counter()
+        self.steps.append((label, now - self.last_time))
+        self.last_time = now
+
+    def report(self):
+        if not self.enabled:
+            return
+        print("Startup timing:")
+        for label, seconds in self.steps:
+            print(f"  {label:<32} {seconds * 1000:8.1f} ms")
+        print(f"  {'Total':<32} {(self.last_time - self.started_at) * 1000:8.1f} ms")
+
+
+class MainFrame(wx.Frame):
+    # (tab label, attribute name, panel class) in notebook order
+    TABS = [
+        ("Publish", "publisher_panel", PublisherPanel),
+        ("Subscribe", "subscriber_panel", SubscriberPanel),
+        ("XPub", "xpub_panel", XPublisherPanel),
+        ("XSub", "xsub_panel", XSubscriberPanel),
+        ("Request", "requester_panel", RequesterPanel),
+        ("Reply", "replyer_panel", ReplyerPanel),
+        ("Dealer", "dealer_panel", DealerPanel),
+        ("Router", "router_panel", RouterPanel),
+        ("Client", "client_panel", ClientPanel),
+        ("Server", "server_panel", ServerPanel),
+        ("Push", "pusher_panel", PusherPanel),
+        ("Pull", "puller_panel", PullerPanel),
+        ("Radio", "radio_panel", RadioPanel),
+        ("Dish", "dish_panel", DishPanel),
+        ("Scatter", "scatter_panel", ScatterPanel),
+        ("Gather", "gather_panel", GatherPanel),
+        ("Pair", "pair_panel", PairPanel),
+        ("Stream", "stream_panel", StreamPanel),
+    ]
+
+    def __init__(self, profiler=None):
+        super().__init__(None, title="ZmqAnalyzer", size=(1200, 800))
+        self.profiler = profiler or StartupProfiler()
+
+        self.notebook = wx.Notebook(self)
+
+        # Every tab starts as an empty placeholder page; its real panel is built inside the
+        # placeholder the first time the tab is selected
+        self.tab_pages = []
+        for label, attr, _ in self.TABS:
+            page = wx.Panel(self.notebook)
+            page.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            self.notebook.AddPage(page, label)
+            self.tab_pages.append(page)
+            setattr(self, attr, None)
+        self.profiler.mark("Main frame and placeholders")
+
+        self.build_tab(0)
+        self.profiler.mark(f"First tab ({self.TABS[0][0]})")
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+
+        # Menu
+        menubar = wx.MenuBar()
+        file_menu = wx.Menu()
+        open_capture_item = file_menu.Append(wx.ID_OPEN, "Open Capture...", "Browse a recorded capture file")
+        open_store_item = file_menu.Append(wx.ID_ANY, "Open Message Store...", "Search a SQLite message store")
+        file_menu.AppendSeparator()
+        exit_item = file_menu.Append(wx.ID_EXIT, "Exit", "Exit application")
+        menubar.Append(file_menu, "&File")
+
+        help_menu = wx.Menu()
+        about_item = help_menu.Append(wx.ID_ABOUT, "About", "About ZmqAnalyzer")
+        menubar.Append(help_menu, "&Help")
+
+        self.SetMenuBar(menubar)
+
+        self.Bind(wx.EVT_MENU, self.on_open_capture, open_capture_item)
+        self.Bind(wx.EVT_MENU, self.on_open_store, open_store_item)
+        self.Bind(wx.EVT_MENU, self.on_exit, exit_item)
+        self.Bind(wx.EVT_MENU, self.on_about, about_item)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    def build_tab(self, index):
+        """Construct the panel for tab index if it hasn't been built yet."""
+        if index < 0 or index >= len(self.TABS):
+            return
+        label, attr, panel_class = self.TABS[index]
+        if getattr(self, attr) is not None:
+            return
+        page = self.tab_pages[index]
+        start_time = time.perf_counter()
+        panel = panel_class(page)
+        page.GetSizer().Add(panel, 1, wx.EXPAND)
+        page.Layout()
+        setattr(self, attr, panel)
+        if self.profiler.enabled:
+            print(f"Built {label} tab in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    def on_page_changed(self, event):
+        self.build_tab(event.GetSelection())
+        event.Skip()
+
+    def on_open_capture(self, event):
+        with wx.FileDialog(
+            self,
+            "Open capture file",
+            defaultDir=Config.get(CONFIG_CAPTURE_DIR_KEY, os.path.expanduser("~")),
+            wildcard="ZmqAnalyzer captures (*.zcap)|*.zcap|All files (*.*)|*.*",
+            style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST,
+        ) as dialog:
+            if dialog.ShowModal() != wx.ID_OK:
+                return
+            path = dialog.GetPath()
+        try:
+            reader = CaptureReader(path)
+        except (OSError, ValueError) as e:
+            wx.MessageBox(f"Cannot open capture file: {e}", "Open Capture Error", wx.OK | wx.ICON_ERROR)
+            return
+        print(f"Opened capture {path} ({len(reader)} messages)")
+        CaptureViewerFrame(self, reader)
+
+    def on_open_store(self, event):
+        with wx.FileDialog(
+            self,
+            "Open message store",
+            defaultDir=Config.get(CONFIG_CAPTURE_DIR_KEY, os.path.expanduser("~")),
+            wildcard="SQLite databases (*.sqlite;*.db)|*.sqlite;*.db|All files (*.*)|*.*",
+            style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST,
+        ) as dialog:
+            if dialog.ShowModal() != wx.ID_OK:
+                return
+            path = dialog.GetPath()
+        try:
+            query = MessageQuery(path)
+        except sqlite3.Error as e:
+            wx.MessageBox(f"Cannot open message store: {e}", "Open Message Store Error", wx.OK | wx.ICON_ERROR)
+            return
+        print(f"Opened message store {path} ({len(query)} messages)")
+        MessageStoreFrame(self, path, query)
+
+    def on_about(self, event):
+        import wx.adv  # Only needed for this dialog; keeps it off the startup path
+
+        info = wx.adv.AboutDialogInfo()
+        info.SetName("ZmqAnalyzer")
+        info.SetVersion("1.0.0")
+        info.SetDescription(
+            "A desktop GUI application for testing and debugging ZeroMQ messaging.\n"
+            "Like Postman, but for ZMQ.\n\n"
+            "Supports PUB/SUB, REQ/REP, PUSH/PULL, DEALER/ROUTER,\n"
+            "CLIENT/SERVER, RADIO/DISH, SCATTER/GATHER, PAIR,\n"
+            "XPUB/XSUB, and STREAM patterns."
+        )
+        info.SetCopyright("(C) 2025 Renda Yigit")
+        info.SetWebSite("https://github.com/rendayigit/ZmqAnalyzer")
+        info.AddDeveloper("Renda Yigit")
+        info.AddDeveloper("GitHub Copilot")
+
+        # Try to load application icon from multiple locations
+        icon_paths = [
+            os.path.join(os.path.dirname(__file__), "zmqanalyzer.png"),  # Development
+            os.path.expanduser("~/.local/share/icons/zmqanalyzer.png"),  # Installed location
+        ]
+        for icon_path in icon_paths:
+            if os.path.exists(icon_path):
+                try:
+                    img = wx.Image(icon_path, wx.BITMAP_TYPE_PNG)
+                    img = img.Scale(64, 64, wx.IMAGE_QUALITY_HIGH)
+                    icon = wx.Icon(img.ConvertToBitmap())
+                    info.SetIcon(icon)
+                    break
+                except Exception:
+                    pass  # Try next location
+
+        wx.adv.AboutBox(info)
+
+    def on_exit(self, event):
+        self.Close()
+
+    def on_close(self, event):
+        # Clean shutdown of all sockets (safe for engines whose tab was never opened)
+        print("Shutting down ZmqAnalyzer...")
+        # Flush any recordings in progress (only tabs that were opened can be recording)
+        for _, attr, _ in self.TABS:
+            panel = getattr(self, attr)
+            if isinstance(panel, RecordMixin):
+                panel.stop_recording()
+                panel.stop_storing()
+        LoadGenerator().stop()
+        ReplayEngine().stop()
+        Requester().stop()
+        RequestBenchmark().stop()
+        Subscriber().stop()
+        Publisher().unbind()
+        Replyer().unbind()
+        Pusher().unbind()
+        Puller().stop()
+        Dealer().disconnect()
+        Router().unbind()
+        PairSocket().stop()
+        XPublisher().unbind()
+        XSubscriber().stop()
+        StreamSocket().stop()
+        # Draft API sockets
+        Client().disconnect()
+        Server().unbind()
+        Radio().unbind()
+        Dish().stop()
+        Scatter().unbind()
+        Gather().stop()
+        Reactor().shutdown()
+        event.Skip()
+
+
+class ZmqAnalyzerApp(wx.App):
+    def __init__(self, profiler=None):
+        self.profiler = profiler or StartupProfiler()
+        super().__init__()
+
+    def OnInit(self):
+        self.profiler.mark("wx.App")
+        Config.load()
+        self.profiler.mark("Config.load")
+        # Engine callbacks arrive on background threads; run them on the UI thread
+        set_dispatcher(WxDispatcher())
+        frame = MainFrame(self.profiler)
+        frame.Show()
+        self.profiler.mark("Show window")
+        self.profiler.report()
+        return True
+
+
+def main(profile_startup=False, started_at=None):
+    profiler = StartupProfiler(profile_startup, started_at)
+    if started_at is not None:
+        profiler.mark("Import GUI modules")
+    app = ZmqAnalyzerApp(profiler)
+    app.MainLoop()
+
+
+if __name__ == "__main__":
+    main("--profile-startup" in sys.argv[1:])
@@ -0,0 +1,204 @@
+import collections
+import queue
+import sqlite3
+import threading
+
+from zmq_engine import LATENCY_HEADER, LATENCY_MAGIC
+
+# One row per received message. topic is the first frame of multi-frame messages (topic, group or
+# peer identity), payload the last one (skipping a trailing latency frame); frames/size describe
+# the whole message.
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY,
+        recv_ns INTEGER NOT NULL,
+        socket TEXT NOT NULL,
+        topic TEXT NOT NULL,
+        payload BLOB,
+        frames INTEGER NOT NULL,
+        size INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS messages_topic ON messages (topic)",
+    "CREATE INDEX IF NOT EXISTS messages_recv_ns ON messages (recv_ns)",
+    "CREATE INDEX IF NOT EXISTS messages_socket ON messages (socket)",
+]
+INSERT = "INSERT INTO messages (recv_ns, socket, topic, payload, frames, size) VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def message_row(source, recv_ns, frames):
+    """Row values for one received message."""
+    topic = frames[0].decode("utf-8", errors="backslashreplace") if len(frames) > 1 else ""
+    payload = frames[-1] if frames else b""
+    if len(frames) > 2 and len(payload) == LATENCY_HEADER.size and payload[:4] == LATENCY_MAGIC:
+        payload = frames[-2]
+    try:
+        payload = payload.decode("utf-8")  # Text is stored as TEXT so it can be searched and read in any SQLite tool
+    except UnicodeDecodeError:
+        payload = bytes(payload)
+    return (recv_ns, source, topic, payload, len(frames), sum(len(frame) for frame in frames))
+
+
+class SqliteSink:
+    """Engine sink that stores every received message in a SQLite database.
+
+    Like CaptureWriter, write_batch() only queues the batch. A writer thread owns the connection
+    and inserts whatever has queued up with one executemany() per transaction. The database runs
+    in WAL mode, so MessageQuery can read it while the recording is still going on.
+    """
+
+    MAX_PENDING_BATCHES = 10000  # Queued batches before new ones are dropped
+    WRITE_BATCHES = 256  # Batches inserted per transaction at most
+
+    def __init__(self, path):
+        self.path = path
+        self.messages_written = 0
+        self.dropped = 0  # Messages lost because the queue was full
+        self.queue = queue.Queue(self.MAX_PENDING_BATCHES)
+        self.closed = False
+
+        # Open and set up the database here so errors reach the caller
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        try:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; only the last transactions can be lost on power failure
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+            self.connection.commit()
+        except sqlite3.Error:
+            self.connection.close()
+            raise
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write_batch(self, source, recv_time, messages):
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait((source, int(recv_time * 1e9), messages))
+        except queue.Full:
+            self.dropped += len(messages)
+
+    def _run(self):
+        running = True
+        while running:
+            batches = [self.queue.get()]
+            while len(batches) < self.WRITE_BATCHES:
+                try:
+                    batches.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batches:
+                # close() was called; a write_batch() racing with it may have queued more behind the sentinel
+                batches = batches[: batches.index(None)]
+                running = False
+            rows = [message_row(source, recv_ns, frames) for source, recv_ns, messages in batches for frames in messages]
+            if not rows:
+                continue
+            try:
+                with self.connection:  # One transaction; executemany reuses the prepared INSERT
+                    self.connection.executemany(INSERT, rows)
+                self.messages_written += len(rows)
+            except sqlite3.Error as e:
+                print(f"Message store write error ({self.path}): {e}")
+                self.closed = True  # Stop queuing batches nobody will write
+                running = False
+        self.connection.close()
+
+    def get_stats(self):
+        return {
+            "messages": self.messages_written,
+            "dropped": self.dropped,
+            "pending": self.queue.qsize(),
+        }
+
+    def close(self):
+        """Insert everything queued so far and close the database."""
+        if self.closed and not self.thread.is_alive():
+            return
+        self.closed = True
+        # The thread may have stopped on a write error with the queue full; don't wait on it then
+        while self.thread.is_alive():
+            try:
+                self.queue.put(None, timeout=0.5)
+                break
+            except queue.Full:
+                pass
+        self.thread.join()
+
+
+class MessageQuery:
+    """Filtered view of a message database that loads rows a page at a time as they are asked for.
+
+    row(index) serves rows from a small LRU of pages. A page is fetched with "id > last id of the
+    previous page" when that page has been loaded (the usual case while scrolling), so deep pages
+    don't cost an OFFSET scan; jumps fall back to OFFSET.
+    """
+
+    PAGE_SIZE = 200
+    MAX_PAGES = 20  # Pages kept in memory
+    COLUMNS = "id, recv_ns, socket, topic, payload, frames, size"
+
+    def __init__(self, path, topic=None, socket=None, since_ns=None, until_ns=None, text=None):
+        self.connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        conditions = []
+        self.params = []
+        for condition, value in (
+            ("topic = ?", topic),
+            ("socket = ?", socket),
+            ("recv_ns >= ?", since_ns),
+            ("recv_ns <= ?", until_ns),
+            ("instr(payload, ?) > 0", text),
+        ):
+            if value is not None and value != "":
+                conditions.append(condition)
+                self.params.append(value)
+        self.where = " AND ".join(conditions) or "1"
+        self.count = self.connection.execute(f"SELECT COUNT(*) FROM messages WHERE {self.where}", self.params).fetchone()[0]
+        self.pages = collections.OrderedDict()  # Page number -> rows, least recently used first
+        self.last_ids = {}  # Page number -> id of its last row, for keyset paging
+
+    def __len__(self):
+        return self.count
+
+    def sockets(self):
+        """Socket names present in the database."""
+        return [name for (name,) in self.connection.execute("SELECT DISTINCT socket FROM messages ORDER BY socket")]
+
+    def row(self, index):
+        """(id, recv_ns, socket, topic, payload, frames, size) of the index-th matching message, or None."""
+        if index < 0 or index >= self.count:
+            return None
+        page_number, offset = divmod(index, self.PAGE_SIZE)
+        page = self.pages.get(page_number)
+        if page is None:
+            page = self._load_page(page_number)
+        else:
+            self.pages.move_to_end(page_number)
+        return page[offset] if offset < len(page) else None
+
+    def _load_page(self, page_number):
+        previous_last_id = self.last_ids.get(page_number - 1)
+        if page_number == 0 or previous_last_id is not None:
+            rows = self.connection.execute(
+                f"SELECT {self.COLUMNS} FROM messages WHERE {self.where} AND id > ? ORDER BY id LIMIT ?",
+                self.params + [previous_last_id or 0, self.PAGE_SIZE],
+            ).fetchall()
+        else:
+            rows = self.connection.execute(
+                f"SELECT {self.COLUMNS} FROM messages WHERE {self.where} ORDER BY id LIMIT ? OFFSET ?",
+                self.params + [self.PAGE_SIZE, page_number * self.PAGE_SIZE],
+            ).fetchall()
+        if rows:
+            self.last_ids[page_number] = rows[-1][0]
+        self.pages[page_number] = rows
+        if len(self.pages) > self.MAX_PAGES:
+            self.pages.popitem(last=False)
+        return rows
+
+    def find_time(self, ts_ns):
+        """Index of the first matching message received at or after ts_ns."""
+        return self.connection.execute(f"SELECT COUNT(*) FROM messages WHERE {self.where} AND recv_ns < ?", self.params + [ts_ns]).fetchone()[0]
+
+    def close(self):
+        self.connection.close()